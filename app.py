@@ -1,6 +1,7 @@
 import streamlit as st
 import os
 from modules import hackathon_discovery, ai_assistant, team_formation, idea_board
+from utils.storage import get_storage
 
 # Set page configuration
 st.set_page_config(
@@ -10,15 +11,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Initialize session state for shared data
+# Initialize session state; participants, teams and ideas live in shared storage
 if 'hackathons_data' not in st.session_state:
     st.session_state.hackathons_data = []
-if 'participants' not in st.session_state:
-    st.session_state.participants = []
-if 'teams' not in st.session_state:
-    st.session_state.teams = []
-if 'ideas' not in st.session_state:
-    st.session_state.ideas = []
 if 'gemini_api_key' not in st.session_state:
     st.session_state.gemini_api_key = ""
 
@@ -116,13 +111,14 @@ def main():
     # Platform stats in sidebar
     st.sidebar.markdown("---")
     st.sidebar.subheader("📊 Platform Stats")
+    counts = get_storage().counts()
     col1, col2 = st.sidebar.columns(2)
     with col1:
         st.metric("Hackathons", len(st.session_state.hackathons_data))
-        st.metric("Ideas", len(st.session_state.ideas))
+        st.metric("Ideas", counts['ideas'])
     with col2:
-        st.metric("Participants", len(st.session_state.participants))
-        st.metric("Teams", len(st.session_state.teams))
+        st.metric("Participants", counts['participants'])
+        st.metric("Teams", counts['teams'])
 
     # Route to appropriate module - AI Assistant first
     if page == "🤖 AI Assistant":
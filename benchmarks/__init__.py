@@ -0,0 +1,4 @@
+# HackHub Platform Benchmarks
+"""
+HackHub Platform - Performance Benchmarks
+"""
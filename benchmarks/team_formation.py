@@ -0,0 +1,181 @@
+"""Team formation benchmark
+
+Times TeamMatcher.generate_teams in each of its modes on synthetic events
+of several sizes and reports runtime, peak memory and team quality as
+JSON, so runs can be compared across commits:
+
+    python -m benchmarks.team_formation --sizes 100 1000 10000 100000 --output results.json
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+import numpy as np
+from utils.synthetic_participants import generate_participants
+from utils.team_matcher import TeamMatcher
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = [100, 1000, 10000, 100000]
+DEFAULT_TEAM_SIZE = 4
+DEFAULT_TIME_BUDGET = 1.0
+CPU_COUNT = os.cpu_count() or 1
+
+# generate_teams arguments of each mode
+MODES = {
+    'draft': {'optimize': False},
+    'anneal': {'optimize': True},
+    'restarts': {'optimize': True, 'workers': CPU_COUNT, 'restarts': max(CPU_COUNT, 2)},
+    'tracks': {'optimize': True, 'workers': CPU_COUNT, 'sharding': 'kmeans'},
+}
+
+
+def team_quality(teams, unassigned):
+    """Quality metrics of generated teams
+
+    skill_diversity: mean share of distinct skills among a team's skill mentions
+    experience_variance: variance of the teams' average experience (lower is more balanced)
+    leader_coverage: share of teams with at least one potential leader
+    """
+    return {
+        'teams': len(teams),
+        'seated': sum(team['size'] for team in teams),
+        'unassigned': len(unassigned),
+        'match_score': float(np.mean([team['match_score'] for team in teams])) if teams else 0.0,
+        'skill_diversity': float(np.mean([team['objectives']['skills'] for team in teams])) if teams else 0.0,
+        'experience_variance': float(np.var([team['avg_experience'] for team in teams])) if teams else 0.0,
+        'leader_coverage': float(np.mean([team['has_leader'] for team in teams])) if teams else 0.0,
+    }
+
+
+def run_case(participants, mode, team_size, time_budget, seed):
+    """Build a matcher and generate teams once; returns timings, quality and search stats"""
+    started = time.perf_counter()
+    matcher = TeamMatcher(participants, seed=seed)
+    setup_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    teams = matcher.generate_teams(num_teams=len(participants) // team_size, team_size=team_size,
+                                   time_budget=time_budget, **MODES[mode])
+    generate_seconds = time.perf_counter() - started
+
+    stats = getattr(matcher, 'search_stats', None) if MODES[mode]['optimize'] else None
+    return {
+        'setup_seconds': setup_seconds,
+        'generate_seconds': generate_seconds,
+        'seconds': setup_seconds + generate_seconds,
+        'quality': team_quality(teams, matcher.unassigned),
+        'search': {key: stats[key] for key in ('iterations', 'initial_score', 'best_score') if key in stats}
+        if stats else None,
+    }
+
+
+def peak_memory(participants, mode, team_size, time_budget, seed):
+    """Peak Python heap (including NumPy buffers) of one run in MB, measured in its own pass
+
+    tracemalloc slows Python code down, so timings come from a separate
+    untraced run. Worker processes are not included.
+    """
+    tracemalloc.start()
+    try:
+        run_case(participants, mode, team_size, time_budget, seed)
+        return tracemalloc.get_traced_memory()[1] / 2 ** 20
+    finally:
+        tracemalloc.stop()
+
+
+def environment():
+    """Where the benchmark ran, so results can be compared across commits and machines"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'commit': commit,
+        'timestamp': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'cpu_count': CPU_COUNT,
+    }
+
+
+def run(sizes=DEFAULT_SIZES, modes=tuple(MODES), team_size=DEFAULT_TEAM_SIZE, time_budget=DEFAULT_TIME_BUDGET,
+        seed=0, memory=True):
+    """Benchmark every mode at every event size; returns the JSON-serializable report"""
+    results = []
+    for size in sizes:
+        started = time.perf_counter()
+        participants = generate_participants(size, seed=seed)
+        logger.info(f"Generated {size} participants in {time.perf_counter() - started:.2f}s")
+        for mode in modes:
+            try:
+                result = run_case(participants, mode, team_size, time_budget, seed)
+                if memory:
+                    result['peak_memory_mb'] = peak_memory(participants, mode, team_size, time_budget, seed)
+            except Exception as e:
+                logger.error(f"Benchmark {mode} at {size} participants failed: {e}")
+                result = {'error': str(e)}
+            results.append(dict({'participants': size, 'mode': mode}, **result))
+            logger.info(f"{mode} at {size} participants: {result.get('seconds', float('nan')):.2f}s")
+
+    return {
+        'environment': environment(),
+        'settings': {'sizes': list(sizes), 'modes': list(modes), 'team_size': team_size,
+                     'time_budget': time_budget, 'seed': seed, 'mode_arguments': {m: MODES[m] for m in modes}},
+        'results': results,
+    }
+
+
+def summary(report):
+    """Human-readable table of a report"""
+    lines = [f"{'participants':>12} {'mode':>9} {'seconds':>8} {'memory MB':>10} {'score':>6} "
+             f"{'skills':>6} {'exp var':>7} {'leaders':>7}"]
+    for result in report['results']:
+        if 'error' in result:
+            lines.append(f"{result['participants']:>12} {result['mode']:>9}  error: {result['error']}")
+            continue
+        quality = result['quality']
+        memory = f"{result['peak_memory_mb']:.1f}" if 'peak_memory_mb' in result else '-'
+        lines.append(f"{result['participants']:>12} {result['mode']:>9} {result['seconds']:>8.2f} {memory:>10} "
+                     f"{quality['match_score']:>6.3f} {quality['skill_diversity']:>6.3f} "
+                     f"{quality['experience_variance']:>7.4f} {quality['leader_coverage']:>7.1%}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark team formation on synthetic participants")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="event sizes to benchmark")
+    parser.add_argument('--modes', nargs='+', choices=list(MODES), default=list(MODES),
+                        help="generate_teams modes to benchmark")
+    parser.add_argument('--team-size', type=int, default=DEFAULT_TEAM_SIZE)
+    parser.add_argument('--time-budget', type=float, default=DEFAULT_TIME_BUDGET,
+                        help="search time budget per run in seconds")
+    parser.add_argument('--seed', type=int, default=0, help="seed of the participant generator and the search")
+    parser.add_argument('--no-memory', action='store_true', help="skip the peak memory pass")
+    parser.add_argument('--output', help="write the JSON report to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    for name in ('utils', 'matplotlib'):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    report = run(args.sizes, args.modes, args.team_size, args.time_budget, args.seed, memory=not args.no_memory)
+    print(summary(report), file=sys.stderr)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+    return report
+
+
+if __name__ == '__main__':
+    main()
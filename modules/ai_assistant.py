@@ -1,6 +1,7 @@
 import streamlit as st
 import os
 from utils.gemini_client import GeminiClient
+from utils.storage import get_storage
 
 
 def render():
@@ -187,20 +188,21 @@ def render_team_insights():
     """Render team insights feature"""
     st.markdown("**🏆 Get AI insights about teams**")
 
-    if not st.session_state.teams:
+    teams = get_storage().list_teams()
+    if not teams:
         st.info("No teams available. Create teams first!")
         return
 
     selected_team = st.selectbox(
         "Select team:",
-        range(len(st.session_state.teams)),
-        format_func=lambda x: f"Team {x + 1} ({len(st.session_state.teams[x]['members'])} members)"
+        range(len(teams)),
+        format_func=lambda x: f"Team {x + 1} ({len(teams[x]['members'])} members)"
     )
 
     if st.button("🔍 Analyze", key="analyze_team_btn"):
         try:
             client = GeminiClient(st.session_state.gemini_api_key)
-            team_data = st.session_state.teams[selected_team]
+            team_data = teams[selected_team]
 
             # Ultra-brief prompt
             team_prompt = f"""Team: {len(team_data['members'])} members, {', '.join([m['role_preference'] for m in team_data['members']])}.
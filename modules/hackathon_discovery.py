@@ -1,20 +1,74 @@
 import streamlit as st
 import pandas as pd
+import plotly.express as px
 import logging
+import math
+import sqlite3
 from datetime import datetime
 from utils.scraper import HackathonScraper
 from utils.filters import HackathonFilter
 from utils.data_exporter import DataExporter
+from utils.filter_cache import FilterResultCache, query_fingerprint, dataset_version
+from utils.hackathon_index import (HackathonIndex, DatasetDelta, SOURCE_OPTIONS, FORMAT_OPTIONS,
+                                   CATEGORY_OPTIONS, DURATION_OPTIONS, SORT_ORDERS, source_label)
+from utils.filter_presets import FilterPreset
+from utils.semantic_search import SemanticSearchIndex
+from utils.analytics import HackathonAnalytics
+from utils.schedule_planner import SchedulePlanner
+from utils.record_store import CompactRecordStore
+from utils.snapshot import current_snapshot_version, open_snapshot
+from utils.storage import get_storage
+from utils.participant_registry import get_registry
+from utils.tag_vocabulary import INTEREST_OPTIONS
 
 logger = logging.getLogger(__name__)
 
+# Value of every filter query field when it filters nothing; the filter widgets start from these
+FILTER_DEFAULTS = {
+    'search_text': "",
+    'search_in': ["Title", "Description"],
+    'start_date': None,
+    'end_date': None,
+    'time_filter': "All",
+    'location_type': "All",
+    'location_name': "",
+    'continent': "All",
+    'categories': [],
+    'difficulty': "All",
+    'duration_filter': "All",
+    'team_size_min': 1,
+    'team_size_max': 10,
+    'min_prize': 0,
+    'max_prize': 100000,
+    'has_prizes': False,
+    'sources': [],
+    'organizers': "",
+    'upcoming_only': True,
+    'registration_open': False,
+    'sort_by': next(iter(SORT_ORDERS)),
+}
+
+# Query field filtering each facet dimension
+FACET_FILTERS = {
+    'formats': 'location_type',
+    'categories': 'categories',
+    'durations': 'duration_filter',
+    'sources': 'sources',
+}
+
 
 def render():
     st.header("🔍 Hackathon Discovery")
     st.markdown("Discover hackathons from around the world with powerful filtering and export capabilities.")
 
+    # Cold start: map the most recently published snapshot instead of rescraping,
+    # or fall back to the dataset kept in storage
+    if not st.session_state.hackathons_data and not load_latest_snapshot():
+        load_stored_hackathons()
+
     # Tabs for different sections
-    tab1, tab2, tab3 = st.tabs(["🔄 Refresh Data", "🎯 Filter & Search", "📊 Analytics"])
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(["🔄 Refresh Data", "🎯 Filter & Search", "🧠 Semantic Search",
+                                            "🗓️ Schedule Planner", "📊 Analytics"])
 
     with tab1:
         render_data_refresh()
@@ -23,6 +77,12 @@ def render():
         render_filters_and_search()
 
     with tab3:
+        render_semantic_search()
+
+    with tab4:
+        render_schedule_planner()
+
+    with tab5:
         render_analytics()
 
 
@@ -55,8 +115,7 @@ def render_filters_and_search():
         st.info("Loading sample hackathon data for demonstration...")
         try:
             scraper = HackathonScraper()
-            st.session_state.hackathons_data = scraper.scrape_all()
-            st.session_state.last_update = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            publish_scraped_data(scraper, scraper.scrape_all())
             st.success(f"✅ Loaded {len(st.session_state.hackathons_data)} sample hackathons!")
         except Exception as e:
             st.error(f"❌ Error loading data: {str(e)}")
@@ -64,7 +123,7 @@ def render_filters_and_search():
 
     # Quick stats
     total_hackathons = len(st.session_state.hackathons_data)
-    filtered_count = len(getattr(st.session_state, 'filtered_hackathons', st.session_state.hackathons_data))
+    filtered_count = len(get_filtered_ids())
 
     col1, col2, col3 = st.columns(3)
     with col1:
@@ -78,80 +137,96 @@ def render_filters_and_search():
 
     st.markdown("---")
 
+    # Filter widgets keep their values under stable keys, which is also how presets and
+    # resets set them; the facet counts in the option labels then don't reset a selection
+    init_filter_widgets()
+    facets = get_facet_counts()
+
     # Enhanced filter controls with expandable sections
     with st.expander("🔍 Text Search", expanded=True):
         col1, col2 = st.columns(2)
         with col1:
-            search_text = st.text_input("Search keywords", placeholder="AI, hackathon, web3...")
+            search_text = st.text_input("Search keywords", placeholder="AI, hackathon, web3...",
+                                        key=filter_key('search_text'))
         with col2:
-            search_in = st.multiselect("Search in fields",
-                                       ["Title", "Description", "Tags", "Location"],
-                                       default=["Title", "Description"])
+            search_in = st.multiselect("Search in fields", ["Title", "Description", "Tags", "Location"],
+                                       key=filter_key('search_in'))
 
     with st.expander("📅 Date & Time Filters"):
         col1, col2, col3 = st.columns(3)
         with col1:
-            start_date = st.date_input("Start date", value=None)
+            start_date = st.date_input("Start date", key=filter_key('start_date'))
         with col2:
-            end_date = st.date_input("End date", value=None)
+            end_date = st.date_input("End date", key=filter_key('end_date'))
         with col3:
             time_filter = st.selectbox("Time Range",
-                                       ["All", "This Week", "This Month", "Next 3 Months", "Next 6 Months"])
+                                       ["All", "This Week", "This Month", "Next 3 Months", "Next 6 Months"],
+                                       key=filter_key('time_filter'))
 
     with st.expander("📍 Location & Format Filters"):
         col1, col2, col3 = st.columns(3)
         with col1:
-            location_type = st.selectbox("Event Format", ["All", "Online", "Offline", "Hybrid"])
+            st.selectbox("Event Format", ["All"] + FORMAT_OPTIONS, format_func=facet_label(facets['formats']),
+                         key=filter_key('location_type'))
+            location_type = st.session_state[filter_key('location_type')]
         with col2:
-            location_name = st.text_input("City/Country", placeholder="San Francisco, USA...")
+            location_name = st.text_input("City/Country", placeholder="San Francisco, USA...",
+                                          key=filter_key('location_name'))
         with col3:
             continent = st.selectbox("Continent",
-                                     ["All", "North America", "Europe", "Asia", "Africa", "South America", "Oceania"])
+                                     ["All", "North America", "Europe", "Asia", "Africa", "South America", "Oceania"],
+                                     key=filter_key('continent'))
 
     with st.expander("🏷️ Category & Theme Filters"):
         col1, col2 = st.columns(2)
         with col1:
-            categories = st.multiselect("Categories",
-                                        ["AI/ML", "Web Development", "Mobile", "Blockchain", "IoT", "Gaming",
-                                         "FinTech", "HealthTech", "EdTech", "Sustainability", "Open Source"])
+            st.multiselect("Categories", CATEGORY_OPTIONS, format_func=facet_label(facets['categories']),
+                           key=filter_key('categories'))
+            categories = st.session_state[filter_key('categories')]
         with col2:
-            difficulty = st.selectbox("Difficulty Level", ["All", "Beginner", "Intermediate", "Advanced", "Expert"])
+            difficulty = st.selectbox("Difficulty Level", ["All", "Beginner", "Intermediate", "Advanced", "Expert"],
+                                      key=filter_key('difficulty'))
 
     with st.expander("⏱️ Duration & Team Filters"):
         col1, col2, col3 = st.columns(3)
         with col1:
-            duration_filter = st.selectbox("Duration",
-                                           ["All", "1 day", "2-3 days", "1 week", "2-4 weeks", "1+ months"])
+            st.selectbox("Duration", ["All"] + DURATION_OPTIONS, format_func=facet_label(facets['durations']),
+                         key=filter_key('duration_filter'))
+            duration_filter = st.session_state[filter_key('duration_filter')]
         with col2:
-            team_size_min = st.number_input("Min Team Size", min_value=1, max_value=20, value=1, step=1)
+            team_size_min = st.number_input("Min Team Size", min_value=1, max_value=20, step=1,
+                                            key=filter_key('team_size_min'))
         with col3:
-            team_size_max = st.number_input("Max Team Size", min_value=1, max_value=20, value=10, step=1)
+            team_size_max = st.number_input("Max Team Size", min_value=1, max_value=20, step=1,
+                                            key=filter_key('team_size_max'))
 
     with st.expander("💰 Prize & Competition Filters"):
         col1, col2, col3 = st.columns(3)
         with col1:
-            min_prize = st.number_input("Min Prize ($)", min_value=0, value=0, step=100)
+            min_prize = st.number_input("Min Prize ($)", min_value=0, step=100, key=filter_key('min_prize'))
         with col2:
-            max_prize = st.number_input("Max Prize ($)", min_value=0, value=100000, step=1000)
+            max_prize = st.number_input("Max Prize ($)", min_value=0, step=1000, key=filter_key('max_prize'))
         with col3:
-            has_prizes = st.checkbox("Only events with prizes", value=False)
+            has_prizes = st.checkbox("Only events with prizes", key=filter_key('has_prizes'))
 
     with st.expander("🌐 Source & Organization"):
         col1, col2 = st.columns(2)
         with col1:
-            sources = st.multiselect("Data Sources",
-                                     ["Devpost", "Hackathon.io", "HackerEarth", "MLH", "Others"])
+            st.multiselect("Data Sources", SOURCE_OPTIONS, format_func=facet_label(facets['sources']),
+                           key=filter_key('sources'))
+            sources = st.session_state[filter_key('sources')]
         with col2:
-            organizers = st.text_input("Organizer", placeholder="Company or organization...")
+            organizers = st.text_input("Organizer", placeholder="Company or organization...",
+                                       key=filter_key('organizers'))
 
     # Additional options
     col1, col2, col3 = st.columns(3)
     with col1:
-        upcoming_only = st.checkbox("🗓️ Upcoming events only", value=True)
+        upcoming_only = st.checkbox("🗓️ Upcoming events only", key=filter_key('upcoming_only'))
     with col2:
-        registration_open = st.checkbox("📝 Registration still open", value=False)
+        registration_open = st.checkbox("📝 Registration still open", key=filter_key('registration_open'))
     with col3:
-        sort_by = st.selectbox("Sort by", ["Date", "Prize Amount", "Title", "Location", "Registration Deadline"])
+        sort_by = st.selectbox("Sort by", list(SORT_ORDERS), key=filter_key('sort_by'))
 
     # Filter action buttons
     st.markdown("---")
@@ -170,7 +245,7 @@ def render_filters_and_search():
             reset_filters()
 
     with col3:
-        if st.button("⭐ Save Filter Preset", use_container_width=True):
+        with st.popover("⭐ Save Filter Preset", use_container_width=True):
             save_filter_preset()
 
     with col4:
@@ -184,6 +259,105 @@ def render_filters_and_search():
     display_hackathon_results()
 
 
+def render_semantic_search():
+    st.subheader("🧠 Semantic Search")
+    st.markdown("Find hackathons by meaning rather than exact keywords, or discover events similar to one you like.")
+
+    data = st.session_state.hackathons_data
+    if not data:
+        st.warning("No hackathon data loaded. Click 'Refresh Data' to fetch hackathons.")
+        return
+
+    semantic_index = get_semantic_index()
+    if semantic_index.version is None:
+        semantic_index.sync(data, version=get_data_version())
+    index = get_hackathon_index(get_data_version(), data)
+
+    query_text = st.text_input("Describe the hackathon you're looking for",
+                               placeholder="climate tech weekend for beginners...")
+    if query_text:
+        display_semantic_matches(semantic_index.search(query_text, k=10), index)
+
+    st.markdown("---")
+    st.markdown("### 🔁 More Like This")
+    candidate_ids = list(get_filtered_ids()[:200])
+    selected_id = st.selectbox("Pick a hackathon", [None] + candidate_ids,
+                               format_func=lambda i: "" if i is None else data[i].get('title', f'Hackathon {i}'))
+    if selected_id is not None:
+        display_semantic_matches(semantic_index.similar_to(index.record_keys[selected_id], k=10), index)
+
+
+@st.cache_resource
+def get_semantic_index():
+    """Embedding index shared by all sessions of this process
+
+    It only moves forward: publishing a dataset syncs it, sessions still on
+    an older version search it as is and drop matches they don't have.
+    """
+    return SemanticSearchIndex()
+
+
+def display_semantic_matches(matches, index):
+    """Show semantic matches that exist in the current dataset"""
+    data = st.session_state.hackathons_data
+    found = [(index.key_to_id[key], score) for key, score in matches if key in index.key_to_id]
+
+    if not found:
+        st.info("No similar hackathons found.")
+        return
+
+    st.caption(" | ".join(f"{data[i].get('title', 'Untitled')}: {score:.2f}" for i, score in found))
+    display_list_view([data[i] for i, _ in found])
+
+
+def render_schedule_planner():
+    st.subheader("🗓️ Schedule Planner")
+    st.markdown("Find the set of upcoming hackathons you can attend without date conflicts, "
+                "maximizing prize money and interest match.")
+
+    data = st.session_state.hackathons_data
+    if not data:
+        st.warning("No hackathon data loaded. Click 'Refresh Data' to fetch hackathons.")
+        return
+
+    participants = get_registry().all()
+    col1, col2 = st.columns(2)
+
+    with col1:
+        participant_id = st.selectbox("Plan for participant", [None] + list(range(len(participants))),
+                                      format_func=lambda i: "Custom interests" if i is None
+                                      else participants[i]['name'])
+        default_interests = [] if participant_id is None else [
+            i for i in participants[participant_id].get('interests', []) if i in INTEREST_OPTIONS]
+        interests = st.multiselect("Interests", INTEREST_OPTIONS, default=default_interests)
+        use_filters = st.checkbox("Only consider current filter results", value=True)
+
+    with col2:
+        prize_weight = st.slider("Prize Weight", 0.0, 2.0, 1.0, help="Multiplier applied to prize money")
+        interest_weight = st.slider("Interest Match Value ($)", 0, 20000, 5000, step=500,
+                                    help="How much each matching interest is worth compared to prize money")
+        min_gap_days = st.number_input("Rest days between events", min_value=0, max_value=30, value=0)
+
+    index = get_hackathon_index(get_data_version(), data)
+    planner = SchedulePlanner(index, prize_weight=prize_weight, interest_weight=interest_weight,
+                              min_gap_days=min_gap_days)
+    candidate_ids = get_filtered_ids() if use_filters else range(len(data))
+    plan = planner.plan(candidate_ids, interests)
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Events in Schedule", len(plan['ids']))
+    with col2:
+        st.metric("Total Prize Pool", f"${plan['total_prize']:,.0f}")
+    with col3:
+        st.metric("Schedule Score", f"{plan['score']:,.0f}")
+
+    if plan['ids']:
+        display_list_view([data[i] for i in plan['ids']])
+    else:
+        st.info("No upcoming hackathons with known dates to schedule.")
+
+
 def render_analytics():
     st.subheader("📊 Hackathon Analytics")
 
@@ -191,22 +365,66 @@ def render_analytics():
         st.warning("No data available for analytics.")
         return
 
-    df = pd.DataFrame(st.session_state.hackathons_data)
+    analytics = get_hackathon_analytics()
+    if analytics.version is None:
+        analytics.sync(st.session_state.hackathons_data, version=get_data_version())
+    summary = analytics.summary()
+    if summary['version'] != get_data_version():
+        st.info("Analytics cover the most recently published dataset. Refresh data to load it.")
 
     # Basic stats
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("Total Hackathons", len(df))
+        st.metric("Total Hackathons", summary['total'])
     with col2:
-        online_count = len(df[df.get('location_type', '') == 'Online']) if 'location_type' in df.columns else 0
-        st.metric("Online Events", int(online_count))
+        st.metric("Online Events", summary['online'])
     with col3:
-        # Count upcoming events (simplified)
-        sources_count = int(df['source'].nunique()) if 'source' in df.columns else 0
-        st.metric("Total Sources", sources_count)
+        st.metric("Total Sources", summary['active_sources'])
     with col4:
-        locations_count = int(df['location'].nunique()) if 'location' in df.columns else 0
-        st.metric("Unique Locations", locations_count)
+        st.metric("Unique Locations", summary['unique_locations'])
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Events per month, stacked by format
+        months = list(summary['events_per_month'])
+        if months:
+            fig_months = px.bar(
+                x=[month for month in months for _ in summary['events_per_month'][month]],
+                y=[n for counts in summary['events_per_month'].values() for n in counts.values()],
+                color=[fmt for counts in summary['events_per_month'].values() for fmt in counts],
+                title="Events per Month", labels={'x': 'Month', 'y': 'Events', 'color': 'Format'})
+            st.plotly_chart(fig_months, use_container_width=True)
+
+    with col2:
+        prizes = summary['prize_distribution']
+        fig_prizes = px.bar(x=list(prizes), y=list(prizes.values()),
+                            title="Prize Distribution", labels={'x': 'Prize', 'y': 'Events'})
+        st.plotly_chart(fig_prizes, use_container_width=True)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        top_tags = summary['top_tags']
+        if top_tags:
+            fig_tags = px.bar(x=list(top_tags.values()), y=list(top_tags), orientation='h',
+                              title="Top Tags", labels={'x': 'Events', 'y': 'Tag'})
+            st.plotly_chart(fig_tags, use_container_width=True)
+
+    with col2:
+        source_mix = summary['source_mix']
+        fig_sources = px.pie(values=list(source_mix.values()), names=list(source_mix), title="Source Mix")
+        st.plotly_chart(fig_sources, use_container_width=True)
+
+
+@st.cache_resource
+def get_hackathon_analytics():
+    """Aggregate cubes shared by all sessions of this process
+
+    Like the semantic index they only move forward: publishing a dataset
+    syncs them, and sessions on an older version are told so.
+    """
+    return HackathonAnalytics()
 
 
 def refresh_hackathon_data():
@@ -214,67 +432,196 @@ def refresh_hackathon_data():
     with st.spinner("Fetching latest hackathons..."):
         try:
             scraper = HackathonScraper()
-            st.session_state.hackathons_data = scraper.scrape_all()
-            st.session_state.last_update = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            publish_scraped_data(scraper, scraper.scrape_all())
             st.success(f"✅ Fetched {len(st.session_state.hackathons_data)} hackathons successfully!")
         except Exception as e:
             st.error(f"❌ Error fetching hackathons: {str(e)}")
             logger.error(f"Error refreshing data: {e}")
 
 
-def apply_enhanced_filters(search_text, search_in, start_date, end_date, time_filter,
-                           location_type, location_name, continent, categories, difficulty,
-                           duration_filter, team_size_min, team_size_max,
-                           min_prize, max_prize, has_prizes, sources, organizers,
-                           upcoming_only, registration_open, sort_by):
-    """Apply enhanced filters to hackathon data"""
+@st.cache_resource
+def get_filter_cache():
+    """Filter result cache shared by all sessions of this process"""
+    return FilterResultCache(max_entries=256)
+
+
+@st.cache_resource(max_entries=4)
+def get_snapshot(version):
+    """Memory-mapped dataset snapshot, shared by all sessions of this process"""
+    snapshot = open_snapshot(version)
+    if snapshot is None:
+        # Raising keeps the miss out of the cache
+        raise FileNotFoundError(f"No snapshot for dataset version {version}")
+    return snapshot
+
+
+def load_latest_snapshot():
+    """Publish the current on-disk snapshot into this session; False if there is none"""
+    version = current_snapshot_version()
+    if version is None:
+        return False
     try:
-        # Start with all data
-        filtered_data = st.session_state.hackathons_data.copy()
+        snapshot = get_snapshot(version)
+    except FileNotFoundError:
+        return False
+
+    publish_hackathon_data(snapshot.store, version=version)
+    created_at = datetime.fromisoformat(snapshot.manifest['created_at'])
+    st.session_state.last_update = created_at.strftime("%Y-%m-%d %H:%M:%S")
+    return True
+
+
+def load_stored_hackathons():
+    """Publish the hackathons kept in storage into this session; False if there are none"""
+    hackathons = get_storage().list_hackathons()
+    if not hackathons:
+        return False
+    publish_hackathon_data(hackathons, version=get_storage().hackathons_version())
+    return True
+
+
+def publish_scraped_data(scraper, hackathons):
+    """Persist scraped listings and publish them through an on-disk snapshot when possible"""
+    if hackathons:
+        version = dataset_version(hackathons)
+        try:
+            get_storage().replace_hackathons(hackathons, version)
+        except sqlite3.Error as e:
+            logger.error(f"Error storing hackathons: {e}")
+        try:
+            scraper.publish_snapshot(hackathons, version=version)
+            publish_hackathon_data(get_snapshot(version).store, version=version)
+            return
+        except (OSError, ValueError) as e:
+            logger.error(f"Error publishing snapshot: {e}")
+    publish_hackathon_data(hackathons)
+
+
+def publish_hackathon_data(hackathons, version=None):
+    """Make a freshly scraped dataset the current one and drop stale cached results"""
+    previous_version = st.session_state.get('data_version')
+    previous_data = st.session_state.hackathons_data
+
+    # Listings are read-only once published, so keep them in columnar form
+    if not isinstance(hackathons, CompactRecordStore):
+        hackathons = CompactRecordStore(hackathons)
+    report = hackathons.memory_report()
+    logger.info(f"Published {report['records']} listings: {report['dict_bytes_per_record']:.0f} -> "
+                f"{report['compact_bytes_per_record']:.0f} bytes per record")
+
+    st.session_state.hackathons_data = hackathons
+    st.session_state.data_version = version or dataset_version(hackathons)
+    st.session_state.last_update = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    get_semantic_index().sync(hackathons, version=st.session_state.data_version)
+    get_hackathon_analytics().sync(hackathons, version=st.session_state.data_version)
+
+    # Sessions still on the previous version keep reusing its cached filter results;
+    # anything older is retired
+    if previous_version and previous_version != st.session_state.data_version:
+        get_filter_cache().retain({previous_version, st.session_state.data_version})
+        refresh_filter_presets(previous_version, previous_data, hackathons)
+
+
+@st.cache_resource(max_entries=4)
+def get_hackathon_index(version, _hackathons_data):
+    """Columnar index for a dataset version, shared by all sessions"""
+    if version == current_snapshot_version():
+        try:
+            return get_snapshot(version).index
+        except FileNotFoundError:
+            pass
+    return HackathonIndex(_hackathons_data)
+
+
+def get_facet_counts():
+    """Facet counts for the active filter query (cached counts when unfiltered)
+
+    Each dimension is counted with its own filter left out, so picking one
+    option still shows how many results the other options would give.
+    """
+    data = st.session_state.hackathons_data
+    index = get_hackathon_index(get_data_version(), data)
+
+    query = st.session_state.get('filter_query')
+    if not query:
+        return index.facet_counts()
 
-        # Apply text search
-        if search_text and search_in:
-            filtered_data = filter_by_text_search(filtered_data, search_text, search_in)
+    counts = index.facet_counts(get_filtered_ids())
+    for dimension, field in FACET_FILTERS.items():
+        if query[field] != FILTER_DEFAULTS[field]:
+            relaxed = {**query, field: FILTER_DEFAULTS[field]}
+            counts[dimension] = index.facet_counts(run_filter_query(data, relaxed))[dimension]
+    return counts
 
-        # Apply date filters
-        if start_date or end_date or time_filter != "All":
-            filtered_data = filter_by_date_range(filtered_data, start_date, end_date, time_filter)
 
-        # Apply location filters
-        if location_type != "All" or location_name or continent != "All":
-            filtered_data = filter_by_location(filtered_data, location_type, location_name, continent)
+def facet_label(counts):
+    """format_func showing an option together with its live count"""
+    return lambda option: f"{option} ({counts[option]:,})" if option in counts else option
 
-        # Apply category filters
-        if categories or difficulty != "All":
-            filtered_data = filter_by_categories(filtered_data, categories, difficulty)
 
-        # Apply duration and team size filters
-        if duration_filter != "All" or team_size_min != 1 or team_size_max != 10:
-            filtered_data = filter_by_duration_team(filtered_data, duration_filter, team_size_min, team_size_max)
+def filter_key(field):
+    """Session state key of the widget for a filter query field"""
+    return f"filter_{field}"
 
-        # Apply prize filters
-        if min_prize > 0 or max_prize < 100000 or has_prizes:
-            filtered_data = filter_by_prizes(filtered_data, min_prize, max_prize, has_prizes)
 
-        # Apply source filters
-        if sources or organizers:
-            filtered_data = filter_by_source_org(filtered_data, sources, organizers)
+def init_filter_widgets():
+    """Give the filter widgets their defaults, or the values a preset load or reset queued"""
+    pending = st.session_state.pop('pending_filter_values', None)
+    for field, default in FILTER_DEFAULTS.items():
+        value = pending.get(field, default) if pending is not None else default
+        if pending is not None or filter_key(field) not in st.session_state:
+            st.session_state[filter_key(field)] = list(value) if isinstance(value, list) else value
 
-        # Apply additional filters
-        if upcoming_only:
-            filtered_data = filter_upcoming_events(filtered_data)
 
-        if registration_open:
-            filtered_data = filter_registration_open(filtered_data)
+def set_filter_widgets(values):
+    """Show values in the filter widgets from the next run on"""
+    st.session_state.pending_filter_values = values
 
-        # Sort results
-        if sort_by != "Date":
-            filtered_data = sort_results(filtered_data, sort_by)
 
-        st.session_state.filtered_hackathons = filtered_data
+def get_data_version():
+    """Version of the hackathon dataset currently loaded in this session"""
+    if 'data_version' not in st.session_state:
+        st.session_state.data_version = dataset_version(st.session_state.hackathons_data)
+    return st.session_state.data_version
+
+
+def apply_enhanced_filters(search_text, search_in, start_date, end_date, time_filter,
+                           location_type, location_name, continent, categories, difficulty,
+                           duration_filter, team_size_min, team_size_max,
+                           min_prize, max_prize, has_prizes, sources, organizers,
+                           upcoming_only, registration_open, sort_by):
+    """Apply enhanced filters to hackathon data"""
+    try:
+        query = {
+            'search_text': search_text,
+            'search_in': search_in,
+            'start_date': start_date,
+            'end_date': end_date,
+            'time_filter': time_filter,
+            'location_type': location_type,
+            'location_name': location_name,
+            'continent': continent,
+            'categories': categories,
+            'difficulty': difficulty,
+            'duration_filter': duration_filter,
+            'team_size_min': team_size_min,
+            'team_size_max': team_size_max,
+            'min_prize': min_prize,
+            'max_prize': max_prize,
+            'has_prizes': has_prizes,
+            'sources': sources,
+            'organizers': organizers,
+            'upcoming_only': upcoming_only,
+            'registration_open': registration_open,
+            'sort_by': sort_by
+        }
+
+        st.session_state.filter_query = query
+        st.session_state.results_page = 0
 
         # Show success message with count
-        count = len(filtered_data)
+        count = len(get_filtered_ids())
         total = len(st.session_state.hackathons_data)
         st.success(f"✅ Found {count} hackathons out of {total} total events")
 
@@ -303,6 +650,101 @@ def apply_enhanced_filters(search_text, search_in, start_date, end_date, time_fi
         logger.error(f"Error filtering hackathons: {e}")
 
 
+def get_filtered_ids():
+    """Result ids for the active filter query (every id when unfiltered)"""
+    data = st.session_state.hackathons_data
+    query = st.session_state.get('filter_query')
+    if not query:
+        return range(len(data))
+
+    return run_filter_query(data, query)
+
+
+def get_filtered_hackathons():
+    """Resolve the active filter query, serving repeated queries from the shared cache"""
+    data = st.session_state.hackathons_data
+    return [data[i] for i in get_filtered_ids()]
+
+
+def run_filter_query(data, query):
+    """Get result ids (positions in data) for a filter query"""
+    cache = get_filter_cache()
+    version = get_data_version()
+    fingerprint = filter_fingerprint(query)
+
+    ids = cache.get(version, fingerprint)
+    if ids is None:
+        ids = compute_filter_ids(data, query)
+        ids = sort_result_ids(data, ids, query['sort_by'])
+        cache.put(version, fingerprint, ids)
+    return ids
+
+
+def filter_fingerprint(query):
+    """Cache key for a query on the current day"""
+    # Relative filters ("upcoming", "this week") change meaning from one day to the next
+    return query_fingerprint({**query, 'as_of': datetime.now().date()})
+
+
+def compute_filter_ids(data, query, candidate_ids=None):
+    """Run the filter pipeline and return result ids in dataset order
+
+    Every filter is a per-record predicate, so passing candidate_ids
+    evaluates the query on just those records.
+    """
+    candidates = range(len(data)) if candidate_ids is None else candidate_ids
+
+    # Category and duration classes were assigned when the index was built
+    if query['categories'] or query['duration_filter'] != "All":
+        index = get_hackathon_index(get_data_version(), data)
+        candidates = index.filter_classes(candidates, query['categories'], query['duration_filter']).tolist()
+
+    candidate_records = [data[i] for i in candidates]
+    filtered_data = candidate_records
+
+    # Apply text search
+    if query['search_text'] and query['search_in']:
+        filtered_data = filter_by_text_search(filtered_data, query['search_text'], query['search_in'])
+
+    # Apply date filters
+    if query['start_date'] or query['end_date'] or query['time_filter'] != "All":
+        filtered_data = filter_by_date_range(filtered_data, query['start_date'], query['end_date'],
+                                             query['time_filter'])
+
+    # Apply location filters
+    if query['location_type'] != "All" or query['location_name'] or query['continent'] != "All":
+        filtered_data = filter_by_location(filtered_data, query['location_type'], query['location_name'],
+                                           query['continent'])
+
+    # Apply difficulty filter
+    if query['difficulty'] != "All":
+        filtered_data = filter_by_difficulty(filtered_data, query['difficulty'])
+
+    # Apply team size filters
+    if query['team_size_min'] != 1 or query['team_size_max'] != 10:
+        filtered_data = filter_by_team_size(filtered_data, query['team_size_min'], query['team_size_max'])
+
+    # Apply prize filters
+    if query['min_prize'] > 0 or query['max_prize'] < 100000 or query['has_prizes']:
+        filtered_data = filter_by_prizes(filtered_data, query['min_prize'], query['max_prize'],
+                                         query['has_prizes'])
+
+    # Apply source filters
+    if query['sources'] or query['organizers']:
+        filtered_data = filter_by_source_org(filtered_data, query['sources'], query['organizers'])
+
+    # Apply additional filters
+    if query['upcoming_only']:
+        filtered_data = filter_upcoming_events(filtered_data)
+
+    if query['registration_open']:
+        filtered_data = filter_registration_open(filtered_data)
+
+    # Filters return the original record objects, so identity maps them back to ids
+    positions = {id(record): i for record, i in zip(candidate_records, candidates)}
+    return [positions[id(item)] for item in filtered_data]
+
+
 def filter_by_text_search(data, search_text, search_fields):
     """Filter data by text search in specified fields"""
     if not search_text:
@@ -377,23 +819,9 @@ def filter_by_location(data, location_type, location_name, continent):
     return filtered
 
 
-def filter_by_categories(data, categories, difficulty):
-    """Filter data by categories and difficulty"""
-    filtered = data.copy()
-
-    if categories:
-        category_filtered = []
-        for item in filtered:
-            item_categories = item.get('categories', []) or item.get('tags', [])
-            if any(cat in str(item_categories).lower() for cat in [c.lower() for c in categories]):
-                category_filtered.append(item)
-        filtered = category_filtered
-
-    if difficulty != "All":
-        # Filter by difficulty if available in data
-        filtered = [item for item in filtered if item.get('difficulty', '').lower() == difficulty.lower()]
-
-    return filtered
+def filter_by_difficulty(data, difficulty):
+    """Filter data by difficulty level, where listings give one"""
+    return [item for item in data if item.get('difficulty', '').lower() == difficulty.lower()]
 
 
 def filter_by_prizes(data, min_prize, max_prize, has_prizes):
@@ -412,35 +840,10 @@ def filter_by_prizes(data, min_prize, max_prize, has_prizes):
     return filtered
 
 
-def filter_by_duration_team(data, duration_filter, team_size_min, team_size_max):
-    """Filter data by duration and team size criteria"""
-    filtered = data.copy()
-
-    # Duration filter
-    if duration_filter != "All":
-        duration_filtered = []
-        for item in filtered:
-            item_duration = item.get('duration', '').lower()
-
-            if duration_filter == "1 day" and any(word in item_duration for word in ['1 day', '24 hour', 'one day']):
-                duration_filtered.append(item)
-            elif duration_filter == "2-3 days" and any(
-                    word in item_duration for word in ['2 day', '3 day', '48 hour', '72 hour', 'weekend']):
-                duration_filtered.append(item)
-            elif duration_filter == "1 week" and any(word in item_duration for word in ['1 week', '7 day', 'week']):
-                duration_filtered.append(item)
-            elif duration_filter == "2-4 weeks" and any(
-                    word in item_duration for word in ['2 week', '3 week', '4 week', 'month']):
-                duration_filtered.append(item)
-            elif duration_filter == "1+ months" and any(
-                    word in item_duration for word in ['month', 'semester', 'long term']):
-                duration_filtered.append(item)
-
-        filtered = duration_filtered
-
-    # Team size filter
+def filter_by_team_size(data, team_size_min, team_size_max):
+    """Filter data to events whose allowed team sizes overlap the given range"""
     team_filtered = []
-    for item in filtered:
+    for item in data:
         team_size = item.get('team_size', {})
 
         if isinstance(team_size, dict):
@@ -472,7 +875,8 @@ def filter_by_source_org(data, sources, organizers):
     if sources:
         source_filtered = []
         for item in filtered:
-            if item.get('source', '') in sources:
+            # Options are display names ("Devpost") while scraped sources are lowercase ("devpost")
+            if source_label(item.get('source', '')) in sources:
                 source_filtered.append(item)
         filtered = source_filtered
 
@@ -497,18 +901,10 @@ def filter_registration_open(data):
     return [item for item in data if parse_event_date(item.get('registration_deadline')) >= today]
 
 
-def sort_results(data, sort_by):
-    """Sort results by specified criteria"""
-    if sort_by == "Prize Amount":
-        return sorted(data, key=lambda x: x.get('prize_amount', 0), reverse=True)
-    elif sort_by == "Title":
-        return sorted(data, key=lambda x: x.get('title', '').lower())
-    elif sort_by == "Location":
-        return sorted(data, key=lambda x: x.get('location', '').lower())
-    elif sort_by == "Registration Deadline":
-        return sorted(data, key=lambda x: parse_event_date(x.get('registration_deadline')))
-    else:  # Date
-        return sorted(data, key=lambda x: parse_event_date(x.get('date')))
+def sort_result_ids(data, ids, sort_by):
+    """Sort result ids using the index's precomputed sort keys"""
+    index = get_hackathon_index(get_data_version(), data)
+    return index.sort_ids(ids, SORT_ORDERS.get(sort_by, SORT_ORDERS["Date"])).tolist()
 
 
 def parse_event_date(date_str):
@@ -556,8 +952,10 @@ def show_filter_summary(filtered_count, total_count):
 
 def reset_filters():
     """Reset all filters to show all data"""
-    if 'filtered_hackathons' in st.session_state:
-        del st.session_state.filtered_hackathons
+    if 'filter_query' in st.session_state:
+        del st.session_state.filter_query
+    set_filter_widgets(FILTER_DEFAULTS)
+    st.session_state.results_page = 0
     st.success("✅ All filters have been reset")
     st.rerun()
 
@@ -565,39 +963,102 @@ def reset_filters():
 def save_filter_preset():
     """Save current filter settings as a preset"""
     preset_name = st.text_input("Preset name", placeholder="My AI Hackathons")
-    if preset_name and st.button("Save"):
-        from datetime import datetime
-        if 'filter_presets' not in st.session_state:
-            st.session_state.filter_presets = {}
+    if st.button("Save", disabled=not preset_name):
+        query = st.session_state.get('filter_query')
+        if not query:
+            st.warning("Apply some filters before saving them as a preset.")
+            return
 
-        # Here you would save current filter state
-        st.session_state.filter_presets[preset_name] = {
-            "saved_at": datetime.now().isoformat(),
-            "count": len(getattr(st.session_state, 'filtered_hackathons', []))
-        }
+        try:
+            get_storage().save_filter_preset(preset_name, query)
+        except sqlite3.Error as e:
+            logger.error(f"Error storing filter preset: {e}")
+            st.error(f"❌ Could not save filter preset: {e}")
+            return
+
+        get_filter_presets()[preset_name] = materialize_filter_preset(preset_name, query)
         st.success(f"✅ Saved filter preset: {preset_name}")
 
 
 def get_filter_presets():
-    """Get saved filter presets"""
-    return getattr(st.session_state, 'filter_presets', {})
+    """Saved filter presets, kept materialized in this session and stored for everyone"""
+    presets = st.session_state.setdefault('filter_presets', {})
+    try:
+        stored = get_storage().list_filter_presets()
+    except sqlite3.Error as e:
+        logger.error(f"Error loading filter presets: {e}")
+        return presets
+
+    for row in stored:
+        preset = FilterPreset.stored(row['name'], row['query'], row['saved_at'])
+        if row['name'] not in presets or presets[row['name']].query != preset.query:
+            presets[row['name']] = preset
+    return presets
+
+
+def materialize_filter_preset(preset_name, query):
+    """Evaluate a query against the whole dataset and keep its results"""
+    data = st.session_state.hackathons_data
+    index = get_hackathon_index(get_data_version(), data)
+    result_ids = run_filter_query(data, query)
+
+    return FilterPreset(preset_name, query,
+                        result_keys=[index.record_keys[i] for i in result_ids],
+                        result_ids=result_ids,
+                        version=get_data_version(),
+                        as_of=datetime.now().date())
+
+
+def refresh_filter_presets(previous_version, previous_data, hackathons):
+    """Maintain materialized presets by evaluating only added and changed records"""
+    presets = get_filter_presets()
+    if not presets:
+        return
+
+    delta = DatasetDelta(previous_data, hackathons)
+    version = get_data_version()
+    today = datetime.now().date()
+    candidate_ids = delta.added_ids + delta.changed_ids
+
+    for name, preset in presets.items():
+        if preset.version is None:
+            # Loaded from storage and never used here; materialized when loaded
+            continue
+        if not preset.is_current(previous_version, today):
+            presets[name] = materialize_filter_preset(name, preset.query)
+            continue
+
+        matched_ids = compute_filter_ids(hackathons, preset.query, candidate_ids)
+        preset.apply_delta(delta, matched_ids,
+                           order_ids=lambda ids: sort_result_ids(hackathons, ids, preset.query['sort_by']),
+                           version=version)
 
 
 def load_filter_preset(preset_name):
-    """Load a saved filter preset"""
+    """Load a saved filter preset into the filter widgets and the active query"""
     presets = get_filter_presets()
-    if preset_name in presets:
-        st.success(f"✅ Loaded filter preset: {preset_name}")
-        # Here you would restore the filter state
-    else:
+    if preset_name not in presets:
         st.error(f"❌ Preset not found: {preset_name}")
+        return
+
+    preset = presets[preset_name]
+    version = get_data_version()
+    if not preset.is_current(version, datetime.now().date()):
+        preset = presets[preset_name] = materialize_filter_preset(preset_name, preset.query)
+
+    # Serve the materialized results directly instead of re-filtering
+    get_filter_cache().put(version, filter_fingerprint(preset.query), preset.result_ids)
+    st.session_state.filter_query = preset.query
+    st.session_state.results_page = 0
+    set_filter_widgets(preset.query)
+    st.rerun()
 
 
 def display_hackathon_results():
     """Display hackathon results with enhanced formatting"""
-    data_to_show = getattr(st.session_state, 'filtered_hackathons', st.session_state.hackathons_data)
+    result_ids = get_filtered_ids()
 
-    if not data_to_show:
+    if not result_ids:
         # Show sample data for demo purposes
         show_demo_data()
         return
@@ -612,21 +1073,80 @@ def display_hackathon_results():
         export_format = st.selectbox("Export format", ["CSV", "JSON", "Excel"])
     with col4:
         if st.button("📥 Export Data", use_container_width=True):
-            export_hackathon_data(data_to_show, export_format.lower())
+            export_hackathon_data(get_filtered_hackathons(), export_format.lower())
 
     st.markdown("---")
 
+    page = render_pagination(len(result_ids), items_per_page)
+    page_data = load_result_page(result_ids, page, items_per_page)
+    offset = page * items_per_page
+
     # Display results based on view mode
     if view_mode == "Cards":
-        display_card_view(data_to_show[:items_per_page])
+        display_card_view(page_data)
     elif view_mode == "List":
-        display_list_view(data_to_show[:items_per_page])
+        display_list_view(page_data, start=offset + 1)
     else:  # Table
-        display_table_view(data_to_show, items_per_page)
+        display_table_view(page_data, items_per_page)
 
     # Pagination info
-    if len(data_to_show) > items_per_page:
-        st.info(f"Showing first {min(items_per_page, len(data_to_show))} of {len(data_to_show)} results")
+    if len(result_ids) > items_per_page:
+        st.info(f"Showing {offset + 1}-{offset + len(page_data)} of {len(result_ids)} results")
+
+
+def render_pagination(total_results, items_per_page):
+    """Render previous/next controls and return the current (0-based) page"""
+    total_pages = max(1, math.ceil(total_results / items_per_page))
+    page = min(st.session_state.get('results_page', 0), total_pages - 1)
+
+    if total_pages > 1:
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col1:
+            st.button("⬅️ Previous", disabled=page == 0, use_container_width=True,
+                      on_click=change_results_page, args=(-1, total_pages))
+        with col3:
+            st.button("Next ➡️", disabled=page >= total_pages - 1, use_container_width=True,
+                      on_click=change_results_page, args=(1, total_pages))
+        with col2:
+            st.markdown(f"<p style='text-align: center;'>Page {page + 1} of {total_pages}</p>",
+                        unsafe_allow_html=True)
+
+    st.session_state.results_page = page
+    return page
+
+
+def change_results_page(step, total_pages):
+    """Button callback: move the results page before the rerun draws the controls"""
+    page = st.session_state.get('results_page', 0) + step
+    st.session_state.results_page = min(max(page, 0), total_pages - 1)
+
+
+def load_result_page(result_ids, page, items_per_page):
+    """Materialize only one page of results, prefetching the next one"""
+    data = st.session_state.hackathons_data
+    query = st.session_state.get('filter_query') or {}
+    cache_key = (get_data_version(), query_fingerprint(query), items_per_page)
+
+    cached_pages = st.session_state.get('result_pages', {})
+    if cached_pages.get('key') != cache_key:
+        cached_pages = {'key': cache_key, 'pages': {}}
+
+    def materialize(page_number):
+        if page_number not in cached_pages['pages']:
+            start = page_number * items_per_page
+            page_ids = result_ids[start:start + items_per_page]
+            cached_pages['pages'][page_number] = [data[i] for i in page_ids]
+        return cached_pages['pages'][page_number]
+
+    page_data = materialize(page)
+    if (page + 1) * items_per_page < len(result_ids):
+        materialize(page + 1)
+
+    # Keep only the pages adjacent to the current one
+    cached_pages['pages'] = {n: rows for n, rows in cached_pages['pages'].items()
+                             if page - 1 <= n <= page + 1}
+    st.session_state.result_pages = cached_pages
+    return page_data
 
 
 def show_demo_data():
@@ -689,9 +1209,9 @@ def display_card_view(data):
                 """, unsafe_allow_html=True)
 
 
-def display_list_view(data):
+def display_list_view(data, start=1):
     """Display hackathons in list format"""
-    for i, hackathon in enumerate(data, 1):
+    for i, hackathon in enumerate(data, start):
         with st.expander(f"{i}. {hackathon.get('title', f'Hackathon {i}')} - {hackathon.get('location', 'TBD')}"):
             col1, col2 = st.columns(2)
 
@@ -769,7 +1289,7 @@ def export_hackathon_data(data, format_type):
             )
         elif format_type == "json":
             import json
-            json_data = json.dumps(data, indent=2)
+            json_data = json.dumps([dict(h) for h in data], indent=2)
             st.download_button(
                 label="📥 Download JSON",
                 data=json_data,
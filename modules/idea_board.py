@@ -2,6 +2,8 @@ import streamlit as st
 import pandas as pd
 from datetime import datetime
 import plotly.express as px
+from utils.storage import get_storage
+from utils.idea_matcher import IdeaMatcher, TOP_IDEAS
 
 
 def render():
@@ -9,7 +11,7 @@ def render():
     st.markdown("Share, discover, and collaborate on innovative hackathon project ideas!")
 
     # Tabs for different sections
-    tab1, tab2, tab3 = st.tabs(["💡 Submit Ideas", "🔍 Browse Ideas", "📊 Analytics"])
+    tab1, tab2, tab3, tab4 = st.tabs(["💡 Submit Ideas", "🔍 Browse Ideas", "📊 Analytics", "🤝 Match Teams"])
 
     with tab1:
         render_idea_submission()
@@ -20,6 +22,9 @@ def render():
     with tab3:
         render_ideas_analytics()
 
+    with tab4:
+        render_team_matching()
+
 
 def render_idea_submission():
     st.subheader("💡 Submit Your Idea")
@@ -92,7 +97,6 @@ def render_idea_submission():
         if submitted:
             if title and category and description and submitter_name:
                 idea = {
-                    'id': len(st.session_state.ideas) + 1,
                     'title': title,
                     'category': category,
                     'difficulty': difficulty,
@@ -114,7 +118,7 @@ def render_idea_submission():
                     'comments': []
                 }
 
-                st.session_state.ideas.append(idea)
+                get_storage().add_idea(idea)
                 st.success("✅ Your idea has been submitted successfully!")
                 st.balloons()
             else:
@@ -124,7 +128,8 @@ def render_idea_submission():
 def render_ideas_browse():
     st.subheader("🔍 Browse Ideas")
 
-    if not st.session_state.ideas:
+    ideas = get_storage().list_ideas()
+    if not ideas:
         st.info("No ideas submitted yet. Be the first to submit an innovative idea!")
         return
 
@@ -133,7 +138,7 @@ def render_ideas_browse():
 
     with col1:
         category_filter = st.selectbox("Filter by Category",
-                                       ["All"] + list(set([idea['category'] for idea in st.session_state.ideas])))
+                                       ["All"] + list(set([idea['category'] for idea in ideas])))
 
     with col2:
         difficulty_filter = st.selectbox("Filter by Difficulty",
@@ -146,7 +151,7 @@ def render_ideas_browse():
     search_term = st.text_input("🔍 Search ideas", placeholder="Search by title, description, skills...")
 
     # Filter and sort ideas
-    filtered_ideas = st.session_state.ideas.copy()
+    filtered_ideas = ideas
 
     if category_filter != "All":
         filtered_ideas = [idea for idea in filtered_ideas if idea['category'] == category_filter]
@@ -223,11 +228,12 @@ def render_ideas_browse():
 def render_ideas_analytics():
     st.subheader("📊 Ideas Analytics")
 
-    if not st.session_state.ideas:
+    ideas = get_storage().list_ideas()
+    if not ideas:
         st.info("No ideas available for analytics.")
         return
 
-    df = pd.DataFrame(st.session_state.ideas)
+    df = pd.DataFrame(ideas)
 
     # Summary stats
     col1, col2, col3, col4 = st.columns(4)
@@ -276,6 +282,42 @@ def render_ideas_analytics():
         st.plotly_chart(fig_skills, use_container_width=True)
 
 
+def render_team_matching():
+    st.subheader("🤝 Match Ideas to Teams")
+    st.markdown("Each team is matched to one idea by how well its skills cover the idea's requirements, "
+                "how close its size is to the recommended one, and how many members share the idea's category.")
+
+    storage = get_storage()
+    teams = storage.list_teams()
+    ideas = storage.list_ideas()
+    if not teams or not ideas:
+        st.info("Generate teams on the Team Formation page and submit ideas here to match them.")
+        return
+
+    matcher = IdeaMatcher(teams, ideas)
+    assignment = matcher.assign()
+
+    st.markdown("### Suggested Assignment")
+    st.dataframe(pd.DataFrame([{
+        'Team': f"Team {teams[t].get('id', t + 1)}",
+        'Idea': ideas[i]['title'],
+        'Skill Coverage': f"{matcher.coverage[t, i]:.0%}",
+        'Size Fit': f"{matcher.size_fit[t, i]:.0%}",
+        'Interest Alignment': f"{matcher.interest[t, i]:.0%}",
+        'Score': round(score, 2),
+    } for t, i, score in assignment]), use_container_width=True, hide_index=True)
+    if len(teams) > len(ideas):
+        st.caption(f"{len(teams) - len(ideas)} teams have no idea of their own; see their top picks below.")
+
+    st.markdown(f"### Top {TOP_IDEAS} Ideas per Team")
+    best, scores = matcher.top_ideas(TOP_IDEAS)
+    st.dataframe(pd.DataFrame([
+        dict({'Team': f"Team {team.get('id', t + 1)}"},
+             **{f"#{rank + 1}": f"{ideas[i]['title']} ({score:.2f})" for rank, (i, score) in
+                enumerate(zip(best[t], scores[t]))})
+        for t, team in enumerate(teams)]), use_container_width=True, hide_index=True)
+
+
 def render_comments_section(idea):
     """Render comments section for an idea"""
     st.markdown("---")
@@ -303,10 +345,7 @@ def render_comments_section(idea):
 
 def vote_for_idea(idea_id):
     """Add a vote to an idea"""
-    for idea in st.session_state.ideas:
-        if idea['id'] == idea_id:
-            idea['votes'] += 1
-            break
+    get_storage().vote_for_idea(idea_id)
     st.rerun()
 
 
@@ -318,7 +357,4 @@ def add_comment_to_idea(idea_id, comment_text, author):
         'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M')
     }
 
-    for idea in st.session_state.ideas:
-        if idea['id'] == idea_id:
-            idea['comments'].append(comment)
-            break
+    get_storage().add_idea_comment(idea_id, comment)
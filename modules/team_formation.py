@@ -1,11 +1,21 @@
+import os
 import streamlit as st
 import pandas as pd
-import numpy as np
 from datetime import datetime
 import plotly.express as px
 import plotly.graph_objects as go
 from utils.team_matcher import TeamMatcher
+from utils.team_constraints import TeamConstraints
+from utils.team_stats import TeamStats
+from utils.team_tracks import TRACK_METHODS, SHARDING_THRESHOLD
 from utils.gemini_client import GeminiClient
+from utils.filter_cache import dataset_version
+from utils.recommender import HackathonRecommender
+from utils.teammate_finder import TeammateFinder
+from utils.storage import get_storage, normalize_email
+from utils.participant_registry import get_registry
+from utils.participant_import import (PARTICIPANT_CHOICES, LIST_CHOICES, TEAM_SIZE_CHOICES, detect_format,
+                                      import_participants)
 
 
 def render():
@@ -31,6 +41,9 @@ def render():
 def render_registration():
     st.subheader("👤 Participant Registration")
 
+    with st.expander("📥 Bulk Import (CSV, JSON, JSONL)"):
+        render_bulk_import()
+
     with st.form("participant_form"):
         # Basic Information
         st.markdown("### Basic Information")
@@ -39,14 +52,11 @@ def render_registration():
         with col1:
             name = st.text_input("Full Name*", placeholder="Enter your full name")
             email = st.text_input("Email*", placeholder="your.email@example.com")
-            experience_level = st.selectbox("Experience Level*",
-                                            ["Beginner", "Intermediate", "Advanced", "Expert"])
+            experience_level = st.selectbox("Experience Level*", PARTICIPANT_CHOICES['experience_level'])
 
         with col2:
-            role_preference = st.selectbox("Preferred Role*",
-                                           ["Frontend Developer", "Backend Developer", "Full Stack Developer",
-                                            "Data Scientist", "ML Engineer", "Designer", "Product Manager", "DevOps"])
-            team_size_pref = st.selectbox("Preferred Team Size", [3, 4, 5, 6], index=1)
+            role_preference = st.selectbox("Preferred Role*", PARTICIPANT_CHOICES['role_preference'])
+            team_size_pref = st.selectbox("Preferred Team Size", TEAM_SIZE_CHOICES, index=1)
             leadership_interest = st.checkbox("Interested in team leadership")
 
         # Skills & Technologies
@@ -54,27 +64,16 @@ def render_registration():
         col3, col4 = st.columns(2)
 
         with col3:
-            programming_langs = st.multiselect("Programming Languages",
-                                               ["Python", "JavaScript", "Java", "C++", "C#", "Go", "Rust",
-                                                "Swift", "Kotlin", "PHP", "Ruby", "TypeScript"])
-            frameworks = st.multiselect("Frameworks & Libraries",
-                                        ["React", "Angular", "Vue.js", "Node.js", "Django", "Flask",
-                                         "Spring", "TensorFlow", "PyTorch", "Scikit-learn", "Next.js"])
+            programming_langs = st.multiselect("Programming Languages", LIST_CHOICES['programming_langs'])
+            frameworks = st.multiselect("Frameworks & Libraries", LIST_CHOICES['frameworks'])
 
         with col4:
-            databases = st.multiselect("Databases",
-                                       ["MySQL", "PostgreSQL", "MongoDB", "Redis", "SQLite",
-                                        "Firebase", "DynamoDB", "Elasticsearch"])
-            tools = st.multiselect("Tools & Platforms",
-                                   ["Git", "Docker", "AWS", "Azure", "GCP", "Figma",
-                                    "Adobe Creative Suite", "Jupyter", "Kubernetes"])
+            databases = st.multiselect("Databases", LIST_CHOICES['databases'])
+            tools = st.multiselect("Tools & Platforms", LIST_CHOICES['tools'])
 
         # Interests & Preferences
         st.markdown("### Project Interests")
-        interests = st.multiselect("Areas of Interest",
-                                   ["Web Development", "Mobile Apps", "AI/ML", "Blockchain", "IoT",
-                                    "Gaming", "Fintech", "Healthcare", "Education", "Sustainability",
-                                    "Social Impact", "AR/VR", "Cybersecurity"])
+        interests = st.multiselect("Areas of Interest", LIST_CHOICES['interests'])
 
         bio = st.text_area("Bio/Additional Information",
                            placeholder="Tell us about yourself, your goals, or anything else relevant...")
@@ -84,13 +83,12 @@ def render_registration():
         col5, col6 = st.columns(2)
 
         with col5:
-            work_style = st.selectbox("Work Style", ["Individual focused", "Collaborative", "Mixed"])
-            timezone = st.selectbox("Timezone", ["PST", "EST", "GMT", "CET", "IST", "JST", "Other"])
+            work_style = st.selectbox("Work Style", PARTICIPANT_CHOICES['work_style'])
+            timezone = st.selectbox("Timezone", PARTICIPANT_CHOICES['timezone'])
 
         with col6:
-            availability = st.selectbox("Availability", ["Full-time", "Part-time", "Weekends only"])
-            communication_pref = st.selectbox("Communication Preference",
-                                              ["Slack/Discord", "Email", "Video calls", "In-person"])
+            availability = st.selectbox("Availability", PARTICIPANT_CHOICES['availability'])
+            communication_pref = st.selectbox("Communication Preference", PARTICIPANT_CHOICES['communication_pref'])
 
         submitted = st.form_submit_button("🚀 Register Participant", type="primary")
 
@@ -116,26 +114,73 @@ def render_registration():
                     'registered_at': datetime.now().isoformat()
                 }
 
-                # Check for existing participant
-                existing = [p for p in st.session_state.participants if p['email'] == email]
-                if existing:
+                # The registry's email index rejects duplicates without scanning
+                if get_registry().register(participant) is None:
                     st.error("❌ Participant with this email already registered!")
                 else:
-                    st.session_state.participants.append(participant)
                     st.success(f"✅ {name} registered successfully!")
                     st.balloons()
             else:
                 st.error("❌ Please fill in all required fields marked with *")
 
 
+def render_bulk_import():
+    st.markdown("Upload participants exported from an external registration form. "
+                "Columns use the registration field names (name, email, experience_level, role_preference, "
+                "...); list fields such as programming_langs may be separated by ';' or ','.")
+
+    uploaded = st.file_uploader("Participants file", type=['csv', 'json', 'jsonl', 'ndjson'],
+                                key="participant_import_file")
+    update_existing = st.checkbox("Update participants who are already registered", key="participant_import_update")
+
+    if uploaded is None or not st.button("📥 Import Participants", key="participant_import_button"):
+        return
+
+    status = st.empty()
+
+    def show_progress(report):
+        status.info(f"Processed {report['rows']:,} rows ({report['imported']:,} imported)...")
+
+    try:
+        report = import_participants(uploaded, detect_format(uploaded.name), get_registry(),
+                                     update_existing=update_existing, progress=show_progress)
+    except Exception as e:
+        status.empty()
+        st.error(f"❌ Import failed: {e}")
+        return
+
+    status.empty()
+    st.success(f"✅ Imported {report['imported']:,} participants in {report['seconds']:.1f}s "
+               f"({report['rows_per_second']:,.0f} rows/s)")
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Rows", f"{report['rows']:,}")
+    with col2:
+        st.metric("Imported", f"{report['imported']:,}")
+    with col3:
+        st.metric("Updated", f"{report['updated']:,}")
+    with col4:
+        st.metric("Rejected", f"{report['rejected']:,}")
+
+    if report['errors']:
+        errors_df = pd.DataFrame(report['errors'])
+        st.warning(f"⚠️ {report['rejected']:,} rows were rejected")
+        st.dataframe(errors_df.head(500), use_container_width=True)
+        st.download_button("📄 Download Errors (CSV)", errors_df.to_csv(index=False),
+                           file_name="participant_import_errors.csv", mime="text/csv")
+
+
 def render_participants_view():
     st.subheader("📊 Registered Participants")
 
-    if not st.session_state.participants:
+    registry = get_registry()
+    participants = registry.all()
+    if not participants:
         st.info("No participants registered yet. Go to the 'Register' tab to add participants!")
         return
 
-    df = pd.DataFrame(st.session_state.participants)
+    df = pd.DataFrame(participants)
 
     # Summary metrics
     col1, col2, col3, col4 = st.columns(4)
@@ -170,25 +215,42 @@ def render_participants_view():
                           color_discrete_sequence=px.colors.qualitative.Pastel)
         st.plotly_chart(fig_role, use_container_width=True)
 
+    render_teammate_finder(registry)
+
     # Search and filter
     st.markdown("---")
     search_term = st.text_input("🔍 Search participants",
                                 placeholder="Search by name, skills, interests...")
 
-    # Filter participants
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        role_filter = st.selectbox("Role", ["All"] + sorted(r for r, ids in registry.by_role.items() if r and ids))
+    with col2:
+        experience_filter = st.selectbox("Experience", ["All", "Beginner", "Intermediate", "Advanced", "Expert"])
+    with col3:
+        skill_filter = st.multiselect("Has all skills", registry.skill_options())
+
+    # Filter participants: exact filters through the registry indexes, then free-text search
     filtered_participants = df
+    if role_filter != "All" or experience_filter != "All" or skill_filter:
+        matching = registry.query(role=None if role_filter == "All" else role_filter,
+                                  experience=None if experience_filter == "All" else experience_filter,
+                                  skills=skill_filter)
+        filtered_participants = df[df['id'].isin([p['id'] for p in matching])]
     if search_term:
+        candidates = filtered_participants
         mask = (
-                df['name'].str.contains(search_term, case=False, na=False) |
-                df['role_preference'].str.contains(search_term, case=False, na=False) |
-                df['bio'].str.contains(search_term, case=False, na=False) |
-                df['programming_langs'].astype(str).str.contains(search_term, case=False, na=False) |
-                df['interests'].astype(str).str.contains(search_term, case=False, na=False)
+                candidates['name'].str.contains(search_term, case=False, na=False) |
+                candidates['role_preference'].str.contains(search_term, case=False, na=False) |
+                candidates['bio'].str.contains(search_term, case=False, na=False) |
+                candidates['programming_langs'].astype(str).str.contains(search_term, case=False, na=False) |
+                candidates['interests'].astype(str).str.contains(search_term, case=False, na=False)
         )
-        filtered_participants = df[mask]
+        filtered_participants = candidates[mask]
 
     # Display participants
     st.subheader(f"Participants ({len(filtered_participants)})")
+    recommender = get_recommender(participants) if st.session_state.hackathons_data else None
 
     for i, (_, row) in enumerate(filtered_participants.iterrows()):
         participant = row.to_dict()
@@ -215,13 +277,72 @@ def render_participants_view():
             if participant.get('bio'):
                 st.write(f"**Bio:** {participant['bio']}")
 
+            if recommender:
+                recommendations = recommender.recommend(participant)
+                if recommendations:
+                    titles = [f"{h.get('title', 'Untitled')} ({score:.0%})" for h, score in recommendations]
+                    st.write(f"**Recommended Hackathons:** {', '.join(titles)}")
+
+
+def render_teammate_finder(registry):
+    with st.expander("🤝 Find Teammates"):
+        st.markdown("Participants whose skills complement yours and whose interests, timezone and "
+                    "availability line up with yours.")
+        email = st.text_input("Your registered email", key="teammate_email")
+        k = st.slider("Number of suggestions", 3, 20, 5, key="teammate_count")
+        if not email:
+            return
+
+        participant = registry.find_by_email(email)
+        if participant is None:
+            st.warning("⚠️ No participant is registered with that email.")
+            return
+
+        matches = get_teammate_finder(registry).find(participant, k)
+        if not matches:
+            st.info("No other participants registered yet.")
+            return
+        st.dataframe(pd.DataFrame([{
+            'Name': match['name'],
+            'Role': match['role_preference'],
+            'Experience': match['experience_level'],
+            'Skills': ', '.join(match.get('programming_langs', []) + match.get('frameworks', [])),
+            'Interests': ', '.join(match.get('interests', [])),
+            'Timezone': match.get('timezone'),
+            'Availability': match.get('availability'),
+            'Match': f"{score:.0%}",
+        } for match, score in matches]), use_container_width=True, hide_index=True)
+
+
+def get_teammate_finder(registry):
+    """Teammate finder for this session, synced with the participant registry"""
+    if 'teammate_finder' not in st.session_state:
+        st.session_state.teammate_finder = TeammateFinder(k=5)
+    finder = st.session_state.teammate_finder
+    finder.sync(registry.all(), revision=registry.revision)
+    return finder
+
+
+def get_recommender(participants):
+    """Hackathon recommender for this session, synced with participants and hackathons"""
+    if 'recommender' not in st.session_state:
+        st.session_state.recommender = HackathonRecommender(k=3)
+    if 'data_version' not in st.session_state:
+        st.session_state.data_version = dataset_version(st.session_state.hackathons_data)
+
+    recommender = st.session_state.recommender
+    recommender.sync_hackathons(st.session_state.hackathons_data, version=st.session_state.data_version)
+    recommender.sync_participants(participants)
+    return recommender
+
 
 def render_team_generation():
     st.subheader("🤖 Generate Optimal Teams")
 
-    if len(st.session_state.participants) < 6:
+    participant_count = len(get_registry())
+    if participant_count < 6:
         st.warning("⚠️ You need at least 6 participants to generate meaningful teams.")
-        st.info(f"Current participants: {len(st.session_state.participants)}")
+        st.info(f"Current participants: {participant_count}")
         return
 
     # Team generation parameters
@@ -229,9 +350,9 @@ def render_team_generation():
 
     with col1:
         team_size = st.selectbox("Target Team Size", [3, 4, 5, 6], index=1)
-        max_teams = len(st.session_state.participants) // team_size
+        max_teams = participant_count // team_size
         num_teams = st.number_input("Number of Teams", min_value=1, max_value=max_teams,
-                                    value=min(max_teams, len(st.session_state.participants) // team_size))
+                                    value=min(max_teams, participant_count // team_size))
 
     with col2:
         balance_priority = st.selectbox("Balancing Priority",
@@ -239,65 +360,93 @@ def render_team_generation():
                                          "Interest Alignment"])
         include_leadership = st.checkbox("Ensure each team has a potential leader", value=True)
 
+    # Team constraints
+    col3, col4 = st.columns(2)
+
+    with col3:
+        required_roles = st.multiselect("Roles every team should include", PARTICIPANT_CHOICES['role_preference'],
+                                        help="Enforced for roles with at least one participant per team")
+
+    with col4:
+        spread_choice = st.selectbox("Max timezone spread within a team", ["No limit", 3, 6, 9, 12],
+                                     format_func=lambda v: v if v == "No limit" else f"{v} hours")
+        max_timezone_spread = None if spread_choice == "No limit" else spread_choice
+
     # Advanced options
     with st.expander("🔧 Advanced Options"):
         weight_skills = st.slider("Skills Weight", 0.0, 1.0, 0.3, help="How much to prioritize skill diversity")
         weight_experience = st.slider("Experience Weight", 0.0, 1.0, 0.3, help="How much to balance experience levels")
         weight_interests = st.slider("Interests Weight", 0.0, 1.0, 0.4, help="How much to align interests")
+        optimize = st.checkbox("Optimize with local search", value=True,
+                               help="Improve a balanced draft by swapping members between teams")
+        time_budget = st.slider("Search Time Budget (seconds)", 0.5, 10.0, 2.0, step=0.5, disabled=not optimize)
+        sharding_options = [None] + list(TRACK_METHODS)
+        default_sharding = 'kmeans' if participant_count >= SHARDING_THRESHOLD else None
+        sharding = st.selectbox("Form Teams Within Interest Tracks", sharding_options,
+                                index=sharding_options.index(default_sharding),
+                                format_func=lambda method: TRACK_METHODS.get(method, "Off"),
+                                help="Split large events into tracks of participants with shared interests and form "
+                                     "teams within each track; leftovers are rebalanced into mixed teams")
+        cpu_count = os.cpu_count() or 1
+        workers = 1
+        if cpu_count > 1:
+            workers = st.slider("Parallel Search Workers", 1, cpu_count, cpu_count, disabled=not optimize,
+                                help="Independent search restarts, or interest tracks, run on separate CPU cores")
 
     if st.button("🚀 Generate Teams", type="primary"):
         generate_optimal_teams(num_teams, team_size, balance_priority, include_leadership,
-                               weight_skills, weight_experience, weight_interests)
+                               weight_skills, weight_experience, weight_interests, optimize, time_budget, workers,
+                               required_roles, max_timezone_spread, sharding)
 
 
 def render_teams_view():
     st.subheader("🏆 Generated Teams")
 
-    if not st.session_state.teams:
+    teams = get_storage().list_teams()
+    if not teams:
         st.info("No teams generated yet. Go to the 'Generate Teams' tab to create teams!")
         return
 
     # Teams overview
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("Total Teams", len(st.session_state.teams))
+        st.metric("Total Teams", len(teams))
     with col2:
-        total_members = sum(len(team['members']) for team in st.session_state.teams)
+        total_members = sum(len(team['members']) for team in teams)
         st.metric("Total Members", total_members)
     with col3:
-        avg_team_size = total_members / len(st.session_state.teams) if st.session_state.teams else 0
+        avg_team_size = total_members / len(teams) if teams else 0
         st.metric("Avg Team Size", f"{avg_team_size:.1f}")
 
+    # Participants who registered after the teams were generated
+    seated = {normalize_email(member.get('email')) for team in teams for member in team['members']}
+    late = [p for p in get_registry().all() if normalize_email(p.get('email')) not in seated]
+    if late:
+        st.info(f"🆕 {len(late)} registered participants are not on any team yet.")
+        if st.button("➕ Place Into Existing Teams"):
+            teams = place_late_registrants(teams, late) or teams
+
     # Display each team
-    for i, team in enumerate(st.session_state.teams):
+    for i, team in enumerate(teams):
         with st.expander(f"🏆 Team {i + 1} ({len(team['members'])} members)", expanded=True):
 
             # Team composition chart
             if team['members']:
-                roles = [member['role_preference'] for member in team['members']]
-                role_counts = pd.Series(roles).value_counts()
-
+                stats = TeamStats.for_team(team)
                 col1, col2 = st.columns([2, 1])
 
                 with col1:
-                    fig = px.bar(x=role_counts.index, y=role_counts.values,
-                                 title=f"Team {i + 1} Role Distribution")
-                    st.plotly_chart(fig, use_container_width=True)
+                    st.plotly_chart(role_chart(i + 1, tuple(stats.roles.most_common())), use_container_width=True)
 
                 with col2:
                     st.markdown("### Team Stats")
-                    exp_levels = [member['experience_level'] for member in team['members']]
-                    st.write(f"**Avg Experience:** {get_avg_experience(exp_levels)}")
-                    st.write(
-                        f"**Has Leader:** {'Yes' if any(m['leadership_interest'] for m in team['members']) else 'No'}")
-
-                    # Skills overlap
-                    all_skills = []
-                    for member in team['members']:
-                        all_skills.extend(member.get('programming_langs', []))
-                        all_skills.extend(member.get('frameworks', []))
-                    common_skills = pd.Series(all_skills).value_counts().head(3)
-                    st.write(f"**Top Skills:** {', '.join(common_skills.index)}")
+                    st.write(f"**Avg Experience:** {stats.experience_level}")
+                    if team.get('track'):
+                        st.write(f"**Track:** {team['track']}")
+                    if 'match_score' in team:
+                        st.write(f"**Match Score:** {team['match_score']:.2f}")
+                    st.write(f"**Has Leader:** {'Yes' if stats.leaders else 'No'}")
+                    st.write(f"**Top Skills:** {', '.join(stats.top_skills(3))}")
 
             # Team members
             st.markdown("### Team Members")
@@ -315,13 +464,14 @@ def render_teams_view():
 
 
 def generate_optimal_teams(num_teams, team_size, balance_priority, include_leadership,
-                           weight_skills, weight_experience, weight_interests):
+                           weight_skills, weight_experience, weight_interests, optimize=True, time_budget=2.0,
+                           workers=1, required_roles=(), max_timezone_spread=None, sharding=None):
     """Generate optimal teams using ML"""
 
     with st.spinner("🧠 Analyzing participants and generating optimal teams..."):
         try:
             team_matcher = TeamMatcher(
-                participants=st.session_state.participants,
+                participants=get_registry().all(),
                 weight_skills=weight_skills,
                 weight_experience=weight_experience,
                 weight_interests=weight_interests
@@ -331,17 +481,89 @@ def generate_optimal_teams(num_teams, team_size, balance_priority, include_leade
                 num_teams=num_teams,
                 team_size=team_size,
                 balance_priority=balance_priority,
-                include_leadership=include_leadership
+                include_leadership=include_leadership,
+                optimize=optimize,
+                time_budget=time_budget,
+                workers=workers,
+                required_roles=required_roles,
+                max_timezone_spread=max_timezone_spread,
+                sharding=sharding
             )
 
-            st.session_state.teams = teams
+            get_storage().replace_teams(teams, settings={
+                'team_size': team_size,
+                'balance_priority': balance_priority,
+                'include_leadership': include_leadership,
+                'weight_skills': weight_skills,
+                'weight_experience': weight_experience,
+                'weight_interests': weight_interests,
+                'required_roles': list(required_roles),
+                'max_timezone_spread': max_timezone_spread,
+                'sharding': sharding,
+            })
             st.success("✅ Teams generated successfully!")
+            if optimize:
+                stats = team_matcher.search_stats
+                restarts = (f" across {stats['restarts']} restarts" if stats.get('restarts') else
+                            f" across {stats['tracks']} interest tracks" if stats.get('tracks') else "")
+                st.info(f"🔎 Local search ran {stats['iterations']:,} iterations{restarts} and improved the total "
+                        f"match score from {stats['initial_score']:.2f} to {stats['best_score']:.2f}")
+            for warning in team_matcher.constraint_warnings:
+                st.warning(f"⚠️ {warning}")
+            if team_matcher.unassigned:
+                st.warning(f"⚠️ Not seated: {', '.join(p['name'] for p in team_matcher.unassigned)}")
             st.balloons()
 
         except Exception as e:
             st.error(f"❌ Error generating teams: {str(e)}")
 
 
+@st.cache_data(max_entries=1024)
+def role_chart(team_number, role_counts):
+    """Role distribution chart of a team, rebuilt only when its role counts change"""
+    roles, counts = zip(*role_counts)
+    return px.bar(x=list(roles), y=list(counts), title=f"Team {team_number} Role Distribution")
+
+
+def place_late_registrants(teams, late):
+    """Seat late registrants in the existing teams under the settings the teams were generated with"""
+    storage = get_storage()
+    settings = storage.team_settings()
+    try:
+        members = [member for team in teams for member in team['members']]
+        team_matcher = TeamMatcher(
+            participants=members + late,
+            weight_skills=settings.get('weight_skills', 0.3),
+            weight_experience=settings.get('weight_experience', 0.3),
+            weight_interests=settings.get('weight_interests', 0.4)
+        )
+        constraints = TeamConstraints(
+            max_size=settings.get('team_size') or max(len(team['members']) for team in teams),
+            require_leader=settings.get('include_leadership', False),
+            required_roles=settings.get('required_roles', ()),
+            max_timezone_spread=settings.get('max_timezone_spread')
+        )
+        updated, placements = team_matcher.place_participants(teams, late, settings.get('balance_priority'),
+                                                              constraints)
+        storage.replace_teams(updated, settings=settings)
+
+        for placement in placements:
+            name = placement['participant']['name']
+            if placement['team'] is None:
+                st.warning(f"⚠️ No team fits {name} within the team constraints")
+            elif placement['moved']:
+                st.success(f"✅ {name} joined Team {placement['team']}; "
+                           f"{placement['moved']['name']} moved to make room")
+            elif placement['overflow']:
+                st.warning(f"⚠️ {name} joined Team {placement['team']}, which is now over the size limit")
+            else:
+                st.success(f"✅ {name} joined Team {placement['team']}")
+        return updated
+
+    except Exception as e:
+        st.error(f"❌ Error placing participants: {str(e)}")
+
+
 def generate_team_ai_insights(team, team_number):
     """Generate AI insights for a specific team"""
     if not st.session_state.gemini_api_key:
@@ -381,18 +603,3 @@ Be specific and actionable in your advice."""
 
     except Exception as e:
         st.error(f"Error generating AI insights: {str(e)}")
-
-
-def get_avg_experience(exp_levels):
-    """Calculate average experience level"""
-    exp_mapping = {'Beginner': 1, 'Intermediate': 2, 'Advanced': 3, 'Expert': 4}
-    avg = np.mean([exp_mapping[level] for level in exp_levels])
-
-    if avg < 1.5:
-        return "Beginner"
-    elif avg < 2.5:
-        return "Intermediate"
-    elif avg < 3.5:
-        return "Advanced"
-    else:
-        return "Expert"
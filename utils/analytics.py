@@ -0,0 +1,178 @@
+import logging
+import threading
+from collections import Counter
+from datetime import date
+import numpy as np
+from utils.hackathon_index import (SOURCE_OPTIONS, FORMAT_OPTIONS, source_label, format_label,
+                                   parse_date_ordinal, record_keys, record_digest)
+
+logger = logging.getLogger(__name__)
+
+PRIZE_BUCKETS = [(0, "No prize"), (1000, "< $1k"), (5000, "$1k-5k"), (10000, "$5k-10k"),
+                 (25000, "$10k-25k"), (50000, "$25k-50k"), (float('inf'), "$50k+")]
+PRIZE_BUCKET_LABELS = [label for _, label in PRIZE_BUCKETS]
+FORMAT_LABELS = FORMAT_OPTIONS + ["Unknown"]
+UNKNOWN_MONTH = "Unknown"
+NO_TAG = "(none)"
+
+
+def prize_bucket(amount):
+    """Index of the prize bucket an amount falls into"""
+    amount = float(amount or 0)
+    if amount <= 0:
+        return 0
+    for i, (upper, _) in enumerate(PRIZE_BUCKETS[1:], 1):
+        if amount < upper:
+            return i
+    return len(PRIZE_BUCKETS) - 1
+
+
+def _grow(array, axis, size):
+    """array with room for size entries along axis, doubling its capacity when it is full"""
+    if array.shape[axis] >= size:
+        return array
+    shape = list(array.shape)
+    shape[axis] = max(size, 2 * shape[axis])
+    grown = np.zeros(shape, dtype=array.dtype)
+    grown[(slice(None),) * axis + (slice(0, array.shape[axis]),)] = array
+    return grown
+
+
+class HackathonAnalytics:
+    """Pre-aggregated group-by cubes over the hackathon dataset
+
+    events[month, source, format, prize_bucket] counts listings,
+    prize_totals[month, source, format] sums prize money and
+    tag_events[month, source, format, tag] counts listings per tag. Each
+    record's cube coordinates are remembered, so a data delta is applied by
+    subtracting removed/changed records and adding new ones. The month and
+    tag axes are over-allocated and double when full; only the first
+    len(months) / len(tags) entries are in use.
+    """
+
+    def __init__(self):
+        self.months = []
+        self.tags = []
+        self._month_index = {}
+        self._tag_index = {}
+
+        num_sources = len(SOURCE_OPTIONS)
+        num_formats = len(FORMAT_LABELS)
+        self.events = np.zeros((0, num_sources, num_formats, len(PRIZE_BUCKETS)), dtype=np.int64)
+        self.prize_totals = np.zeros((0, num_sources, num_formats), dtype=np.float64)
+        self.tag_events = np.zeros((0, num_sources, num_formats, 0), dtype=np.int64)
+        self.locations = Counter()
+
+        self.contributions = {}
+        self.digests = {}
+        self.version = None
+        self._summary = None
+        self._lock = threading.Lock()
+
+    def sync(self, hackathons_data, version=None):
+        """Apply the difference between the aggregated data and a published dataset"""
+        with self._lock:
+            if version is not None and version == self.version:
+                return
+            self.version = version
+
+            keys = record_keys(hackathons_data)
+            digests = [record_digest(record) for record in hackathons_data]
+            current = dict(zip(keys, digests))
+
+            stale = [key for key, digest in self.digests.items() if current.get(key) != digest]
+            fresh = [i for i, key in enumerate(keys) if self.digests.get(key) != digests[i]]
+
+            for key in stale:
+                self._apply(self.contributions.pop(key), -1)
+                del self.digests[key]
+
+            for i in fresh:
+                contribution = self._coordinates(hackathons_data[i])
+                self._apply(contribution, 1)
+                self.contributions[keys[i]] = contribution
+                self.digests[keys[i]] = digests[i]
+
+            self._summary = None
+            logger.info(f"Analytics updated: -{len(stale)} +{len(fresh)} listings")
+
+    def _coordinates(self, record):
+        ordinal = parse_date_ordinal(record.get('date'))
+        month = date.fromordinal(ordinal).strftime('%Y-%m') if ordinal > 0 else UNKNOWN_MONTH
+        label = format_label(record.get('location_type'))
+
+        tags = record.get('tags', [])
+        tags = [tag for tag in tags if tag] if isinstance(tags, list) else []
+
+        return {
+            'month': self._month_id(month),
+            'source': SOURCE_OPTIONS.index(source_label(record.get('source'))),
+            'format': FORMAT_LABELS.index(label) if label else len(FORMAT_LABELS) - 1,
+            'bucket': prize_bucket(record.get('prize_amount', 0)),
+            'prize': float(record.get('prize_amount', 0) or 0),
+            'tags': [self._tag_id(tag) for tag in (tags or [NO_TAG])],
+            'location': record.get('location', '')
+        }
+
+    def _month_id(self, month):
+        if month not in self._month_index:
+            self._month_index[month] = len(self.months)
+            self.months.append(month)
+            self.events = _grow(self.events, 0, len(self.months))
+            self.prize_totals = _grow(self.prize_totals, 0, len(self.months))
+            self.tag_events = _grow(self.tag_events, 0, len(self.months))
+        return self._month_index[month]
+
+    def _tag_id(self, tag):
+        if tag not in self._tag_index:
+            self._tag_index[tag] = len(self.tags)
+            self.tags.append(tag)
+            self.tag_events = _grow(self.tag_events, 3, len(self.tags))
+        return self._tag_index[tag]
+
+    def _apply(self, c, sign):
+        cell = (c['month'], c['source'], c['format'])
+        self.events[cell + (c['bucket'],)] += sign
+        self.prize_totals[cell] += sign * c['prize']
+        self.tag_events[cell][c['tags']] += sign
+
+        self.locations[c['location']] += sign
+        if self.locations[c['location']] <= 0:
+            del self.locations[c['location']]
+
+    def summary(self):
+        """Aggregates for the analytics tab, as plain label -> value mappings
+
+        The result is cached until the next sync that changes the data, and
+        carries the dataset version it was computed for.
+        """
+        with self._lock:
+            if self._summary is None:
+                self._summary = self._summarize()
+            return self._summary
+
+    def _summarize(self):
+        events = self.events[:len(self.months)]
+        events_by_month = events.sum(axis=(1, 3))
+        month_order = sorted(range(len(self.months)),
+                             key=lambda m: (self.months[m] == UNKNOWN_MONTH, self.months[m]))
+        tag_totals = self.tag_events[:len(self.months), :, :, :len(self.tags)].sum(axis=(0, 1, 2))
+        top_tags = np.argsort(-tag_totals, kind='stable')[:10]
+        source_totals = events.sum(axis=(0, 2, 3))
+        format_totals = events.sum(axis=(0, 1, 3))
+
+        return {
+            'version': self.version,
+            'total': int(events.sum()),
+            'total_prize': float(self.prize_totals[:len(self.months)].sum()),
+            'online': int(format_totals[FORMAT_LABELS.index("Online")]),
+            'active_sources': int((source_totals > 0).sum()),
+            'unique_locations': len(self.locations),
+            'events_per_month': {
+                self.months[m]: dict(zip(FORMAT_LABELS, events_by_month[m].tolist()))
+                for m in month_order if events_by_month[m].any()
+            },
+            'prize_distribution': dict(zip(PRIZE_BUCKET_LABELS, events.sum(axis=(0, 1, 2)).tolist())),
+            'top_tags': {self.tags[t]: int(tag_totals[t]) for t in top_tags if tag_totals[t] > 0},
+            'source_mix': {s: int(n) for s, n in zip(SOURCE_OPTIONS, source_totals) if n > 0}
+        }
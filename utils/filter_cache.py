@@ -0,0 +1,90 @@
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+def query_fingerprint(query):
+    """Canonical hash of a filter query
+
+    Multiselect values are sorted so that picking the same options in a
+    different order maps to the same cache entry.
+    """
+    canonical = {}
+    for key, value in query.items():
+        if isinstance(value, (list, tuple, set)):
+            value = sorted(str(v) for v in value)
+        canonical[key] = value
+
+    payload = json.dumps(canonical, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def dataset_version(data):
+    """Content hash identifying a published hackathon dataset"""
+    digest = hashlib.sha1()
+    for record in data:
+        digest.update(json.dumps(dict(record), sort_keys=True, default=str).encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+class FilterResultCache:
+    """LRU cache of filter result id-lists keyed by query fingerprint and dataset version
+
+    A single instance is shared by every session in the process, so the
+    methods are guarded by a lock.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, version, fingerprint):
+        """Return cached result ids or None"""
+        key = (version, fingerprint)
+        with self._lock:
+            ids = self._entries.get(key)
+            if ids is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return ids
+
+    def put(self, version, fingerprint, ids):
+        """Store result ids, evicting the least recently used entries"""
+        key = (version, fingerprint)
+        with self._lock:
+            self._entries[key] = tuple(ids)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def retain(self, versions):
+        """Drop entries of every dataset version not in versions"""
+        with self._lock:
+            stale = [key for key in self._entries if key[0] not in versions]
+            for key in stale:
+                del self._entries[key]
+
+        if stale:
+            logger.info(f"Evicted {len(stale)} cached filter results of retired dataset versions")
+        return len(stale)
+
+    def get_stats(self):
+        """Get cache statistics"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0
+            }
@@ -0,0 +1,65 @@
+from datetime import date, datetime
+import logging
+
+logger = logging.getLogger(__name__)
+
+DATE_FIELDS = ('start_date', 'end_date')
+
+
+def restore_query(query):
+    """A filter query read back from JSON storage, with its dates parsed again"""
+    return {field: date.fromisoformat(value) if field in DATE_FIELDS and value else value
+            for field, value in query.items()}
+
+
+class FilterPreset:
+    """A saved filter query kept as a materialized result set
+
+    Membership is tracked by record key so it survives re-scrapes; result ids
+    are positions in the dataset version the preset was last maintained for.
+    """
+
+    def __init__(self, name, query, result_keys, result_ids, version, as_of, saved_at=None):
+        self.name = name
+        self.query = query
+        self.result_keys = set(result_keys)
+        self.result_ids = tuple(result_ids)
+        self.version = version
+        self.as_of = as_of
+        self.saved_at = saved_at or datetime.now().isoformat()
+
+    @classmethod
+    def stored(cls, name, query, saved_at=None):
+        """A preset loaded from storage, materialized on first use"""
+        return cls(name, restore_query(query), [], [], version=None, as_of=None, saved_at=saved_at)
+
+    def is_current(self, version, as_of):
+        """Whether the materialized results can be served as they are"""
+        return self.version == version and self.as_of == as_of
+
+    def apply_delta(self, delta, matched_ids, order_ids, version):
+        """Update the result set from the added/changed records that match the query
+
+        matched_ids are the ids (in the new dataset) of added or changed
+        records that satisfy the preset's predicate; order_ids sorts ids
+        into the preset's display order.
+        """
+        changed_keys = {delta.keys[i] for i in delta.changed_ids}
+        self.result_keys -= delta.removed_keys
+        self.result_keys -= changed_keys
+        self.result_keys.update(delta.keys[i] for i in matched_ids)
+
+        # Start from dataset order so ties sort exactly as a fresh query would
+        result_ids = sorted(delta.key_to_id[key] for key in self.result_keys)
+        self.result_ids = tuple(order_ids(result_ids))
+        self.version = version
+        logger.info(f"Preset '{self.name}' updated: {len(self.result_ids)} results")
+
+    def get_stats(self):
+        """Get preset summary"""
+        return {
+            'name': self.name,
+            'saved_at': self.saved_at,
+            'count': len(self.result_ids),
+            'version': self.version
+        }
@@ -0,0 +1,339 @@
+import hashlib
+import json
+import logging
+import re
+from datetime import datetime, date
+import numpy as np
+from utils.keyword_classifier import KeywordClassifier
+from utils.tag_vocabulary import canonical_terms
+from utils.record_store import pack_strings, unpack_strings
+
+logger = logging.getLogger(__name__)
+
+SOURCE_OPTIONS = ["Devpost", "Hackathon.io", "HackerEarth", "MLH", "Others"]
+FORMAT_OPTIONS = ["Online", "Offline", "Hybrid"]
+
+# Classification rules: each label is assigned when any of its keywords occurs
+# (case-insensitively) in the record's duration text or category/tag list
+CATEGORY_KEYWORDS = {
+    "AI/ML": ['ai/ml'],
+    "Web Development": ['web development'],
+    "Mobile": ['mobile'],
+    "Blockchain": ['blockchain'],
+    "IoT": ['iot'],
+    "Gaming": ['gaming'],
+    "FinTech": ['fintech'],
+    "HealthTech": ['healthtech'],
+    "EdTech": ['edtech'],
+    "Sustainability": ['sustainability'],
+    "Open Source": ['open source'],
+}
+DURATION_KEYWORDS = {
+    "1 day": ['1 day', '24 hour', 'one day'],
+    "2-3 days": ['2 day', '3 day', '48 hour', '72 hour', 'weekend'],
+    "1 week": ['1 week', '7 day', 'week'],
+    "2-4 weeks": ['2 week', '3 week', '4 week', 'month'],
+    "1+ months": ['month', 'semester', 'long term'],
+}
+CATEGORY_OPTIONS = list(CATEGORY_KEYWORDS)
+DURATION_OPTIONS = list(DURATION_KEYWORDS)
+
+CATEGORY_CLASSIFIER = KeywordClassifier(CATEGORY_KEYWORDS)
+DURATION_CLASSIFIER = KeywordClassifier(DURATION_KEYWORDS)
+
+# Sort menu entries as (key, descending) pairs, most significant key first
+SORT_ORDERS = {
+    "Date": [('date', False)],
+    "Prize Amount": [('prize', True)],
+    "Title": [('title', False)],
+    "Location": [('location', False)],
+    "Registration Deadline": [('registration_deadline', False)],
+    "Prize Amount, then Date": [('prize', True), ('date', False)],
+    "Date, then Prize Amount": [('date', False), ('prize', True)],
+}
+DATE_FORMATS = ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%Y-%m-%d %H:%M:%S']
+
+# Length assumed for a duration bucket when the text has no explicit number
+DURATION_BUCKET_DAYS = {"1 day": 1, "2-3 days": 3, "1 week": 7, "2-4 weeks": 28, "1+ months": 30}
+DURATION_UNIT_DAYS = {'hour': 1 / 24, 'day': 1, 'week': 7, 'month': 30}
+DURATION_PATTERN = re.compile(r'(\d+)(?:\s*-\s*(\d+))?\s*\+?\s*(hour|day|week|month)')
+
+# Per-record columns written to and memory-mapped from dataset snapshots
+INDEX_ARRAYS = ['source_codes', 'format_codes', 'category_bits', 'duration_bits', 'date_ordinals',
+                'deadline_ordinals', 'prize_amounts', 'prize_ranks', 'title_ranks', 'location_ranks',
+                'duration_days']
+
+
+def source_label(source):
+    """Map a raw source name onto one of the source filter options"""
+    source = (source or '').lower()
+    for option in SOURCE_OPTIONS[:-1]:
+        if source == option.lower():
+            return option
+    return "Others"
+
+
+def format_label(location_type):
+    """Map a raw location type onto one of the format filter options"""
+    location_type = (location_type or '').lower()
+    if location_type in ['offline', 'in-person']:
+        return "Offline"
+    for option in FORMAT_OPTIONS:
+        if location_type == option.lower():
+            return option
+    return None
+
+
+def category_text(record):
+    """Text the category rules are matched against"""
+    return str(record.get('categories', []) or record.get('tags', []))
+
+
+def label_bits(masks, num_labels):
+    """Expand classifier bitmasks into a boolean (records x labels) matrix"""
+    masks = np.asarray(masks, dtype=np.int64).reshape(-1, 1)
+    return ((masks >> np.arange(num_labels, dtype=np.int64)) & 1).astype(bool)
+
+
+def parse_date_ordinal(date_str):
+    """Parse an event date string to a proleptic ordinal, or -1 if missing/unparseable"""
+    if not date_str:
+        return -1
+
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(str(date_str), fmt).date().toordinal()
+        except ValueError:
+            continue
+    return -1
+
+
+def parse_duration_days(duration):
+    """Estimated length of an event in whole days (at least 1)"""
+    duration = (duration or '').lower()
+    match = DURATION_PATTERN.search(duration)
+    if match:
+        amount = int(match.group(2) or match.group(1))
+        return max(1, int(np.ceil(amount * DURATION_UNIT_DAYS[match.group(3)])))
+
+    buckets = DURATION_CLASSIFIER.labels_for(duration)
+    # Overlapping buckets ("weekend" also contains "week") take the shorter reading
+    return min((DURATION_BUCKET_DAYS[b] for b in buckets), default=1)
+
+
+def dense_rank(values):
+    """Rank values so that equal values share a rank and ranks follow sort order"""
+    if not values:
+        return np.zeros(0, dtype=np.int32)
+    _, ranks = np.unique(np.asarray(values), return_inverse=True)
+    return ranks.astype(np.int32)
+
+
+def record_keys(hackathons_data):
+    """Identity of each record across scrapes (source + title, numbered when repeated)"""
+    seen = {}
+    keys = []
+    for h in hackathons_data:
+        base = f"{(h.get('source') or '').lower()}:{(h.get('title') or '').lower()}"
+        count = seen.get(base, 0)
+        seen[base] = count + 1
+        keys.append(base if count == 0 else f"{base}#{count}")
+    return keys
+
+
+def record_digest(record):
+    """Content hash of a single record"""
+    return hashlib.sha1(json.dumps(dict(record), sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+class DatasetDelta:
+    """Records added, changed and removed between two published datasets"""
+
+    def __init__(self, old_data, new_data):
+        previous = dict(zip(record_keys(old_data), map(record_digest, old_data)))
+
+        self.keys = record_keys(new_data)
+        self.key_to_id = {key: i for i, key in enumerate(self.keys)}
+        self.added_ids = []
+        self.changed_ids = []
+
+        for i, (key, record) in enumerate(zip(self.keys, new_data)):
+            digest = previous.pop(key, None)
+            if digest is None:
+                self.added_ids.append(i)
+            elif digest != record_digest(record):
+                self.changed_ids.append(i)
+
+        self.removed_keys = set(previous)
+
+    def is_empty(self):
+        return not (self.added_ids or self.changed_ids or self.removed_keys)
+
+
+class HackathonIndex:
+    """Columnar index over a published hackathon dataset
+
+    Categorical dimensions are stored as small integer codes or boolean
+    bitmaps (one column per option), so facet counts for any result set are
+    a gather plus a column sum. Category and duration classes are assigned
+    once at build time by the keyword classifiers. Sort keys are precomputed as integer ranks
+    (or date ordinals), so ordering a result set never calls back into Python.
+    """
+
+    def __init__(self, hackathons_data, category_classifier=CATEGORY_CLASSIFIER,
+                 duration_classifier=DURATION_CLASSIFIER):
+        self.category_labels = category_classifier.labels
+        self.duration_labels = duration_classifier.labels
+        self.size = len(hackathons_data)
+        self.record_keys = record_keys(hackathons_data)
+        self.key_to_id = {key: i for i, key in enumerate(self.record_keys)}
+
+        self.source_codes = np.fromiter(
+            (SOURCE_OPTIONS.index(source_label(h.get('source'))) for h in hackathons_data),
+            dtype=np.int8, count=self.size)
+
+        format_codes = []
+        for h in hackathons_data:
+            label = format_label(h.get('location_type'))
+            format_codes.append(FORMAT_OPTIONS.index(label) if label else -1)
+        self.format_codes = np.array(format_codes, dtype=np.int8)
+
+        self.category_bits = label_bits([category_classifier.classify(category_text(h)) for h in hackathons_data],
+                                        len(self.category_labels))
+        self.duration_bits = label_bits([duration_classifier.classify(h.get('duration', '')) for h in hackathons_data],
+                                        len(self.duration_labels))
+
+        # Missing dates sort as "today", which is resolved at query time
+        self.date_ordinals = np.array([parse_date_ordinal(h.get('date')) for h in hackathons_data],
+                                      dtype=np.int32)
+        self.deadline_ordinals = np.array(
+            [parse_date_ordinal(h.get('registration_deadline')) for h in hackathons_data], dtype=np.int32)
+        self.prize_amounts = np.array([float(h.get('prize_amount', 0) or 0) for h in hackathons_data],
+                                      dtype=np.float64)
+        self.prize_ranks = dense_rank(self.prize_amounts.tolist())
+        self.title_ranks = dense_rank([h.get('title', '').lower() for h in hackathons_data])
+        self.location_ranks = dense_rank([h.get('location', '').lower() for h in hackathons_data])
+
+        # Event spans and topics for the schedule planner and recommendations
+        self.duration_days = np.array([parse_duration_days(h.get('duration')) for h in hackathons_data],
+                                      dtype=np.int32)
+        self.tag_terms = [frozenset(canonical_terms(h.get('tags', []))) for h in hackathons_data]
+
+        self._unfiltered_counts = None
+        logger.info(f"Built hackathon index over {self.size} records")
+
+    def facet_counts(self, ids=None):
+        """Count records per option of each categorical dimension
+
+        With ids=None the counts cover the whole dataset and are computed
+        only once.
+        """
+        if ids is None:
+            if self._unfiltered_counts is None:
+                self._unfiltered_counts = self._count(slice(None))
+            return self._unfiltered_counts
+
+        return self._count(np.asarray(ids, dtype=np.int64))
+
+    def _count(self, selector):
+        source_counts = np.bincount(self.source_codes[selector], minlength=len(SOURCE_OPTIONS))
+
+        format_codes = self.format_codes[selector]
+        format_counts = np.bincount(format_codes[format_codes >= 0], minlength=len(FORMAT_OPTIONS))
+
+        category_counts = self.category_bits[selector].sum(axis=0)
+        duration_counts = self.duration_bits[selector].sum(axis=0)
+
+        return {
+            'sources': dict(zip(SOURCE_OPTIONS, source_counts.tolist())),
+            'formats': dict(zip(FORMAT_OPTIONS, format_counts.tolist())),
+            'categories': dict(zip(self.category_labels, category_counts.tolist())),
+            'durations': dict(zip(self.duration_labels, duration_counts.tolist()))
+        }
+
+    def filter_classes(self, ids, categories=None, duration="All"):
+        """Keep ids carrying any of the categories and the duration bucket"""
+        ids = np.asarray(ids, dtype=np.int64)
+
+        if categories:
+            columns = [self.category_labels.index(c) for c in categories if c in self.category_labels]
+            ids = ids[self.category_bits[np.ix_(ids, columns)].any(axis=1)]
+
+        if duration != "All":
+            if duration not in self.duration_labels:
+                return ids[:0]
+            ids = ids[self.duration_bits[ids, self.duration_labels.index(duration)]]
+
+        return ids
+
+    def sort_key(self, key):
+        """Integer sort key column for every record"""
+        if key in ('date', 'registration_deadline'):
+            ordinals = self.date_ordinals if key == 'date' else self.deadline_ordinals
+            return np.where(ordinals < 0, date.today().toordinal(), ordinals)
+        if key == 'prize':
+            return self.prize_ranks
+        if key == 'title':
+            return self.title_ranks
+        if key == 'location':
+            return self.location_ranks
+        raise ValueError(f"Unknown sort key: {key}")
+
+    def sort_ids(self, ids, order):
+        """Order result ids by one or more sort keys
+
+        order is a list of (key, descending) pairs, most significant first;
+        ties keep the incoming id order.
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        if len(ids) < 2 or not order:
+            return ids
+
+        # lexsort treats the last column as the primary key
+        columns = []
+        for key, descending in reversed(order):
+            column = self.sort_key(key)[ids].astype(np.int64)
+            columns.append(-column if descending else column)
+        return ids[np.lexsort(columns)]
+
+    def to_arrays(self):
+        """Index columns as named numpy arrays plus JSON-serializable metadata, for snapshots"""
+        terms = sorted(set().union(*self.tag_terms))
+        term_ids = {term: i for i, term in enumerate(terms)}
+        tag_term_ids = [term_ids[term] for record_terms in self.tag_terms for term in sorted(record_terms)]
+
+        arrays = {name: getattr(self, name) for name in INDEX_ARRAYS}
+        arrays['keys'], arrays['key_offsets'] = pack_strings(self.record_keys)
+        arrays['terms'], arrays['term_offsets'] = pack_strings(terms)
+        arrays['tag_term_ids'] = np.array(tag_term_ids, dtype=np.int32)
+        arrays['tag_term_offsets'] = np.concatenate(
+            [[0], np.cumsum([len(record_terms) for record_terms in self.tag_terms])]).astype(np.int64)
+
+        metadata = {
+            'size': self.size,
+            'category_labels': self.category_labels,
+            'duration_labels': self.duration_labels,
+        }
+        return arrays, metadata
+
+    @classmethod
+    def from_arrays(cls, arrays, metadata):
+        """Rebuild an index around existing (possibly memory-mapped) arrays"""
+        index = cls.__new__(cls)
+        index.size = metadata['size']
+        index.category_labels = metadata['category_labels']
+        index.duration_labels = metadata['duration_labels']
+        for name in INDEX_ARRAYS:
+            setattr(index, name, arrays[name])
+
+        index.record_keys = unpack_strings(arrays['keys'], arrays['key_offsets'])
+        index.key_to_id = {key: i for i, key in enumerate(index.record_keys)}
+
+        terms = unpack_strings(arrays['terms'], arrays['term_offsets'])
+        offsets = arrays['tag_term_offsets'].tolist()
+        term_ids = arrays['tag_term_ids'].tolist()
+        index.tag_terms = [frozenset(terms[t] for t in term_ids[start:end])
+                           for start, end in zip(offsets[:-1], offsets[1:])]
+
+        index._unfiltered_counts = None
+        return index
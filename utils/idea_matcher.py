@@ -0,0 +1,115 @@
+import logging
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+from utils.participant_registry import participant_skills
+from utils.tag_vocabulary import canonical_term, canonical_terms
+
+logger = logging.getLogger(__name__)
+
+# What covers each skill the idea board asks for: participant skills, preferred roles or interests
+IDEA_SKILL_TERMS = {
+    "Python": ['skill:python', 'skill:django', 'skill:flask', 'skill:jupyter'],
+    "JavaScript": ['skill:javascript', 'skill:typescript', 'skill:node.js', 'skill:react', 'skill:angular',
+                   'skill:vue.js', 'skill:next.js'],
+    "React": ['skill:react', 'skill:next.js'],
+    "Node.js": ['skill:node.js'],
+    "Machine Learning": ['skill:tensorflow', 'skill:pytorch', 'skill:scikit-learn', 'role:ML Engineer',
+                         'role:Data Scientist'],
+    "Data Analysis": ['skill:jupyter', 'skill:scikit-learn', 'role:Data Scientist'],
+    "UI/UX Design": ['skill:figma', 'skill:adobe creative suite', 'role:Designer'],
+    "Mobile Development": ['skill:swift', 'skill:kotlin', 'skill:firebase'],
+    "Backend Development": ['skill:django', 'skill:flask', 'skill:spring', 'skill:node.js',
+                            'role:Backend Developer', 'role:Full Stack Developer'],
+    "Database Management": ['skill:mysql', 'skill:postgresql', 'skill:mongodb', 'skill:redis', 'skill:sqlite',
+                            'skill:firebase', 'skill:dynamodb', 'skill:elasticsearch'],
+    "DevOps": ['skill:docker', 'skill:kubernetes', 'skill:aws', 'skill:azure', 'skill:gcp', 'role:DevOps'],
+    "Blockchain": ['interest:blockchain'],
+    "Game Development": ['skill:c++', 'skill:c#', 'interest:gaming'],
+}
+
+COVERAGE_WEIGHT = 0.6
+SIZE_WEIGHT = 0.2
+INTEREST_WEIGHT = 0.2
+TOP_IDEAS = 3
+
+
+def _skill_terms(skill):
+    # Skills outside the idea board's list are matched by name
+    return IDEA_SKILL_TERMS.get(skill, [f"skill:{canonical_term(skill)}"])
+
+
+def _member_terms(member):
+    terms = {f"skill:{term}" for term in canonical_terms(participant_skills(member))}
+    terms.update(f"interest:{term}" for term in canonical_terms(member.get('interests') or []))
+    terms.add(f"role:{member.get('role_preference')}")
+    return terms
+
+
+class IdeaMatcher:
+    """Scores every team against every idea and matches them one to one
+
+    Teams are encoded as (teams x terms) matrices: which skills, roles and
+    interests any member has, and how many members share each interest.
+    Ideas are encoded as (ideas x skills) and (skills x terms) matrices, so
+    skill coverage is two matrix products; size fit and interest alignment
+    are array operations. The assignment maximizing the total score is found
+    with the Hungarian algorithm (linear_sum_assignment).
+    """
+
+    def __init__(self, teams, ideas):
+        self.teams = teams
+        self.ideas = ideas
+        self.terms = {}
+
+        def column(term):
+            return self.terms.setdefault(term, len(self.terms))
+
+        required = [list(dict.fromkeys(idea.get('required_skills') or [])) for idea in ideas]
+        skills = {skill: s for s, skill in enumerate(dict.fromkeys(skill for row in required for skill in row))}
+        skill_terms = [(skills[skill], column(term)) for skill in skills for term in _skill_terms(skill)]
+        team_terms = [(t, column(term)) for t, team in enumerate(teams)
+                      for member in team['members'] for term in _member_terms(member)]
+        categories = [column(f"interest:{canonical_term(idea.get('category', ''))}") for idea in ideas]
+
+        # Term counts per team: any count covers a skill, and interest counts measure alignment
+        counts = np.zeros((len(teams), len(self.terms)), dtype=np.float32)
+        np.add.at(counts, tuple(np.array(team_terms, dtype=np.intp).reshape(-1, 2).T), 1.0)
+        skill_matrix = np.zeros((len(skills), len(self.terms)), dtype=np.float32)
+        skill_matrix[tuple(np.array(skill_terms, dtype=np.intp).reshape(-1, 2).T)] = 1.0
+        idea_skills = np.zeros((len(ideas), len(skills)), dtype=np.float32)
+        for i, row in enumerate(required):
+            idea_skills[i, [skills[skill] for skill in row]] = 1.0
+
+        team_sizes = np.array([len(team['members']) for team in teams], dtype=np.float32)
+        idea_sizes = np.array([float(idea.get('team_size') or 1) for idea in ideas], dtype=np.float32)
+
+        covered = ((counts > 0).astype(np.float32) @ skill_matrix.T > 0).astype(np.float32)
+        needed = idea_skills.sum(axis=1)
+        self.coverage = np.divide(covered @ idea_skills.T, needed, out=np.ones((len(teams), len(ideas)),
+                                                                               dtype=np.float32), where=needed > 0)
+        self.size_fit = (np.minimum.outer(team_sizes, idea_sizes) /
+                         np.maximum(np.maximum.outer(team_sizes, idea_sizes), 1.0))
+        self.interest = counts[:, categories] / np.maximum(team_sizes, 1.0)[:, None]
+        self.scores = (COVERAGE_WEIGHT * self.coverage + SIZE_WEIGHT * self.size_fit +
+                       INTEREST_WEIGHT * self.interest)
+
+    def assign(self):
+        """One idea per team maximizing the total score, as (team, idea, score) index triples
+
+        With more teams than ideas some teams get none, and the other way around.
+        """
+        if not self.scores.size:
+            return []
+        teams, ideas = linear_sum_assignment(self.scores, maximize=True)
+        logger.info(f"Matched {len(teams)} teams to ideas, total score {self.scores[teams, ideas].sum():.2f}")
+        return [(int(t), int(i), float(self.scores[t, i])) for t, i in zip(teams, ideas)]
+
+    def top_ideas(self, k=TOP_IDEAS):
+        """Best k ideas of every team as (ideas, scores) arrays, best first"""
+        k = min(k, self.scores.shape[1])
+        if k == 0:
+            return np.zeros((len(self.teams), 0), dtype=np.intp), np.zeros((len(self.teams), 0))
+        best = np.argpartition(-self.scores, k - 1, axis=1)[:, :k]
+        order = np.argsort(-np.take_along_axis(self.scores, best, axis=1), axis=1, kind='stable')
+        best = np.take_along_axis(best, order, axis=1)
+        return best, np.take_along_axis(self.scores, best, axis=1)
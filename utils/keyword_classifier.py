@@ -0,0 +1,80 @@
+import logging
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+
+class KeywordClassifier:
+    """Assign labels to text by keyword containment
+
+    rules maps each label to the keywords that imply it. The keywords are
+    compiled into one Aho-Corasick automaton, so a single pass over the text
+    finds every keyword occurrence, including overlapping ones ("week" inside
+    "weekend"). Matching is case-insensitive substring containment.
+    """
+
+    def __init__(self, rules):
+        self.labels = list(rules)
+        self.all_labels_mask = (1 << len(self.labels)) - 1
+
+        # Trie with one dict of transitions and one label bitmask per state
+        self._goto = [{}]
+        self._output = [0]
+        for bit, keywords in enumerate(rules.values()):
+            for keyword in keywords:
+                self._add_keyword(keyword.lower(), 1 << bit)
+
+        self._fail = [0] * len(self._goto)
+        self._build_failure_links()
+
+    def _add_keyword(self, keyword, label_mask):
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._output.append(0)
+            state = next_state
+        self._output[state] |= label_mask
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                # A state also reports every keyword that is a suffix of it
+                self._output[next_state] |= self._output[self._fail[next_state]]
+
+    def classify(self, text):
+        """Bitmask of the labels whose keywords occur in text (bit i = labels[i])"""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+
+        state = 0
+        found = 0
+        for char in (text or '').lower():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            found |= output[state]
+            if found == self.all_labels_mask:
+                break
+        return found
+
+    def labels_for(self, text):
+        """Labels whose keywords occur in text"""
+        mask = self.classify(text)
+        return [label for bit, label in enumerate(self.labels) if mask >> bit & 1]
+
+    def matches(self, text, label):
+        """Whether text carries the given label"""
+        return bool(self.classify(text) >> self.labels.index(label) & 1)
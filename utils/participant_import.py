@@ -0,0 +1,223 @@
+import json
+import logging
+import os
+import re
+import time
+import numpy as np
+import pandas as pd
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# Choices offered by the registration form; imports are held to the same values
+PARTICIPANT_CHOICES = {
+    'experience_level': ["Beginner", "Intermediate", "Advanced", "Expert"],
+    'role_preference': ["Frontend Developer", "Backend Developer", "Full Stack Developer",
+                        "Data Scientist", "ML Engineer", "Designer", "Product Manager", "DevOps"],
+    'work_style': ["Individual focused", "Collaborative", "Mixed"],
+    'timezone': ["PST", "EST", "GMT", "CET", "IST", "JST", "Other"],
+    'availability': ["Full-time", "Part-time", "Weekends only"],
+    'communication_pref': ["Slack/Discord", "Email", "Video calls", "In-person"],
+}
+# Options of the registration form's multi-select fields; imports accept any values for these
+LIST_CHOICES = {
+    'programming_langs': ["Python", "JavaScript", "Java", "C++", "C#", "Go", "Rust", "Swift", "Kotlin", "PHP",
+                          "Ruby", "TypeScript"],
+    'frameworks': ["React", "Angular", "Vue.js", "Node.js", "Django", "Flask", "Spring", "TensorFlow", "PyTorch",
+                   "Scikit-learn", "Next.js"],
+    'databases': ["MySQL", "PostgreSQL", "MongoDB", "Redis", "SQLite", "Firebase", "DynamoDB", "Elasticsearch"],
+    'tools': ["Git", "Docker", "AWS", "Azure", "GCP", "Figma", "Adobe Creative Suite", "Jupyter", "Kubernetes"],
+    'interests': ["Web Development", "Mobile Apps", "AI/ML", "Blockchain", "IoT", "Gaming", "Fintech",
+                  "Healthcare", "Education", "Sustainability", "Social Impact", "AR/VR", "Cybersecurity"],
+}
+TEAM_SIZE_CHOICES = [3, 4, 5, 6]
+DEFAULT_TEAM_SIZE = 4
+
+REQUIRED_FIELDS = ['name', 'email', 'experience_level', 'role_preference']
+TEXT_FIELDS = ['name', 'email', 'bio', 'registered_at']
+LIST_FIELDS = ['programming_langs', 'frameworks', 'databases', 'tools', 'interests']
+PARTICIPANT_FIELDS = (['name', 'email', 'experience_level', 'role_preference', 'team_size_pref',
+                       'leadership_interest'] + LIST_FIELDS +
+                      ['bio', 'work_style', 'timezone', 'availability', 'communication_pref', 'registered_at'])
+
+EMAIL_PATTERN = r"[^@\s]+@[^@\s]+\.[^@\s]+"
+LIST_SEPARATOR = re.compile(r"\s*[;,|]\s*")
+TRUE_VALUES = {'true', 'yes', 'y', '1'}
+FALSE_VALUES = {'false', 'no', 'n', '0', ''}
+IMPORT_FORMATS = ['csv', 'json', 'jsonl']
+
+
+def detect_format(filename):
+    """Import format implied by a file name's extension"""
+    extension = os.path.splitext(str(filename))[1].lower().lstrip('.')
+    if extension == 'ndjson':
+        return 'jsonl'
+    if extension not in IMPORT_FORMATS:
+        raise ValueError(f"Unsupported import format: {filename}")
+    return extension
+
+
+def read_batches(source, file_format, batch_size=5000):
+    """Stream a participant file as DataFrames of at most batch_size rows
+
+    CSV and JSONL are parsed chunk by chunk, so only one batch is in memory
+    at a time. A JSON document has to be parsed whole; it may be a list of
+    participants or an object with a "participants" list.
+    """
+    if file_format == 'csv':
+        yield from pd.read_csv(source, dtype=str, keep_default_na=False, skipinitialspace=True,
+                               chunksize=batch_size)
+    elif file_format == 'jsonl':
+        yield from pd.read_json(source, lines=True, dtype=False, convert_dates=False, chunksize=batch_size)
+    elif file_format == 'json':
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, 'rb') as f:
+                document = json.load(f)
+        else:
+            document = json.load(source)
+        records = document.get('participants', []) if isinstance(document, dict) else document
+        if not isinstance(records, list):
+            raise ValueError("JSON import must be a list of participants")
+        for start in range(0, len(records), batch_size):
+            yield pd.DataFrame.from_records(records[start:start + batch_size])
+    else:
+        raise ValueError(f"Unsupported import format: {file_format}")
+
+
+def _text(frame, field):
+    if field not in frame:
+        return pd.Series('', index=frame.index, dtype=object)
+    return frame[field].fillna('').astype(str).str.strip()
+
+
+def _split_list(value):
+    if isinstance(value, (list, tuple)):
+        return [str(v).strip() for v in value if str(v).strip()]
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return []
+    return [v for v in LIST_SEPARATOR.split(str(value).strip()) if v]
+
+
+def _choice(values, choices):
+    # Case-insensitive match onto the canonical spelling; unknown values become NaN
+    return values.str.lower().map({choice.lower(): choice for choice in choices})
+
+
+def _contains(values, members):
+    return np.fromiter((value in members for value in values), dtype=bool, count=len(values))
+
+
+def _records(frame):
+    # Column lists hold native Python values, and zipping them beats DataFrame.to_dict
+    columns = list(frame.columns)
+    return [dict(zip(columns, row)) for row in zip(*(frame[c].tolist() for c in columns))]
+
+
+def validate_batch(frame):
+    """Normalize a batch of raw rows and check them column by column
+
+    Returns the normalized frame (restricted to PARTICIPANT_FIELDS) and a
+    dict mapping each failed check's message to a boolean row mask. Optional
+    choice fields that are left blank get the registration form's default.
+    """
+    frame = frame.reset_index(drop=True)
+    clean = pd.DataFrame(index=frame.index)
+    checks = {}
+
+    for field in TEXT_FIELDS:
+        clean[field] = _text(frame, field)
+    clean['email'] = clean['email'].str.lower()
+
+    for field in REQUIRED_FIELDS:
+        if field not in PARTICIPANT_CHOICES:
+            checks[f"missing {field}"] = (clean[field] == '').to_numpy()
+
+    checks["invalid email"] = ((clean['email'] != '') &
+                               ~clean['email'].str.fullmatch(EMAIL_PATTERN)).to_numpy()
+
+    for field, choices in PARTICIPANT_CHOICES.items():
+        raw = _text(frame, field)
+        values = _choice(raw, choices)
+        blank = (raw == '').to_numpy()
+        if field in REQUIRED_FIELDS:
+            checks[f"missing {field}"] = blank
+        else:
+            values = values.where(~blank, choices[0])
+        checks[f"invalid {field}"] = (~blank & values.isna()).to_numpy()
+        clean[field] = values.astype(object)
+
+    team_size = pd.to_numeric(_text(frame, 'team_size_pref'), errors='coerce')
+    team_size_blank = team_size.isna() & (_text(frame, 'team_size_pref') == '')
+    checks["invalid team_size_pref"] = (~team_size_blank & ~team_size.isin(TEAM_SIZE_CHOICES)).to_numpy()
+    clean['team_size_pref'] = team_size.fillna(DEFAULT_TEAM_SIZE).astype(int).astype(object)
+
+    leadership = _text(frame, 'leadership_interest').str.lower()
+    checks["invalid leadership_interest"] = (~leadership.isin(TRUE_VALUES | FALSE_VALUES)).to_numpy()
+    clean['leadership_interest'] = leadership.isin(TRUE_VALUES).astype(object)
+
+    for field in LIST_FIELDS:
+        clean[field] = frame[field].map(_split_list) if field in frame else [[] for _ in frame.index]
+
+    clean['registered_at'] = clean['registered_at'].where(clean['registered_at'] != '',
+                                                          datetime.now().isoformat())
+    return clean[PARTICIPANT_FIELDS], checks
+
+
+def import_participants(source, file_format, registry, update_existing=False, batch_size=5000,
+                        progress=None):
+    """Bulk-register participants from a CSV, JSON or JSONL file
+
+    Rows are validated a batch at a time and every batch's valid rows are
+    committed in one transaction. Emails seen earlier in the file are
+    rejected as duplicates; emails already registered are rejected unless
+    update_existing is set, in which case those participants are updated.
+    Returns a report with counts, throughput and the errors of each rejected
+    row (numbered from 1, not counting a CSV header).
+    """
+    started = time.perf_counter()
+    registry.refresh()
+    registered = set(registry.by_email)
+    seen = set()
+    report = {'rows': 0, 'imported': 0, 'updated': 0, 'rejected': 0, 'batches': 0, 'errors': []}
+
+    for batch in read_batches(source, file_format, batch_size):
+        first_row = report['rows'] + 1
+        clean, checks = validate_batch(batch)
+        emails = clean['email']
+
+        valid = ~np.logical_or.reduce(list(checks.values()))
+        repeated = _contains(emails, seen) | emails.where(valid).duplicated(keep='first').to_numpy()
+        checks["duplicate email in file"] = valid & repeated
+        valid &= ~repeated
+
+        existing = _contains(emails, registered)
+        if not update_existing:
+            checks["email already registered"] = valid & existing
+            valid &= ~existing
+
+        for message, mask in checks.items():
+            for position in np.flatnonzero(mask):
+                report['errors'].append({'row': first_row + int(position), 'email': emails.iat[position],
+                                         'error': message})
+
+        accepted = clean[valid]
+        if len(accepted):
+            registry.upsert_many(_records(accepted), update=update_existing)
+        seen.update(accepted['email'])
+
+        updated = int((valid & existing).sum())
+        report['updated'] += updated
+        report['imported'] += len(accepted) - updated
+        report['rejected'] += int((~valid).sum())
+        report['rows'] += len(clean)
+        report['batches'] += 1
+        if progress:
+            progress(report)
+
+    report['errors'].sort(key=lambda error: error['row'])
+    report['seconds'] = time.perf_counter() - started
+    report['rows_per_second'] = report['rows'] / report['seconds'] if report['seconds'] else 0.0
+    logger.info(f"Imported {report['imported']} participants, updated {report['updated']}, "
+                f"rejected {report['rejected']} of {report['rows']} rows "
+                f"({report['rows_per_second']:.0f} rows/s)")
+    return report
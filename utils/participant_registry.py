@@ -0,0 +1,166 @@
+import logging
+import threading
+from collections import defaultdict
+from utils.storage import DEFAULT_DB_PATH, get_storage, normalize_email
+from utils.tag_vocabulary import canonical_term, canonical_terms
+
+logger = logging.getLogger(__name__)
+
+SKILL_FIELDS = ['programming_langs', 'frameworks', 'databases', 'tools']
+
+
+def participant_skills(participant):
+    """Skills of a participant across all skill fields"""
+    skills = []
+    for field in SKILL_FIELDS:
+        values = participant.get(field, [])
+        skills.extend(values if isinstance(values, list) else [])
+    return skills
+
+
+class ParticipantRegistry:
+    """In-memory participant indexes over the participants table
+
+    Participants are held by id, with a hash index on normalized email and
+    secondary indexes (sets of ids) on role, experience level and skill, so
+    duplicate checks and lookups are O(1) and combined filters are set
+    intersections. The registry follows storage through its participants
+    revision counter: its own writes are applied in place, and a write from
+    another session or process triggers a reload on the next refresh().
+    """
+
+    def __init__(self, storage):
+        self.storage = storage
+        self._lock = threading.RLock()
+        self.revision = None
+        self.refresh()
+
+    def _clear(self):
+        self.by_id = {}
+        self.by_email = {}
+        self.by_role = defaultdict(set)
+        self.by_experience = defaultdict(set)
+        self.by_skill = defaultdict(set)
+        self.skill_labels = {}
+
+    def _index(self, participant):
+        participant_id = participant['id']
+        if participant_id in self.by_id:
+            self._unindex(self.by_id[participant_id])
+
+        self.by_id[participant_id] = participant
+        self.by_email[normalize_email(participant.get('email'))] = participant_id
+        self.by_role[participant.get('role_preference')].add(participant_id)
+        self.by_experience[participant.get('experience_level')].add(participant_id)
+        for skill in participant_skills(participant):
+            term = canonical_term(skill)
+            self.by_skill[term].add(participant_id)
+            self.skill_labels.setdefault(term, skill)
+
+    def _unindex(self, participant):
+        participant_id = participant['id']
+        self.by_role[participant.get('role_preference')].discard(participant_id)
+        self.by_experience[participant.get('experience_level')].discard(participant_id)
+        for skill in canonical_terms(participant_skills(participant)):
+            self.by_skill[skill].discard(participant_id)
+
+    def refresh(self):
+        """Reload from storage if anyone else has written participants since the last sync"""
+        with self._lock:
+            revision = self.storage.participants_revision()
+            if revision == self.revision:
+                return
+            self._clear()
+            for participant in self.storage.list_participants():
+                self._index(participant)
+            self.revision = revision
+            logger.info(f"Participant registry loaded {len(self.by_id)} participants")
+
+    def _after_write(self):
+        # Our write bumped the revision by one; anything more means another writer
+        revision = self.storage.participants_revision()
+        if revision == self.revision + 1:
+            self.revision = revision
+
+    def register(self, participant):
+        """Add a participant; returns its id, or None if the email is already registered"""
+        with self._lock:
+            self.refresh()
+            if normalize_email(participant.get('email')) in self.by_email:
+                return None
+
+            participant_id = self.storage.add_participant(participant)
+            if participant_id is None:
+                return None
+
+            self._index(dict(participant, id=participant_id))
+            self._after_write()
+            return participant_id
+
+    def upsert_many(self, participants, update=True):
+        """Insert participants in one transaction and index them in place
+
+        Already registered participants are updated, or skipped when update
+        is False. Returns the number of rows written.
+        """
+        with self._lock:
+            self.refresh()
+            count = self.storage.upsert_participants(participants, update=update)
+            ids = self.storage.participant_ids(p.get('email') for p in participants)
+            for participant in participants:
+                email = normalize_email(participant.get('email'))
+                if email in ids and (update or email not in self.by_email):
+                    self._index(dict(participant, id=ids[email]))
+            self._after_write()
+            return count
+
+    def __len__(self):
+        return len(self.by_id)
+
+    def all(self):
+        """Every participant in registration order"""
+        return list(self.by_id.values())
+
+    def get(self, participant_id):
+        return self.by_id.get(participant_id)
+
+    def find_by_email(self, email):
+        """Participant registered under an email address, or None"""
+        participant_id = self.by_email.get(normalize_email(email))
+        return None if participant_id is None else self.by_id[participant_id]
+
+    def query(self, role=None, experience=None, skills=None):
+        """Participants matching a role, an experience level and all given skills"""
+        with self._lock:
+            candidates = []
+            if role:
+                candidates.append(self.by_role.get(role, set()))
+            if experience:
+                candidates.append(self.by_experience.get(experience, set()))
+            for skill in skills or []:
+                candidates.append(self.by_skill.get(canonical_term(skill), set()))
+
+            if not candidates:
+                return self.all()
+            ids = set.intersection(*sorted(candidates, key=len))
+            return [self.by_id[i] for i in sorted(ids)]
+
+    def skill_options(self):
+        """Skills that at least one participant has, most common first"""
+        terms = sorted((term for term, ids in self.by_skill.items() if ids),
+                       key=lambda term: (-len(self.by_skill[term]), term))
+        return [self.skill_labels[term] for term in terms]
+
+
+_registries = {}
+_registries_lock = threading.Lock()
+
+
+def get_registry(path=DEFAULT_DB_PATH):
+    """Participant registry for a database file, shared by everything in this process"""
+    with _registries_lock:
+        if path not in _registries:
+            _registries[path] = ParticipantRegistry(get_storage(path))
+        registry = _registries[path]
+    registry.refresh()
+    return registry
@@ -0,0 +1,231 @@
+import hashlib
+import json
+import logging
+import threading
+import numpy as np
+from scipy import sparse
+from utils.hackathon_index import record_keys, record_digest
+from utils.tag_vocabulary import canonical_terms
+
+logger = logging.getLogger(__name__)
+
+SKILL_FIELDS = ['programming_langs', 'frameworks', 'databases', 'tools']
+
+
+def participant_key(participant):
+    """Identity of a participant (normalized email)"""
+    return str(participant.get('email', '')).strip().lower()
+
+
+def participant_digest(participant):
+    """Hash of the profile fields recommendations depend on"""
+    profile = {field: participant.get(field, []) for field in ['interests'] + SKILL_FIELDS}
+    return hashlib.sha1(json.dumps(profile, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+class HackathonRecommender:
+    """Top-k hackathon recommendations for every registered participant
+
+    Participants (interests, plus skills at a lower weight) and hackathons
+    (tags) are encoded as L2-normalized sparse vectors over a shared term
+    vocabulary, so a score is a cosine similarity. Scores are computed one
+    participant block at a time as a sparse x dense product against all
+    hackathons, and only the top k per participant are kept (argpartition).
+    A participant change rescores only that participant; new hackathons
+    are scored for everyone and merged into the existing top-k lists.
+    """
+
+    def __init__(self, k=5, skill_weight=0.5, block_size=512):
+        self.k = k
+        self.skill_weight = skill_weight
+        self.block_size = block_size
+        self.terms = {}
+
+        self.hackathon_keys = []
+        self.hackathon_rows = {}
+        self.hackathon_digests = {}
+        self.hackathon_records = {}
+        self.hackathon_live = np.zeros(0, dtype=bool)
+        self.hackathon_matrix = sparse.csr_matrix((0, 0), dtype=np.float32)
+        self.hackathon_version = None
+
+        self.participant_keys = []
+        self.participant_rows = {}
+        self.participant_digests = {}
+        self.participant_matrix = sparse.csr_matrix((0, 0), dtype=np.float32)
+        self.top_rows = np.zeros((0, k), dtype=np.int64)
+        self.top_scores = np.zeros((0, k), dtype=np.float32)
+
+        self._lock = threading.Lock()
+
+    def _encode(self, term_weights_list):
+        """Build a normalized CSR matrix from per-row {term: weight} dicts"""
+        indptr = [0]
+        indices = []
+        values = []
+        for term_weights in term_weights_list:
+            for term, weight in term_weights.items():
+                if term not in self.terms:
+                    self.terms[term] = len(self.terms)
+                indices.append(self.terms[term])
+                values.append(weight)
+            indptr.append(len(indices))
+
+        matrix = sparse.csr_matrix((np.array(values, dtype=np.float32), indices, indptr),
+                                   shape=(len(term_weights_list), len(self.terms)))
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        return sparse.diags(1 / np.maximum(norms, 1e-12).astype(np.float32)) @ matrix
+
+    def _hackathon_terms(self, record):
+        return {term: 1.0 for term in canonical_terms(record.get('tags', []))}
+
+    def _participant_terms(self, participant):
+        weights = {}
+        for field in SKILL_FIELDS:
+            for term in canonical_terms(participant.get(field, [])):
+                weights[term] = self.skill_weight
+        for term in canonical_terms(participant.get('interests', [])):
+            weights[term] = 1.0
+        return weights
+
+    def _aligned(self, matrix):
+        matrix = matrix.tocsr()
+        matrix.resize((matrix.shape[0], len(self.terms)))
+        return matrix
+
+    def _score(self, participant_rows, hackathon_rows=None):
+        """Top-k (rows, scores) for some participants against some hackathons"""
+        hackathon_matrix = self._aligned(self.hackathon_matrix)
+        live = self.hackathon_live
+        if hackathon_rows is not None:
+            hackathon_matrix = hackathon_matrix[hackathon_rows]
+            live = live[hackathon_rows]
+        else:
+            hackathon_rows = np.arange(hackathon_matrix.shape[0])
+
+        participant_matrix = self._aligned(self.participant_matrix)
+        top_rows = np.full((len(participant_rows), self.k), -1, dtype=np.int64)
+        top_scores = np.full((len(participant_rows), self.k), -np.inf, dtype=np.float32)
+        if hackathon_matrix.shape[0] == 0:
+            return top_rows, top_scores
+
+        k = min(self.k, hackathon_matrix.shape[0])
+        for start in range(0, len(participant_rows), self.block_size):
+            block = participant_rows[start:start + self.block_size]
+            # (hackathons x terms) @ (terms x block) -> dense (hackathons x block)
+            scores = np.ascontiguousarray((hackathon_matrix @ participant_matrix[block].T.toarray()).T)
+            scores[:, ~live] = -np.inf
+
+            best = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            best_scores = np.take_along_axis(scores, best, axis=1)
+            top_rows[start:start + len(block), :k] = hackathon_rows[best]
+            top_scores[start:start + len(block), :k] = best_scores
+
+        return self._sorted(top_rows, top_scores)
+
+    def _sorted(self, rows, scores):
+        order = np.argsort(-scores, axis=1, kind='stable')[:, :self.k]
+        return np.take_along_axis(rows, order, axis=1), np.take_along_axis(scores, order, axis=1)
+
+    def sync_hackathons(self, hackathons_data, version=None):
+        """Update the hackathon side, rescoring only what the change affects"""
+        with self._lock:
+            if version is not None and version == self.hackathon_version:
+                return
+            self.hackathon_version = version
+
+            keys = record_keys(hackathons_data)
+            digests = [record_digest(record) for record in hackathons_data]
+            current = dict(zip(keys, digests))
+
+            stale = [key for key, digest in self.hackathon_digests.items() if current.get(key) != digest]
+            fresh = [i for i, key in enumerate(keys) if self.hackathon_digests.get(key) != digests[i]]
+            if not stale and not fresh:
+                return
+
+            stale_rows = np.array([self.hackathon_rows.pop(key) for key in stale], dtype=np.int64)
+            for key in stale:
+                del self.hackathon_digests[key]
+                del self.hackathon_records[key]
+            self.hackathon_live[stale_rows] = False
+
+            start = len(self.hackathon_keys)
+            new_matrix = self._encode([self._hackathon_terms(hackathons_data[i]) for i in fresh])
+            self.hackathon_matrix = sparse.vstack([self._aligned(self.hackathon_matrix),
+                                                   self._aligned(new_matrix)]).tocsr()
+            self.hackathon_live = np.concatenate([self.hackathon_live, np.ones(len(fresh), dtype=bool)])
+            for offset, i in enumerate(fresh):
+                self.hackathon_keys.append(keys[i])
+                self.hackathon_rows[keys[i]] = start + offset
+                self.hackathon_digests[keys[i]] = digests[i]
+                self.hackathon_records[keys[i]] = hackathons_data[i]
+
+            if not self.participant_keys:
+                return
+
+            # Participants who lost a recommendation need a full rescore
+            lost = np.isin(self.top_rows, stale_rows).any(axis=1)
+            affected = lost.nonzero()[0]
+            if len(affected):
+                self.top_rows[affected], self.top_scores[affected] = self._score(affected)
+
+            # Everyone else only needs the new hackathons merged in
+            others = (~lost).nonzero()[0]
+            if len(fresh) and len(others):
+                new_rows = np.arange(start, len(self.hackathon_keys))
+                candidate_rows, candidate_scores = self._score(others, new_rows)
+                self.top_rows[others], self.top_scores[others] = self._sorted(
+                    np.concatenate([self.top_rows[others], candidate_rows], axis=1),
+                    np.concatenate([self.top_scores[others], candidate_scores], axis=1))
+            logger.info(f"Recommendations updated for {len(fresh)} new/changed hackathons")
+
+    def sync_participants(self, participants):
+        """Update the participant side, rescoring only new or edited profiles"""
+        with self._lock:
+            keys = [participant_key(p) for p in participants]
+            if set(self.participant_rows) - set(keys):
+                # Someone was removed: rebuild the participant side
+                self.participant_keys = []
+                self.participant_rows = {}
+                self.participant_digests = {}
+                self.participant_matrix = sparse.csr_matrix((0, len(self.terms)), dtype=np.float32)
+                self.top_rows = np.zeros((0, self.k), dtype=np.int64)
+                self.top_scores = np.zeros((0, self.k), dtype=np.float32)
+
+            changed = []
+            for key, participant in zip(keys, participants):
+                digest = participant_digest(participant)
+                if self.participant_digests.get(key) != digest:
+                    changed.append((key, participant))
+                    self.participant_digests[key] = digest
+            if not changed:
+                return
+
+            new_keys = [key for key, _ in changed if key not in self.participant_rows]
+            for key in new_keys:
+                self.participant_rows[key] = len(self.participant_keys)
+                self.participant_keys.append(key)
+
+            # Re-encode changed profiles in place and append new ones
+            encoded = self._encode([self._participant_terms(p) for _, p in changed])
+            matrix = self._aligned(self.participant_matrix).tolil()
+            matrix.resize((len(self.participant_keys), len(self.terms)))
+            rows = np.array([self.participant_rows[key] for key, _ in changed], dtype=np.int64)
+            matrix[rows] = encoded
+            self.participant_matrix = matrix.tocsr()
+
+            padding = len(self.participant_keys) - len(self.top_rows)
+            self.top_rows = np.vstack([self.top_rows, np.full((padding, self.k), -1, dtype=np.int64)])
+            self.top_scores = np.vstack([self.top_scores, np.full((padding, self.k), -np.inf, dtype=np.float32)])
+            self.top_rows[rows], self.top_scores[rows] = self._score(rows)
+            logger.info(f"Recommendations updated for {len(changed)} participants")
+
+    def recommend(self, participant, k=None):
+        """Recommended hackathons for a participant as (record, score) pairs"""
+        with self._lock:
+            row = self.participant_rows.get(participant_key(participant))
+            if row is None:
+                return []
+            return [(self.hackathon_records[self.hackathon_keys[h]], float(score))
+                    for h, score in zip(self.top_rows[row][:k or self.k], self.top_scores[row][:k or self.k])
+                    if h >= 0 and score > 0]
@@ -0,0 +1,296 @@
+import logging
+import sys
+from collections.abc import Mapping, Sequence
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# How each known field is stored:
+#   interned  - int32 code into the shared string pool (low-cardinality strings)
+#   text      - UTF-8 bytes in one buffer, addressed by offsets (free text)
+#   tags      - offsets into one int32 array of string-pool codes
+#   team_size - int32 (min, max) pair
+#   integer   - int64
+RECORD_FIELDS = {
+    'title': 'text',
+    'description': 'text',
+    'date': 'interned',
+    'registration_deadline': 'interned',
+    'location': 'interned',
+    'location_type': 'interned',
+    'source': 'interned',
+    'url': 'interned',
+    'tags': 'tags',
+    'prize': 'interned',
+    'duration': 'interned',
+    'team_size': 'team_size',
+    'prize_amount': 'integer',
+}
+FIELD_NAMES = list(RECORD_FIELDS)
+FIELD_BITS = {field: 1 << i for i, field in enumerate(FIELD_NAMES)}
+
+
+def deep_sizeof(obj, seen=None):
+    """Approximate memory held by an object graph, counting shared objects once"""
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    return size
+
+
+def _storable(kind, value):
+    """Whether a value round-trips exactly through a column of the given kind"""
+    if kind in ('interned', 'text'):
+        return type(value) is str
+    if kind == 'tags':
+        return type(value) is list and all(type(tag) is str for tag in value)
+    if kind == 'team_size':
+        return (type(value) is dict and list(value) == ['min', 'max'] and
+                all(type(v) is int and -2 ** 31 <= v < 2 ** 31 for v in value.values()))
+    if kind == 'integer':
+        return type(value) is int and -2 ** 63 <= value < 2 ** 63
+    return False
+
+
+class RecordView(Mapping):
+    """Read-only dict-compatible view of one record in a CompactRecordStore"""
+
+    __slots__ = ('_store', '_row')
+
+    def __init__(self, store, row):
+        self._store = store
+        self._row = row
+
+    def __getitem__(self, field):
+        return self._store.value(self._row, field)
+
+    def __iter__(self):
+        return iter(self._store.fields(self._row))
+
+    def __len__(self):
+        return len(self._store.fields(self._row))
+
+    def __contains__(self, field):
+        return field in self._store.fields(self._row)
+
+    def get(self, field, default=None):
+        try:
+            return self._store.value(self._row, field)
+        except KeyError:
+            return default
+
+    def to_dict(self):
+        """Materialize the record as a plain dict"""
+        return self._store.record(self._row)
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+
+class CompactRecordStore(Sequence):
+    """Struct-of-arrays storage for hackathon listings
+
+    Instead of one dict per listing, every known field lives in a column:
+    repeated strings (source, location, url, tags...) are interned into one
+    string pool and stored as int32 codes, free text is packed into a UTF-8
+    buffer, and tag lists are offsets into a flat array of codes. A presence
+    bitmask per record keeps missing keys distinct from empty values, and
+    anything that doesn't fit a column (unknown keys, unexpected types) is
+    kept as-is in a sparse extras dict. Indexing returns a RecordView, which
+    behaves like the original dict for reading.
+    """
+
+    def __init__(self, records):
+        records = list(records)
+        self.size = len(records)
+        self.strings = []
+        string_ids = {}
+
+        def intern(value):
+            if value not in string_ids:
+                string_ids[value] = len(self.strings)
+                self.strings.append(sys.intern(value))
+            return string_ids[value]
+
+        self.present = np.zeros(self.size, dtype=np.uint16)
+        self.extras = {}
+        self.columns = {}
+        self.text_offsets = {}
+        text_chunks = []
+        text_length = 0
+        tag_ids = []
+        tag_offsets = [0]
+
+        for field, kind in RECORD_FIELDS.items():
+            if kind == 'interned':
+                self.columns[field] = np.full(self.size, -1, dtype=np.int32)
+            elif kind == 'team_size':
+                self.columns[field] = np.zeros((self.size, 2), dtype=np.int32)
+            elif kind == 'integer':
+                self.columns[field] = np.zeros(self.size, dtype=np.int64)
+            elif kind == 'text':
+                self.text_offsets[field] = np.zeros((self.size, 2), dtype=np.int64)
+
+        for row, record in enumerate(records):
+            bits = 0
+            for field, value in record.items():
+                kind = RECORD_FIELDS.get(field)
+                if kind is None or not _storable(kind, value):
+                    self.extras.setdefault(row, {})[field] = value
+                    continue
+
+                bits |= FIELD_BITS[field]
+                if kind == 'interned':
+                    self.columns[field][row] = intern(value)
+                elif kind == 'text':
+                    encoded = value.encode('utf-8')
+                    self.text_offsets[field][row] = (text_length, text_length + len(encoded))
+                    text_chunks.append(encoded)
+                    text_length += len(encoded)
+                elif kind == 'tags':
+                    tag_ids.extend(intern(tag) for tag in value)
+                elif kind == 'team_size':
+                    self.columns[field][row] = (value['min'], value['max'])
+                else:
+                    self.columns[field][row] = value
+            tag_offsets.append(len(tag_ids))
+            self.present[row] = bits
+
+        self.text_buffer = np.frombuffer(b''.join(text_chunks), dtype=np.uint8)
+        self.tag_ids = np.array(tag_ids, dtype=np.int32)
+        self.tag_offsets = np.array(tag_offsets, dtype=np.int64)
+        # Footprint as plain dicts, estimated from an evenly spaced sample
+        sample = records[::max(1, self.size // 1000)]
+        self.dict_bytes_per_record = deep_sizeof(sample) / len(sample) if sample else 0.0
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [RecordView(self, i) for i in range(*row.indices(self.size))]
+        if row < 0:
+            row += self.size
+        if not 0 <= row < self.size:
+            raise IndexError("record index out of range")
+        return RecordView(self, row)
+
+    def __iter__(self):
+        return (RecordView(self, row) for row in range(self.size))
+
+    def fields(self, row):
+        """Keys of a record, in the order to_dict produces them"""
+        bits = int(self.present[row])
+        extras = self.extras.get(row, {})
+        names = [field for field in FIELD_NAMES if bits & FIELD_BITS[field] or field in extras]
+        return names + [field for field in extras if field not in RECORD_FIELDS]
+
+    def value(self, row, field):
+        """Decode one field of one record"""
+        extras = self.extras.get(row)
+        if extras and field in extras:
+            return extras[field]
+        bit = FIELD_BITS.get(field)
+        if bit is None or not self.present[row] & bit:
+            raise KeyError(field)
+
+        kind = RECORD_FIELDS[field]
+        if kind == 'interned':
+            return self.strings[self.columns[field][row]]
+        if kind == 'text':
+            start, end = self.text_offsets[field][row]
+            return self.text_buffer[start:end].tobytes().decode('utf-8')
+        if kind == 'tags':
+            codes = self.tag_ids[self.tag_offsets[row]:self.tag_offsets[row + 1]]
+            return [self.strings[code] for code in codes]
+        if kind == 'team_size':
+            low, high = self.columns[field][row]
+            return {'min': int(low), 'max': int(high)}
+        return int(self.columns[field][row])
+
+    def record(self, row):
+        """Materialize one record as a plain dict"""
+        return {field: self.value(row, field) for field in self.fields(row)}
+
+    def to_dicts(self):
+        """Materialize every record as a plain dict"""
+        return [self.record(row) for row in range(self.size)]
+
+    def compact_bytes(self):
+        """Memory held by the store's columns, pools and extras"""
+        arrays = [self.present, self.text_buffer, self.tag_ids, self.tag_offsets] + \
+            list(self.columns.values()) + list(self.text_offsets.values())
+        return sum(array.nbytes for array in arrays) + deep_sizeof(self.strings) + deep_sizeof(self.extras)
+
+    def memory_report(self):
+        """Bytes per record as plain dicts versus in this store"""
+        compact = self.compact_bytes() / max(self.size, 1)
+        before = self.dict_bytes_per_record
+        return {
+            'records': self.size,
+            'dict_bytes_per_record': before,
+            'compact_bytes_per_record': compact,
+            'reduction': 1 - compact / before if before else 0.0,
+        }
+
+    def to_arrays(self):
+        """Columns as named numpy arrays plus JSON-serializable metadata, for snapshots"""
+        arrays = {
+            'present': self.present,
+            'text_buffer': self.text_buffer,
+            'tag_ids': self.tag_ids,
+            'tag_offsets': self.tag_offsets,
+        }
+        arrays.update((f'column.{field}', column) for field, column in self.columns.items())
+        arrays.update((f'text.{field}', offsets) for field, offsets in self.text_offsets.items())
+        arrays['strings'], arrays['string_offsets'] = pack_strings(self.strings)
+
+        metadata = {
+            'size': self.size,
+            'fields': RECORD_FIELDS,
+            'extras': {str(row): values for row, values in self.extras.items()},
+            'dict_bytes_per_record': self.dict_bytes_per_record,
+        }
+        return arrays, metadata
+
+    @classmethod
+    def from_arrays(cls, arrays, metadata):
+        """Rebuild a store around existing (possibly memory-mapped) arrays"""
+        if metadata['fields'] != RECORD_FIELDS:
+            raise ValueError("Record layout differs from this version of the store")
+
+        store = cls.__new__(cls)
+        store.size = metadata['size']
+        store.present = arrays['present']
+        store.text_buffer = arrays['text_buffer']
+        store.tag_ids = arrays['tag_ids']
+        store.tag_offsets = arrays['tag_offsets']
+        store.columns = {field: arrays[f'column.{field}'] for field, kind in RECORD_FIELDS.items()
+                         if kind not in ('text', 'tags')}
+        store.text_offsets = {field: arrays[f'text.{field}'] for field, kind in RECORD_FIELDS.items()
+                              if kind == 'text'}
+        store.strings = [sys.intern(s) for s in unpack_strings(arrays['strings'], arrays['string_offsets'])]
+        store.extras = {int(row): values for row, values in metadata['extras'].items()}
+        store.dict_bytes_per_record = metadata['dict_bytes_per_record']
+        return store
+
+
+def pack_strings(strings):
+    """Encode a list of strings as one UTF-8 buffer and an offsets array"""
+    encoded = [s.encode('utf-8') for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    return np.frombuffer(b''.join(encoded), dtype=np.uint8), offsets
+
+
+def unpack_strings(buffer, offsets):
+    """Inverse of pack_strings"""
+    data = buffer.tobytes()
+    return [data[start:end].decode('utf-8') for start, end in zip(offsets[:-1].tolist(), offsets[1:].tolist())]
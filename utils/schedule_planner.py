@@ -0,0 +1,80 @@
+import logging
+from datetime import date
+import numpy as np
+from utils.tag_vocabulary import canonical_terms
+
+logger = logging.getLogger(__name__)
+
+
+class SchedulePlanner:
+    """Pick the most valuable set of hackathons whose dates don't overlap
+
+    Each event spans [date, date + duration_days - 1]. Its weight is its prize
+    money plus a bonus for every participant interest that matches its tags.
+    The best schedule is found with weighted interval scheduling: sort by end
+    date, binary-search each event's latest compatible predecessor, then one
+    dynamic-programming pass, O(n log n) overall.
+    """
+
+    def __init__(self, index, prize_weight=1.0, interest_weight=5000.0, min_gap_days=0):
+        self.index = index
+        self.prize_weight = prize_weight
+        self.interest_weight = interest_weight
+        self.min_gap_days = min_gap_days
+
+    def event_weights(self, ids, interests=None):
+        """Weight of each event: weighted prize plus interest-match bonus"""
+        ids = np.asarray(ids, dtype=np.int64)
+        weights = self.prize_weight * self.index.prize_amounts[ids]
+
+        interest_terms = canonical_terms(interests or [])
+        if interest_terms and self.interest_weight:
+            overlaps = np.fromiter((len(self.index.tag_terms[i] & interest_terms) for i in ids),
+                                   dtype=np.float64, count=len(ids))
+            weights = weights + self.interest_weight * overlaps
+
+        return weights
+
+    def plan(self, ids, interests=None, upcoming_only=True):
+        """Best non-overlapping schedule among ids
+
+        Returns the chosen ids in date order together with the total weight
+        and prize money of the schedule.
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        starts = self.index.date_ordinals[ids].astype(np.int64)
+
+        # Events without a known date can't be scheduled
+        keep = starts >= 0
+        if upcoming_only:
+            keep &= starts >= date.today().toordinal()
+        ids, starts = ids[keep], starts[keep]
+
+        weights = self.event_weights(ids, interests)
+        ends = starts + self.index.duration_days[ids] - 1
+
+        order = np.argsort(ends, kind='stable')
+        ids, starts, ends, weights = ids[order], starts[order], ends[order], weights[order]
+
+        # predecessor[j]: number of events that finish early enough to precede event j
+        predecessor = np.searchsorted(ends, starts - self.min_gap_days, side='left')
+
+        best = [0.0] * (len(ids) + 1)
+        for j in range(len(ids)):
+            best[j + 1] = max(best[j], best[predecessor[j]] + weights[j])
+
+        chosen = []
+        j = len(ids)
+        while j > 0:
+            if best[predecessor[j - 1]] + weights[j - 1] >= best[j - 1] and weights[j - 1] > 0:
+                chosen.append(int(ids[j - 1]))
+                j = predecessor[j - 1]
+            else:
+                j -= 1
+        chosen.reverse()
+
+        return {
+            'ids': chosen,
+            'score': float(best[-1]),
+            'total_prize': float(self.index.prize_amounts[chosen].sum()) if chosen else 0.0
+        }
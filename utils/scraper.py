@@ -3,6 +3,8 @@ import trafilatura
 from datetime import datetime
 import logging
 import time
+from utils.filter_cache import dataset_version
+from utils.snapshot import SNAPSHOT_DIR, write_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +34,12 @@ class HackathonScraper:
 
         return all_hackathons
 
+    def publish_snapshot(self, hackathons, version=None, snapshot_dir=SNAPSHOT_DIR):
+        """Write scraped hackathons as the current on-disk snapshot and return its version"""
+        version = version or dataset_version(hackathons)
+        write_snapshot(hackathons, version, root=snapshot_dir)
+        return version
+
     def scrape_source(self, source_name, url):
         """Scrape hackathons from a specific source"""
         try:
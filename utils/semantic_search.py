@@ -0,0 +1,193 @@
+import logging
+import os
+import threading
+import numpy as np
+from sklearn.decomposition import TruncatedSVD
+from sklearn.feature_extraction.text import TfidfVectorizer
+from utils.hackathon_index import record_keys, record_digest
+
+logger = logging.getLogger(__name__)
+
+
+def listing_text(record):
+    """Text a hackathon is embedded from"""
+    tags = record.get('tags', [])
+    tags = ' '.join(tags) if isinstance(tags, list) else str(tags or '')
+    return ' '.join([record.get('title', ''), record.get('description', ''), tags])
+
+
+class SemanticSearchIndex:
+    """Local vector index for "more like this" and free-text search over hackathons
+
+    Listings are embedded with TF-IDF followed by truncated SVD and stored
+    L2-normalized in a memory-mapped float32 matrix, so a query is one
+    matrix-vector product plus a partial sort. New listings are projected
+    with the fitted model and appended; the model is refitted only when the
+    vocabulary drifts or too many rows are stale.
+    """
+
+    def __init__(self, storage_dir="embeddings", n_components=128, drift_threshold=0.2,
+                 max_stale_fraction=0.5):
+        self.storage_dir = storage_dir
+        self.n_components = n_components
+        self.drift_threshold = drift_threshold
+        self.max_stale_fraction = max_stale_fraction
+
+        self.vectorizer = None
+        self.svd = None
+        self.vectors = None
+        self.vectors_path = None
+        self.row_keys = []
+        self.live = np.zeros(0, dtype=bool)
+        self.digests = {}
+        self.key_rows = {}
+        self.version = None
+        self._lock = threading.Lock()
+        self.ensure_storage_directory()
+
+    def ensure_storage_directory(self):
+        """Create the embeddings directory if it doesn't exist"""
+        if not os.path.exists(self.storage_dir):
+            os.makedirs(self.storage_dir)
+
+    def sync(self, hackathons_data, version=None):
+        """Bring the index up to date with a published dataset
+
+        Only added and changed listings are embedded, unless the vocabulary
+        has drifted enough to warrant a full re-embed.
+        """
+        with self._lock:
+            if version is not None and version == self.version:
+                return
+            self.version = version
+
+            keys = record_keys(hackathons_data)
+            digests = [record_digest(record) for record in hackathons_data]
+
+            if self.vectorizer is None:
+                self._fit(hackathons_data, keys, digests)
+                return
+
+            current = dict(zip(keys, digests))
+            stale = [key for key, digest in self.digests.items() if current.get(key) != digest]
+            fresh = [i for i, key in enumerate(keys) if self.digests.get(key) != digests[i]]
+            if not stale and not fresh:
+                return
+
+            fresh_texts = [listing_text(hackathons_data[i]) for i in fresh]
+            dead_rows = int((~self.live).sum()) + len(stale)
+            if (self.vocabulary_drift(fresh_texts) > self.drift_threshold or
+                    dead_rows > self.max_stale_fraction * (len(self.row_keys) + len(fresh))):
+                self._fit(hackathons_data, keys, digests)
+                return
+
+            for key in stale:
+                self.live[self.key_rows.pop(key)] = False
+                del self.digests[key]
+
+            self._append(self.embed(fresh_texts), [keys[i] for i in fresh])
+            for i in fresh:
+                self.digests[keys[i]] = digests[i]
+            logger.info(f"Embedded {len(fresh)} new or changed listings incrementally")
+
+    def vocabulary_drift(self, texts):
+        """Fraction of tokens in texts that the fitted vocabulary doesn't know"""
+        analyzer = self.vectorizer.build_analyzer()
+        vocabulary = self.vectorizer.vocabulary_
+        tokens = [token for text in texts for token in analyzer(text)]
+        if not tokens:
+            return 0.0
+        return sum(token not in vocabulary for token in tokens) / len(tokens)
+
+    def embed(self, texts):
+        """Project texts into the normalized embedding space"""
+        vectors = self.svd.transform(self.vectorizer.transform(texts)).astype(np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+    def _fit(self, hackathons_data, keys, digests):
+        texts = [listing_text(record) for record in hackathons_data]
+        self.vectorizer = TfidfVectorizer(stop_words='english', sublinear_tf=True)
+        try:
+            tfidf = self.vectorizer.fit_transform(texts)
+        except ValueError:
+            # Empty vocabulary (no data or only stop words)
+            self.vectorizer = None
+            return
+
+        n_components = max(1, min(self.n_components, tfidf.shape[0] - 1, tfidf.shape[1] - 1))
+        self.svd = TruncatedSVD(n_components=n_components, random_state=42)
+        self.svd.fit(tfidf)
+
+        # A full fit is deterministic, so the vectors file of a dataset version is reused when it
+        # holds exactly that fit (incremental appends make it longer) and rewritten otherwise
+        path = os.path.join(self.storage_dir, f"vectors_{self.version}.f32" if self.version else "vectors.f32")
+        size = len(texts) * n_components * np.dtype(np.float32).itemsize
+        reused = self.version is not None and os.path.exists(path) and os.path.getsize(path) == size
+        if not reused:
+            staging = f"{path}.{os.getpid()}.tmp"
+            self.embed(texts).tofile(staging)
+            os.replace(staging, path)
+        self.remove_stale_vectors(keep=path)
+
+        self.vectors_path = path
+        self.vectors = np.memmap(path, dtype=np.float32, mode='r', shape=(len(texts), n_components))
+        self.row_keys = list(keys)
+        self.key_rows = {key: row for row, key in enumerate(keys)}
+        self.live = np.ones(len(keys), dtype=bool)
+        self.digests = dict(zip(keys, digests))
+
+        action = "Reused embeddings of" if reused else "Embedded"
+        logger.info(f"{action} {len(texts)} listings with {n_components} dimensions")
+
+    def remove_stale_vectors(self, keep):
+        """Delete vectors files of other dataset versions, including those of earlier processes"""
+        for name in os.listdir(self.storage_dir):
+            path = os.path.join(self.storage_dir, name)
+            if name.startswith("vectors") and name.endswith(".f32") and path != keep:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def _append(self, vectors, keys):
+        if len(keys) == 0:
+            return
+
+        with open(self.vectors_path, 'ab') as f:
+            f.write(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+
+        start = len(self.row_keys)
+        self.row_keys.extend(keys)
+        self.key_rows.update((key, start + i) for i, key in enumerate(keys))
+        self.live = np.concatenate([self.live, np.ones(len(keys), dtype=bool)])
+        self.vectors = np.memmap(self.vectors_path, dtype=np.float32, mode='r',
+                                 shape=(len(self.row_keys), vectors.shape[1]))
+
+    def _top_k(self, query_vector, k, exclude_row=None):
+        scores = self.vectors @ query_vector
+        scores[~self.live] = -np.inf
+        if exclude_row is not None:
+            scores[exclude_row] = -np.inf
+
+        k = min(k, int(self.live.sum()) - (exclude_row is not None))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind='stable')]
+        return [(self.row_keys[row], float(scores[row])) for row in top]
+
+    def search(self, text, k=10):
+        """Listings most similar to a free-text query, as (record key, score) pairs"""
+        with self._lock:
+            if self.vectors is None or not text:
+                return []
+            return self._top_k(self.embed([text])[0], k)
+
+    def similar_to(self, key, k=10):
+        """Listings most similar to the listing with the given record key"""
+        with self._lock:
+            row = self.key_rows.get(key)
+            if self.vectors is None or row is None:
+                return []
+            return self._top_k(np.array(self.vectors[row]), k, exclude_row=row)
@@ -0,0 +1,131 @@
+import json
+import logging
+import os
+import shutil
+import numpy as np
+from datetime import datetime
+from utils.hackathon_index import HackathonIndex, CATEGORY_CLASSIFIER, DURATION_CLASSIFIER
+from utils.record_store import CompactRecordStore
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DIR = os.getenv("HACKHUB_SNAPSHOT_DIR", "snapshots")
+CURRENT_FILE = "CURRENT"
+MANIFEST_FILE = "manifest.json"
+
+
+class DatasetSnapshot:
+    """A published dataset version opened from disk
+
+    Every column of the record store and of the hackathon index is a
+    memory-mapped .npy file, so opening a snapshot reads only the small
+    string pools and manifest; record data is paged in on demand and the
+    page cache is shared by every process that maps the same files.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, MANIFEST_FILE), encoding='utf-8') as f:
+            self.manifest = json.load(f)
+        self.version = self.manifest['version']
+        self.store = CompactRecordStore.from_arrays(self._arrays('store'), self.manifest['store'])
+
+        metadata = self.manifest['index']
+        if (metadata['category_labels'] == CATEGORY_CLASSIFIER.labels and
+                metadata['duration_labels'] == DURATION_CLASSIFIER.labels):
+            self.index = HackathonIndex.from_arrays(self._arrays('index'), metadata)
+        else:
+            # Classification rules changed since the snapshot was written
+            self.index = HackathonIndex(self.store)
+
+    def _arrays(self, part):
+        return {name: np.load(os.path.join(self.path, part, f"{name}.npy"), mmap_mode='r')
+                for name in self.manifest[f'{part}_arrays']}
+
+
+def _write_arrays(directory, arrays):
+    os.makedirs(directory)
+    for name, array in arrays.items():
+        np.save(os.path.join(directory, f"{name}.npy"), np.ascontiguousarray(array))
+    return list(arrays)
+
+
+def write_snapshot(hackathons_data, version, root=SNAPSHOT_DIR, keep=3):
+    """Publish a dataset as the current snapshot and return its directory
+
+    The snapshot is written to a temporary directory and renamed into place
+    before the CURRENT pointer is swapped, so readers never see a partial
+    snapshot. Only the newest `keep` snapshots are retained.
+    """
+    os.makedirs(root, exist_ok=True)
+    path = os.path.join(root, version)
+
+    if not os.path.exists(path):
+        store = hackathons_data if isinstance(hackathons_data, CompactRecordStore) \
+            else CompactRecordStore(hackathons_data)
+        index = HackathonIndex(hackathons_data)
+        store_arrays, store_metadata = store.to_arrays()
+        index_arrays, index_metadata = index.to_arrays()
+
+        staging = os.path.join(root, f".{version}.{os.getpid()}.tmp")
+        shutil.rmtree(staging, ignore_errors=True)
+        manifest = {
+            'version': version,
+            'created_at': datetime.now().isoformat(),
+            'store_arrays': _write_arrays(os.path.join(staging, 'store'), store_arrays),
+            'index_arrays': _write_arrays(os.path.join(staging, 'index'), index_arrays),
+            'store': store_metadata,
+            'index': index_metadata,
+        }
+        with open(os.path.join(staging, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, default=str)
+
+        try:
+            os.rename(staging, path)
+        except OSError:
+            # Another process published the same version first
+            shutil.rmtree(staging, ignore_errors=True)
+
+    pointer = os.path.join(root, f".{CURRENT_FILE}.{os.getpid()}.tmp")
+    with open(pointer, 'w', encoding='utf-8') as f:
+        f.write(version)
+    os.replace(pointer, os.path.join(root, CURRENT_FILE))
+
+    prune_snapshots(root, keep)
+    logger.info(f"Published dataset snapshot {version}")
+    return path
+
+
+def current_snapshot_version(root=SNAPSHOT_DIR):
+    """Version the CURRENT pointer refers to, or None if nothing was published"""
+    try:
+        with open(os.path.join(root, CURRENT_FILE), encoding='utf-8') as f:
+            version = f.read().strip()
+    except OSError:
+        return None
+    return version if os.path.exists(os.path.join(root, version, MANIFEST_FILE)) else None
+
+
+def open_snapshot(version, root=SNAPSHOT_DIR):
+    """Open a published snapshot, or return None if it isn't available"""
+    path = os.path.join(root, version)
+    if not os.path.exists(os.path.join(path, MANIFEST_FILE)):
+        return None
+    try:
+        return DatasetSnapshot(path)
+    except (OSError, ValueError, KeyError) as e:
+        logger.error(f"Error opening snapshot {version}: {e}")
+        return None
+
+
+def prune_snapshots(root=SNAPSHOT_DIR, keep=3):
+    """Delete all but the newest `keep` snapshots, never the current one"""
+    current = current_snapshot_version(root)
+    snapshots = [name for name in os.listdir(root)
+                 if not name.startswith('.') and os.path.isdir(os.path.join(root, name))]
+    snapshots.sort(key=lambda name: os.path.getmtime(os.path.join(root, name)), reverse=True)
+
+    for name in snapshots[keep:]:
+        if name != current:
+            # Processes that still map an old snapshot keep their open file handles
+            shutil.rmtree(os.path.join(root, name), ignore_errors=True)
@@ -0,0 +1,377 @@
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from utils.hackathon_index import record_keys
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = os.getenv("HACKHUB_DB_PATH", "hackhub.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+
+CREATE TABLE IF NOT EXISTS hackathons (
+    record_key TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    generation TEXT NOT NULL,
+    title TEXT,
+    source TEXT,
+    date TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_hackathons_date ON hackathons(date);
+CREATE INDEX IF NOT EXISTS idx_hackathons_source ON hackathons(source);
+
+CREATE TABLE IF NOT EXISTS participants (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    email TEXT NOT NULL UNIQUE,
+    name TEXT,
+    experience_level TEXT,
+    role_preference TEXT,
+    registered_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_participants_role ON participants(role_preference);
+CREATE INDEX IF NOT EXISTS idx_participants_experience ON participants(experience_level);
+
+CREATE TABLE IF NOT EXISTS teams (
+    id INTEGER PRIMARY KEY,
+    created_at TEXT,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS ideas (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT,
+    category TEXT,
+    difficulty TEXT,
+    votes INTEGER NOT NULL DEFAULT 0,
+    submitted_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_ideas_category ON ideas(category);
+
+CREATE TABLE IF NOT EXISTS idea_comments (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    idea_id INTEGER NOT NULL REFERENCES ideas(id) ON DELETE CASCADE,
+    author TEXT,
+    text TEXT,
+    timestamp TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_idea_comments_idea ON idea_comments(idea_id);
+
+CREATE TABLE IF NOT EXISTS filter_presets (
+    name TEXT PRIMARY KEY,
+    saved_at TEXT,
+    query TEXT NOT NULL
+);
+"""
+
+
+def normalize_email(email):
+    """Canonical form of an email address used as the participant identity"""
+    return str(email or '').strip().lower()
+
+
+def _dumps(record):
+    return json.dumps(dict(record), ensure_ascii=False, default=str)
+
+
+class ConnectionPool:
+    """Reusable SQLite connections for one process
+
+    Streamlit runs every session on its own thread, so connections are
+    opened with check_same_thread=False and handed out one caller at a time.
+    Connections returned inside a transaction are closed, not reused.
+    """
+
+    def __init__(self, path, size=8, timeout=30.0):
+        self.path = path
+        self.size = size
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False,
+                               isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection, opening a new one while the pool isn't full"""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                create = self._created < self.size
+                if create:
+                    self._created += 1
+            conn = self._connect() if create else self._idle.get(timeout=self.timeout)
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                # A transaction that couldn't be closed would break the next BEGIN on this connection
+                logger.warning("Discarding a pooled connection left inside a transaction")
+                conn.close()
+                with self._lock:
+                    self._created -= 1
+            else:
+                self._idle.put(conn)
+
+
+class HackHubStorage:
+    """Persistent store for hackathons, participants, teams and ideas
+
+    Backed by SQLite in WAL mode, so readers never block the writer and
+    every session and worker process sees the same state. Records are kept
+    as JSON documents next to the indexed columns they are looked up by.
+    Multi-row writes run as single IMMEDIATE transactions.
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH, pool_size=8):
+        self.path = path
+        self.pool = ConnectionPool(path, size=pool_size)
+        with self.pool.connection() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def transaction(self):
+        """Connection inside a write transaction, committed on success"""
+        with self.pool.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except BaseException:
+                # A failed COMMIT (e.g. SQLITE_BUSY) leaves the transaction open too
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+
+    def _query(self, sql, params=()):
+        with self.pool.connection() as conn:
+            return conn.execute(sql, params).fetchall()
+
+    def counts(self):
+        """Number of hackathons, participants, teams and ideas"""
+        row = self._query("""
+            SELECT (SELECT COUNT(*) FROM hackathons) AS hackathons,
+                   (SELECT COUNT(*) FROM participants) AS participants,
+                   (SELECT COUNT(*) FROM teams) AS teams,
+                   (SELECT COUNT(*) FROM ideas) AS ideas
+        """)[0]
+        return dict(row)
+
+    # Hackathons
+
+    def replace_hackathons(self, hackathons_data, version):
+        """Make a dataset the stored one: upsert its records and drop the rest"""
+        rows = [(key, position, version, h.get('title'), h.get('source'), h.get('date'), _dumps(h))
+                for position, (key, h) in enumerate(zip(record_keys(hackathons_data), hackathons_data))]
+        with self.transaction() as conn:
+            conn.executemany("""
+                INSERT INTO hackathons (record_key, position, generation, title, source, date, data)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(record_key) DO UPDATE SET
+                    position = excluded.position, generation = excluded.generation,
+                    title = excluded.title, source = excluded.source, date = excluded.date,
+                    data = excluded.data
+            """, rows)
+            conn.execute("DELETE FROM hackathons WHERE generation != ?", (version,))
+            conn.execute("INSERT OR REPLACE INTO metadata (key, value) VALUES ('hackathons_version', ?)",
+                         (version,))
+        logger.info(f"Stored {len(rows)} hackathons (version {version})")
+
+    def hackathons_version(self):
+        """Version of the stored hackathon dataset, or None"""
+        rows = self._query("SELECT value FROM metadata WHERE key = 'hackathons_version'")
+        return rows[0]['value'] if rows else None
+
+    def list_hackathons(self):
+        """Stored hackathons in their published order"""
+        return [json.loads(row['data']) for row in self._query("SELECT data FROM hackathons ORDER BY position")]
+
+    # Participants
+
+    def _participant(self, row):
+        participant = json.loads(row['data'])
+        participant['id'] = row['id']
+        return participant
+
+    def add_participant(self, participant):
+        """Insert a participant; returns its id, or None if the email is taken"""
+        with self.transaction() as conn:
+            cursor = conn.execute("""
+                INSERT INTO participants (email, name, experience_level, role_preference, registered_at, data)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(email) DO NOTHING
+            """, self._participant_row(participant))
+            if not cursor.rowcount:
+                return None
+            self._bump_revision(conn, 'participants_revision')
+            return cursor.lastrowid
+
+    def upsert_participants(self, participants, update=True):
+        """Insert many participants in one transaction
+
+        Participants whose email is already registered are updated, or left
+        untouched when update is False. Returns the number of rows written.
+        """
+        rows = [self._participant_row(p) for p in participants]
+        conflict = """DO UPDATE SET
+                    name = excluded.name, experience_level = excluded.experience_level,
+                    role_preference = excluded.role_preference, data = excluded.data""" \
+            if update else "DO NOTHING"
+        with self.transaction() as conn:
+            before = conn.total_changes
+            conn.executemany(f"""
+                INSERT INTO participants (email, name, experience_level, role_preference, registered_at, data)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(email) {conflict}
+            """, rows)
+            written = conn.total_changes - before
+            self._bump_revision(conn, 'participants_revision')
+        return written
+
+    def _bump_revision(self, conn, key):
+        conn.execute("""
+            INSERT INTO metadata (key, value) VALUES (?, '1')
+            ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1
+        """, (key,))
+
+    def participants_revision(self):
+        """Counter bumped by every participant write, for cheap change detection"""
+        rows = self._query("SELECT value FROM metadata WHERE key = 'participants_revision'")
+        return int(rows[0]['value']) if rows else 0
+
+    def _participant_row(self, participant):
+        data = {k: v for k, v in participant.items() if k != 'id'}
+        return (normalize_email(participant.get('email')), participant.get('name'),
+                participant.get('experience_level'), participant.get('role_preference'),
+                participant.get('registered_at') or datetime.now().isoformat(), _dumps(data))
+
+    def participant_ids(self, emails):
+        """Map of normalized email to participant id for the given addresses"""
+        emails = list(dict.fromkeys(normalize_email(e) for e in emails))
+        ids = {}
+        with self.pool.connection() as conn:
+            for start in range(0, len(emails), 500):
+                chunk = emails[start:start + 500]
+                rows = conn.execute(f"SELECT email, id FROM participants WHERE email IN "
+                                    f"({','.join('?' * len(chunk))})", chunk).fetchall()
+                ids.update((row['email'], row['id']) for row in rows)
+        return ids
+
+    def get_participant_by_email(self, email):
+        """Participant registered under an email address, or None"""
+        rows = self._query("SELECT id, data FROM participants WHERE email = ?", (normalize_email(email),))
+        return self._participant(rows[0]) if rows else None
+
+    def list_participants(self):
+        """All participants in registration order"""
+        return [self._participant(row) for row in self._query("SELECT id, data FROM participants ORDER BY id")]
+
+    # Teams
+
+    def replace_teams(self, teams, settings=None):
+        """Store a generated set of teams, replacing the previous one, with the settings that produced it"""
+        created_at = datetime.now().isoformat()
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM teams")
+            conn.executemany("INSERT INTO teams (id, created_at, data) VALUES (?, ?, ?)",
+                             [(i, created_at, _dumps(team)) for i, team in enumerate(teams)])
+            if settings is not None:
+                conn.execute("INSERT OR REPLACE INTO metadata (key, value) VALUES ('team_settings', ?)",
+                             (_dumps(settings),))
+
+    def team_settings(self):
+        """Settings the current teams were generated with, or an empty dict"""
+        rows = self._query("SELECT value FROM metadata WHERE key = 'team_settings'")
+        return json.loads(rows[0]['value']) if rows else {}
+
+    def list_teams(self):
+        """Current teams in generation order"""
+        return [json.loads(row['data']) for row in self._query("SELECT data FROM teams ORDER BY id")]
+
+    # Ideas
+
+    def add_idea(self, idea):
+        """Insert an idea and return its id"""
+        data = {k: v for k, v in idea.items() if k not in ('id', 'votes', 'comments')}
+        with self.transaction() as conn:
+            cursor = conn.execute("""
+                INSERT INTO ideas (title, category, difficulty, votes, submitted_at, data)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (idea.get('title'), idea.get('category'), idea.get('difficulty'), idea.get('votes', 0),
+                  idea.get('submitted_at'), _dumps(data)))
+            return cursor.lastrowid
+
+    def vote_for_idea(self, idea_id):
+        """Add one vote to an idea"""
+        with self.transaction() as conn:
+            conn.execute("UPDATE ideas SET votes = votes + 1 WHERE id = ?", (idea_id,))
+
+    def add_idea_comment(self, idea_id, comment):
+        """Attach a comment to an idea"""
+        with self.transaction() as conn:
+            conn.execute("INSERT INTO idea_comments (idea_id, author, text, timestamp) VALUES (?, ?, ?, ?)",
+                         (idea_id, comment.get('author'), comment.get('text'), comment.get('timestamp')))
+
+    def list_ideas(self):
+        """All ideas with their votes and comments, in submission order"""
+        with self.pool.connection() as conn:
+            ideas = conn.execute("SELECT id, votes, data FROM ideas ORDER BY id").fetchall()
+            comments = conn.execute(
+                "SELECT idea_id, author, text, timestamp FROM idea_comments ORDER BY id").fetchall()
+
+        by_idea = {}
+        for row in comments:
+            by_idea.setdefault(row['idea_id'], []).append(
+                {'text': row['text'], 'author': row['author'], 'timestamp': row['timestamp']})
+
+        result = []
+        for row in ideas:
+            idea = json.loads(row['data'])
+            idea.update(id=row['id'], votes=row['votes'], comments=by_idea.get(row['id'], []))
+            result.append(idea)
+        return result
+
+    # Filter presets
+
+    def save_filter_preset(self, name, query):
+        """Store a filter query under a preset name, replacing a preset of the same name"""
+        with self.transaction() as conn:
+            conn.execute("INSERT OR REPLACE INTO filter_presets (name, saved_at, query) VALUES (?, ?, ?)",
+                         (name, datetime.now().isoformat(), _dumps(query)))
+
+    def list_filter_presets(self):
+        """Saved filter presets as dicts with name, saved_at and query, oldest first"""
+        return [{'name': row['name'], 'saved_at': row['saved_at'], 'query': json.loads(row['query'])}
+                for row in self._query("SELECT name, saved_at, query FROM filter_presets ORDER BY saved_at")]
+
+
+_storages = {}
+_storages_lock = threading.Lock()
+
+
+def get_storage(path=DEFAULT_DB_PATH):
+    """Storage for a database file, shared by everything in this process"""
+    with _storages_lock:
+        if path not in _storages:
+            _storages[path] = HackHubStorage(path)
+        return _storages[path]
@@ -0,0 +1,107 @@
+import logging
+from datetime import datetime, timedelta
+import numpy as np
+from utils.participant_import import PARTICIPANT_CHOICES, LIST_CHOICES, TEAM_SIZE_CHOICES, PARTICIPANT_FIELDS
+
+logger = logging.getLogger(__name__)
+
+# Shares of each choice, in the order of PARTICIPANT_CHOICES / TEAM_SIZE_CHOICES
+CHOICE_WEIGHTS = {
+    'experience_level': [0.30, 0.35, 0.25, 0.10],
+    'role_preference': [0.15, 0.15, 0.20, 0.12, 0.10, 0.10, 0.08, 0.10],
+    'work_style': [0.20, 0.45, 0.35],
+    'timezone': [0.20, 0.25, 0.12, 0.15, 0.15, 0.05, 0.08],
+    'availability': [0.50, 0.30, 0.20],
+    'communication_pref': [0.50, 0.15, 0.25, 0.10],
+}
+TEAM_SIZE_WEIGHTS = [0.20, 0.45, 0.25, 0.10]
+LEADERSHIP_RATE = [0.10, 0.20, 0.35, 0.50]
+PRODUCT_MANAGER_LEADERSHIP_BOOST = 0.30
+INTEREST_COUNT_WEIGHTS = [0.35, 0.40, 0.25]
+
+# Options are listed roughly by popularity; a role's typical skills and interests are much more likely
+POPULARITY_EXPONENT = 0.8
+ROLE_AFFINITY = 6.0
+ROLE_PROFILES = {
+    "Frontend Developer": ["JavaScript", "TypeScript", "React", "Angular", "Vue.js", "Next.js", "Firebase", "Figma",
+                           "Web Development", "Mobile Apps"],
+    "Backend Developer": ["Python", "Java", "Go", "Node.js", "Django", "Flask", "Spring", "PostgreSQL", "MySQL",
+                          "Redis", "Docker", "Web Development", "Fintech"],
+    "Full Stack Developer": ["JavaScript", "TypeScript", "Python", "React", "Node.js", "Next.js", "PostgreSQL",
+                             "MongoDB", "Docker", "Web Development", "Mobile Apps"],
+    "Data Scientist": ["Python", "Scikit-learn", "TensorFlow", "PyTorch", "PostgreSQL", "Jupyter", "AI/ML",
+                       "Healthcare", "Fintech"],
+    "ML Engineer": ["Python", "C++", "PyTorch", "TensorFlow", "Scikit-learn", "Jupyter", "Docker", "AWS", "AI/ML",
+                    "IoT"],
+    "Designer": ["JavaScript", "React", "Figma", "Adobe Creative Suite", "Gaming", "AR/VR", "Social Impact"],
+    "Product Manager": ["Python", "Git", "Figma", "Jupyter", "Fintech", "Healthcare", "Education"],
+    "DevOps": ["Go", "Python", "Docker", "Kubernetes", "AWS", "Azure", "GCP", "Git", "Redis", "Elasticsearch",
+               "Cybersecurity", "IoT"],
+}
+REGISTRATION_START = datetime(2026, 1, 1)
+REGISTRATION_INTERVAL = timedelta(seconds=37)
+
+
+def _weights(options, roles):
+    """Sampling weight of every option for every role (roles x options)"""
+    popularity = 1.0 / np.arange(1, len(options) + 1) ** POPULARITY_EXPONENT
+    weights = np.tile(popularity, (len(roles), 1))
+    for r, role in enumerate(roles):
+        profile = set(ROLE_PROFILES.get(role, ()))
+        weights[r, [o for o, option in enumerate(options) if option in profile]] *= ROLE_AFFINITY
+    return weights
+
+
+def _sample_lists(rng, options, role_index, counts, roles):
+    # Gumbel top-k: sorting log-weights plus Gumbel noise samples without replacement in proportion to weight
+    keys = np.log(_weights(options, roles))[role_index] + rng.gumbel(size=(len(role_index), len(options)))
+    counts = np.minimum(counts, len(options))
+    order = np.argsort(-keys, axis=1)[:, :counts.max(initial=0)]
+    return [[options[o] for o in row[:k]] for row, k in zip(order.tolist(), counts.tolist())]
+
+
+def generate_participants(n, seed=0):
+    """n synthetic participants with the fields of the registration form, reproducible for a seed
+
+    Categorical fields follow CHOICE_WEIGHTS; skills and interests favour
+    the most popular options and the typical ones for each participant's
+    role, and experienced participants list more skills and more often
+    want to lead.
+    """
+    rng = np.random.default_rng(seed)
+    fields = {field: rng.choice(len(choices), size=n, p=CHOICE_WEIGHTS[field])
+              for field, choices in PARTICIPANT_CHOICES.items()}
+    experience = fields['experience_level']
+    roles = PARTICIPANT_CHOICES['role_preference']
+    role_index = fields['role_preference']
+
+    level = experience + 1
+    counts = {
+        'programming_langs': rng.integers(1, level + 2),
+        'frameworks': rng.integers(0, level + 2),
+        'databases': rng.integers(0, level + 1),
+        'tools': rng.integers(0, level + 2),
+        'interests': rng.choice(len(INTEREST_COUNT_WEIGHTS), size=n, p=INTEREST_COUNT_WEIGHTS) + 1,
+    }
+    lists = {field: _sample_lists(rng, LIST_CHOICES[field], role_index, counts[field], roles)
+             for field in LIST_CHOICES}
+
+    leadership_rate = np.asarray(LEADERSHIP_RATE)[experience] + \
+        PRODUCT_MANAGER_LEADERSHIP_BOOST * (role_index == roles.index("Product Manager"))
+    columns = {field: [choices[c] for c in fields[field].tolist()] for field, choices in PARTICIPANT_CHOICES.items()}
+    columns.update(lists)
+    columns['name'] = [f"Participant {i}" for i in range(1, n + 1)]
+    columns['email'] = [f"participant{i}@example.com" for i in range(1, n + 1)]
+    columns['team_size_pref'] = np.asarray(TEAM_SIZE_CHOICES)[
+        rng.choice(len(TEAM_SIZE_CHOICES), size=n, p=TEAM_SIZE_WEIGHTS)].tolist()
+    columns['leadership_interest'] = (rng.random(n) < leadership_rate).tolist()
+    columns['bio'] = [f"{experience_level} {role.lower()} interested in {interests[0]}."
+                      for experience_level, role, interests in
+                      zip(columns['experience_level'], columns['role_preference'], columns['interests'])]
+    columns['registered_at'] = [(REGISTRATION_START + i * REGISTRATION_INTERVAL).isoformat() for i in range(n)]
+
+    # Zipping whole columns into records is much faster than filling one dict per participant field by field
+    participants = [dict(zip(PARTICIPANT_FIELDS, row)) for row in zip(*(columns[f] for f in PARTICIPANT_FIELDS))]
+
+    logger.info(f"Generated {n} synthetic participants (seed {seed})")
+    return participants
@@ -0,0 +1,35 @@
+# Participant interests (as offered at registration) and the hackathon tags
+# that mean the same thing. Both sides are mapped onto the interest names so
+# that "AI/ML" matches listings tagged "AI" or "Machine Learning".
+INTEREST_ALIASES = {
+    "Web Development": ['web development', 'web', 'frontend', 'backend'],
+    "Mobile Apps": ['mobile apps', 'mobile', 'apps', 'android', 'ios'],
+    "AI/ML": ['ai/ml', 'ai', 'machine learning', 'ml', 'artificial intelligence', 'deep learning',
+              'ai/machine learning'],
+    "Blockchain": ['blockchain', 'web3', 'crypto', 'defi'],
+    "IoT": ['iot', 'hardware', 'embedded'],
+    "Gaming": ['gaming', 'games', 'game development'],
+    "Fintech": ['fintech', 'finance'],
+    "Healthcare": ['healthcare', 'healthtech', 'health'],
+    "Education": ['education', 'edtech'],
+    "Sustainability": ['sustainability', 'environment', 'climate', 'cleantech'],
+    "Social Impact": ['social impact', 'social good', 'nonprofit'],
+    "AR/VR": ['ar/vr', 'ar', 'vr', 'xr'],
+    "Cybersecurity": ['cybersecurity', 'security'],
+}
+INTEREST_OPTIONS = list(INTEREST_ALIASES)
+
+_CANONICAL = {alias: interest.lower() for interest, aliases in INTEREST_ALIASES.items() for alias in aliases}
+
+
+def canonical_term(value):
+    """Map an interest, tag or skill onto the shared vocabulary"""
+    value = str(value).strip().lower()
+    return _CANONICAL.get(value, value)
+
+
+def canonical_terms(values):
+    """Set of shared-vocabulary terms for a list of interests, tags or skills"""
+    if not isinstance(values, (list, tuple, set)):
+        return set()
+    return {canonical_term(value) for value in values if value}
@@ -0,0 +1,211 @@
+import logging
+import math
+from collections import defaultdict, deque
+import numpy as np
+from utils.team_features import TIMEZONE_OFFSETS
+
+logger = logging.getLogger(__name__)
+
+
+class _OpenTeams:
+    """Teams with free seats, grouped by the timezone range they already span
+
+    There are only a handful of timezones, so there are few groups and
+    finding a team that can take a participant costs constant time.
+    """
+
+    def __init__(self, spread):
+        self.spread = spread
+        self.groups = defaultdict(deque)
+
+    def add(self, team, span):
+        self.groups[span if self.spread is not None else None].append(team)
+
+    def take(self, offset):
+        """Pop a team that stays within the spread with this offset, preferring no widening"""
+        best_teams, best_rank = None, None
+        for span, teams in self.groups.items():
+            if not teams:
+                continue
+            if span is None or offset is None:
+                rank = (span is None, 0.0)
+            else:
+                low, high = min(span[0], offset), max(span[1], offset)
+                if high - low > self.spread:
+                    continue
+                rank = (False, (high - low) - (span[1] - span[0]))
+            if best_rank is None or rank < best_rank:
+                best_teams, best_rank = teams, rank
+        return None if best_teams is None else best_teams.popleft()
+
+
+class TeamConstraints:
+    """Requirements every generated team has to meet
+
+    Teams hold between min_size and max_size members (both team_size when
+    given). With require_leader every team gets a potential leader, and each
+    of required_roles is represented in every team, as far as there are
+    enough such participants. With max_timezone_spread, no team's members
+    are more than that many hours apart (participants with an unknown
+    timezone fit anywhere).
+    """
+
+    def __init__(self, team_size=None, min_size=None, max_size=None, require_leader=False, required_roles=(),
+                 max_timezone_spread=None):
+        self.min_size = min_size if min_size is not None else team_size
+        self.max_size = max_size if max_size is not None else team_size
+        self.require_leader = require_leader
+        self.required_roles = list(required_roles)
+        self.max_timezone_spread = max_timezone_spread
+
+    def size_bounds(self, n, num_teams):
+        """Team size bounds, defaulting to an even split of n participants"""
+        return (self.min_size if self.min_size is not None else n // num_teams,
+                self.max_size if self.max_size is not None else math.ceil(n / num_teams))
+
+    def role_columns(self, features):
+        """Feature columns of the required roles that anyone has"""
+        return [features.role_names[role] for role in self.required_roles if role in features.role_names]
+
+    @staticmethod
+    def zone_offsets(features):
+        """UTC offset of every timezone column, None where unknown"""
+        return [TIMEZONE_OFFSETS.get(name) for name in features.timezone_names]
+
+    def check_feasibility(self, features, num_teams):
+        """Errors that rule out any valid teams, and warnings for requirements only partly met"""
+        errors, warnings = [], []
+        n = features.n
+        min_size, max_size = self.size_bounds(n, num_teams) if num_teams > 0 else (0, 0)
+
+        if num_teams < 1:
+            errors.append("At least one team is needed")
+        elif min_size > max_size:
+            errors.append(f"Minimum team size {min_size} exceeds the maximum {max_size}")
+        elif n < num_teams * min_size:
+            errors.append(f"{num_teams} teams of {min_size} need {num_teams * min_size} participants, "
+                          f"but only {n} are registered")
+        elif n > num_teams * max_size:
+            warnings.append(f"{n - num_teams * max_size} participants will not get a seat in {num_teams} teams "
+                            f"of at most {max_size}")
+
+        if self.require_leader and num_teams > 0:
+            leaders = int(features.leaders[:n].sum())
+            if leaders < num_teams:
+                warnings.append(f"Only {leaders} potential leaders for {num_teams} teams")
+
+        role_counts = features.roles[:n].sum(axis=0)
+        for role in self.required_roles:
+            count = int(role_counts[features.role_names[role]]) if role in features.role_names else 0
+            if count < num_teams:
+                warnings.append(f"Only {count} {role} participants for {num_teams} teams")
+
+        return errors, warnings
+
+    def build(self, features, num_teams):
+        """Seat participants into teams that meet the constraints, in linear time
+
+        Leaders are seated first, one per team and ordered by timezone so
+        they anchor teams across the timezones. Next, each required role
+        goes to the teams still missing it. Everyone else is then seated in
+        registration order, round-robin over the teams they fit (with a
+        timezone spread, those with an unknown timezone last). Returns the
+        teams as lists of participant indices and the unseated participants.
+        Raises ValueError if a team can't be filled to its minimum size.
+        """
+        n = features.n
+        min_size, max_size = self.size_bounds(n, num_teams)
+        spread = self.max_timezone_spread
+        offsets = self.zone_offsets(features)
+        offset_of = [offsets[z] for z in features.timezones[:n].argmax(axis=1).tolist()] if offsets else [None] * n
+        role_of = features.roles[:n].argmax(axis=1).tolist()
+        leaders = features.leaders[:n].tolist()
+
+        teams = [[] for _ in range(num_teams)]
+        spans = [None] * num_teams
+        team_roles = [set() for _ in range(num_teams)]
+        seated = [False] * n
+
+        def seat(i, team):
+            teams[team].append(i)
+            seated[i] = True
+            team_roles[team].add(role_of[i])
+            offset = offset_of[i]
+            if offset is not None:
+                span = spans[team]
+                spans[team] = (offset, offset) if span is None else (min(span[0], offset), max(span[1], offset))
+
+        if self.require_leader:
+            anchors = [i for i in range(n) if leaders[i]][:num_teams]
+            anchors.sort(key=lambda i: (offset_of[i] is None, offset_of[i] or 0.0))
+            for team, i in enumerate(anchors):
+                seat(i, team)
+
+        for role in self.role_columns(features):
+            open_teams = _OpenTeams(spread)
+            for team in range(num_teams):
+                if role not in team_roles[team] and len(teams[team]) < max_size:
+                    open_teams.add(team, spans[team])
+            for i in range(n):
+                if not seated[i] and role_of[i] == role:
+                    team = open_teams.take(offset_of[i])
+                    if team is None:
+                        if not any(open_teams.groups.values()):
+                            break
+                        continue
+                    seat(i, team)
+
+        open_teams = _OpenTeams(spread)
+        for team in range(num_teams):
+            if len(teams[team]) < max_size:
+                open_teams.add(team, spans[team])
+        order = range(n)
+        if spread is not None:
+            # Participants with an unknown timezone fit anywhere, so they take whatever seats are left
+            order = [i for i in order if offset_of[i] is not None] + [i for i in order if offset_of[i] is None]
+        for i in order:
+            if seated[i]:
+                continue
+            team = open_teams.take(offset_of[i])
+            if team is None:
+                if not any(open_teams.groups.values()):
+                    break
+                continue
+            seat(i, team)
+            if len(teams[team]) < max_size:
+                open_teams.add(team, spans[team])
+
+        short = [team for team in range(num_teams) if len(teams[team]) < min_size]
+        if short:
+            reason = f" within a {spread}-hour timezone spread" if spread is not None else ""
+            raise ValueError(f"Could not fill {len(short)} of {num_teams} teams to {min_size} members{reason}")
+
+        unseated = [i for i in range(n) if not seated[i]]
+        return teams, unseated
+
+    def violations(self, features, teams):
+        """Human-readable list of constraints the given teams break"""
+        problems = []
+        num_teams = len(teams)
+        min_size, max_size = self.size_bounds(sum(len(t) for t in teams), max(num_teams, 1))
+        offsets = self.zone_offsets(features)
+        zone_of = features.timezones.argmax(axis=1)
+        enough_leaders = features.leaders[:features.n].sum() >= num_teams
+        role_counts = features.roles[:features.n].sum(axis=0)
+
+        for number, team in enumerate(teams, 1):
+            members = np.asarray(team, dtype=np.intp)
+            if not min_size <= len(team) <= max_size:
+                problems.append(f"Team {number} has {len(team)} members")
+            if self.require_leader and enough_leaders and not features.leaders[members].any():
+                problems.append(f"Team {number} has no potential leader")
+            for role in self.required_roles:
+                column = features.role_names.get(role)
+                if column is not None and role_counts[column] >= num_teams and \
+                        not features.roles[members, column].any():
+                    problems.append(f"Team {number} has no {role}")
+            if self.max_timezone_spread is not None and len(team):
+                known = [offsets[z] for z in zone_of[members].tolist() if offsets[z] is not None]
+                if known and max(known) - min(known) > self.max_timezone_spread:
+                    problems.append(f"Team {number} spans {max(known) - min(known):g} hours")
+        return problems
@@ -0,0 +1,213 @@
+import logging
+import numpy as np
+from utils.participant_registry import participant_skills
+from utils.tag_vocabulary import canonical_term
+
+logger = logging.getLogger(__name__)
+
+EXPERIENCE_LEVELS = {'Beginner': 1, 'Intermediate': 2, 'Advanced': 3, 'Expert': 4}
+EXPERIENCE_RANGE = 3.0
+TIMEZONE_OFFSETS = {'PST': -8.0, 'EST': -5.0, 'GMT': 0.0, 'CET': 1.0, 'IST': 5.5, 'JST': 9.0}
+
+# Team-quality objectives, in the column order of ParticipantFeatures.team_objectives
+OBJECTIVES = ['skills', 'experience', 'roles', 'interests']
+PRIORITY_OBJECTIVES = {
+    "Skill Diversity": 'skills',
+    "Experience Balance": 'experience',
+    "Role Diversity": 'roles',
+    "Interest Alignment": 'interests',
+}
+PRIORITY_BOOST = 2.0
+ROLE_WEIGHT = 0.3
+
+# Column blocks of the feature matrix and the vocabulary attribute naming each block's columns
+FEATURE_BLOCKS = {
+    'skills': 'skill_terms',
+    'roles': 'role_names',
+    'interests': 'interest_names',
+    'availability': 'availability_names',
+    'timezones': 'timezone_names',
+}
+FEATURE_ARRAYS = ['matrix', 'experience', 'timezone_offset', 'leaders']
+
+
+def objective_weights(weight_skills, weight_experience, weight_interests, balance_priority=None):
+    """Weight vector over OBJECTIVES, with the balancing priority boosted"""
+    weights = np.array([weight_skills, weight_experience, ROLE_WEIGHT, weight_interests], dtype=np.float64)
+    if balance_priority in PRIORITY_OBJECTIVES:
+        weights[OBJECTIVES.index(PRIORITY_OBJECTIVES[balance_priority])] *= PRIORITY_BOOST
+    return weights
+
+
+def _vocabulary(values):
+    return {value: column for column, value in enumerate(dict.fromkeys(values))}
+
+
+def _multi_hot(rows, vocabulary, n):
+    # One extra all-zero row, so a member index of -1 (padding) contributes nothing
+    matrix = np.zeros((n + 1, len(vocabulary)), dtype=np.uint8)
+    for row, values in enumerate(rows):
+        matrix[row, [vocabulary[v] for v in values]] = 1
+    return matrix
+
+
+class ParticipantFeatures:
+    """Numeric feature matrix for one set of participants
+
+    Skills (canonicalized programming languages, frameworks, databases and
+    tools), roles, interests, availability and timezones are multi-hot or
+    one-hot blocks, experience is ordinal (1-4) and timezones also carry a
+    UTC offset. The blocks are column ranges of one uint8 matrix, so a team's
+    counts are a single row sum. Every array has one trailing zero row, so
+    teams can be given as a padded 2-D array of member indices with -1 in
+    the unused slots.
+    """
+
+    def __init__(self, participants):
+        self.n = n = len(participants)
+
+        skills = [sorted(set(canonical_term(s) for s in participant_skills(p)) - {''}) for p in participants]
+        roles = [[p.get('role_preference') or 'Unknown'] for p in participants]
+        interests = [sorted(set(p.get('interests') or [])) for p in participants]
+        availability = [[p.get('availability') or 'Unknown'] for p in participants]
+        timezones = [[p.get('timezone') or 'Other'] for p in participants]
+
+        self.skill_terms = _vocabulary(s for row in skills for s in row)
+        self.role_names = _vocabulary(r for row in roles for r in row)
+        self.interest_names = _vocabulary(i for row in interests for i in row)
+        self.availability_names = _vocabulary(a for row in availability for a in row)
+        self.timezone_names = _vocabulary(t for row in timezones for t in row)
+
+        blocks = {
+            'skills': _multi_hot(skills, self.skill_terms, n),
+            'roles': _multi_hot(roles, self.role_names, n),
+            'interests': _multi_hot(interests, self.interest_names, n),
+            'availability': _multi_hot(availability, self.availability_names, n),
+            'timezones': _multi_hot(timezones, self.timezone_names, n),
+        }
+        self.matrix = np.hstack([blocks[name] for name in FEATURE_BLOCKS])
+        self._split_blocks()
+
+        self.experience = np.zeros(n + 1, dtype=np.float32)
+        self.experience[:n] = [EXPERIENCE_LEVELS.get(p.get('experience_level'), 1) for p in participants]
+        self.timezone_offset = np.full(n + 1, np.nan, dtype=np.float32)
+        self.timezone_offset[:n] = [TIMEZONE_OFFSETS.get(row[0], np.nan) for row in timezones]
+        self.leaders = np.zeros(n + 1, dtype=bool)
+        self.leaders[:n] = [bool(p.get('leadership_interest', False)) for p in participants]
+
+        self.mean_experience = float(self.experience[:n].mean()) if n else 0.0
+        self.interest_scale = max(float(self.interests[:n].sum(axis=1).mean()) if n else 0.0, 1.0)
+
+    def _split_blocks(self):
+        # Per-block views onto the shared matrix
+        self.columns = {}
+        start = 0
+        for block, vocabulary in FEATURE_BLOCKS.items():
+            end = start + len(getattr(self, vocabulary))
+            self.columns[block] = slice(start, end)
+            setattr(self, block, self.matrix[:, start:end])
+            start = end
+
+    def to_arrays(self):
+        """Feature arrays by name plus JSON-serializable metadata, for sharing with worker processes"""
+        arrays = {name: getattr(self, name) for name in FEATURE_ARRAYS}
+        metadata = {vocabulary: list(getattr(self, vocabulary)) for vocabulary in FEATURE_BLOCKS.values()}
+        metadata.update(n=self.n, mean_experience=self.mean_experience, interest_scale=self.interest_scale)
+        return arrays, metadata
+
+    @classmethod
+    def from_arrays(cls, arrays, metadata):
+        """Rebuild features around existing (possibly memory-mapped) arrays"""
+        features = cls.__new__(cls)
+        features.n = metadata['n']
+        features.mean_experience = metadata['mean_experience']
+        features.interest_scale = metadata['interest_scale']
+        for vocabulary in FEATURE_BLOCKS.values():
+            setattr(features, vocabulary, _vocabulary(metadata[vocabulary]))
+        for name in FEATURE_ARRAYS:
+            setattr(features, name, arrays[name])
+        features._split_blocks()
+        return features
+
+    def subset(self, indices):
+        """Features of some of the participants, keeping the vocabulary and event-wide means"""
+        # Index -1 picks up the trailing zero row
+        rows = np.append(np.asarray(indices, dtype=np.intp), -1)
+        arrays, metadata = self.to_arrays()
+        metadata['n'] = len(rows) - 1
+        return ParticipantFeatures.from_arrays({name: array[rows] for name, array in arrays.items()}, metadata)
+
+    def aggregate_score(self, weights, size, distinct_skills, total_skills, experience_sum, distinct_roles,
+                        shared_interests, shared_availability):
+        """Weighted score of one team from its aggregates; scalar twin of objectives()"""
+        if size <= 0:
+            return 0.0
+        pairs = size * (size - 1) / 2
+        score = (weights[0] * distinct_skills / max(total_skills, 1) +
+                 weights[1] * (1.0 - abs(experience_sum / size - self.mean_experience) / EXPERIENCE_RANGE) +
+                 weights[2] * distinct_roles / max(min(size, len(self.role_names)), 1))
+        if pairs:
+            score += weights[3] * (0.5 * shared_interests / (pairs * self.interest_scale) +
+                                   0.5 * shared_availability / pairs)
+        return score
+
+    def team_counts(self, members):
+        """Per-team column counts of the feature matrix and experience sums"""
+        members = np.atleast_2d(np.asarray(members, dtype=np.intp))
+        # Adding one member slot at a time is much faster than a 3-D gather and sum
+        dtype = np.uint8 if members.shape[1] < 256 else np.int32
+        counts = np.zeros((len(members), self.matrix.shape[1]), dtype=dtype)
+        experience = np.zeros(len(members), dtype=np.float32)
+        for slot in members.T:
+            counts += self.matrix[slot]
+            experience += self.experience[slot]
+        return counts, experience
+
+    def objectives(self, size, distinct_skills, total_skills, experience_sum, distinct_roles,
+                   shared_interests, shared_availability):
+        """Objective columns from per-team aggregates (arrays of equal length)
+
+        skills: distinct skills over skill mentions, 1 when nobody overlaps
+        experience: 1 minus the team mean's distance from the event mean
+        roles: distinct roles over the most a team of that size could have
+        interests: share of member pairs with common interests and availability
+        """
+        size = np.asarray(size, dtype=np.float64)
+        pairs = size * (size - 1) / 2
+        has_pairs = pairs > 0
+        safe_pairs = np.where(has_pairs, pairs, 1.0)
+        safe_size = np.maximum(size, 1.0)
+
+        skills = distinct_skills / np.maximum(total_skills, 1.0)
+        experience = 1.0 - np.abs(experience_sum / safe_size - self.mean_experience) / EXPERIENCE_RANGE
+        roles = distinct_roles / np.maximum(np.minimum(size, len(self.role_names)), 1.0)
+        interests = np.where(has_pairs, 0.5 * shared_interests / (safe_pairs * self.interest_scale) +
+                             0.5 * shared_availability / safe_pairs, 0.0)
+        return np.column_stack([skills, experience * (size > 0), roles, interests])
+
+    def team_objectives(self, members):
+        """Objective matrix (teams x OBJECTIVES) for a padded array of member indices"""
+        members = np.atleast_2d(np.asarray(members, dtype=np.intp))
+        counts, experience = self.team_counts(members)
+        skill_counts = counts[:, self.columns['skills']]
+
+        def shared_pairs(block):
+            block = counts[:, self.columns[block]].astype(np.int32)
+            return (block * (block - 1)).sum(axis=1) // 2
+
+        return self.objectives(
+            (members >= 0).sum(axis=1),
+            np.count_nonzero(skill_counts, axis=1),
+            skill_counts.sum(axis=1, dtype=np.int32),
+            experience,
+            np.count_nonzero(counts[:, self.columns['roles']], axis=1),
+            shared_pairs('interests'),
+            shared_pairs('availability'),
+        )
+
+    def score_teams(self, members, weights, block_size=4096):
+        """Weighted quality score of every team in a padded member-index array"""
+        members = np.atleast_2d(np.asarray(members, dtype=np.intp))
+        # Blocks bound the (block x features) count matrices on large events
+        return np.concatenate([self.team_objectives(members[start:start + block_size]) @ weights
+                               for start in range(0, len(members), block_size)] or [np.zeros(0)])
@@ -1,45 +1,126 @@
-import random
 import logging
+import numpy as np
+from utils.team_features import ParticipantFeatures, OBJECTIVES, objective_weights
+from utils.team_constraints import TeamConstraints
+from utils.team_stats import TeamStats
+from utils.team_optimizer import TeamOptimizer, DEFAULT_TIME_BUDGET, optimize_restarts
+from utils.team_tracks import cluster_tracks, primary_interest_tracks, solve_tracks
+from utils.recommender import participant_key
 
 logger = logging.getLogger(__name__)
 
 
 class TeamMatcher:
-    """Simple team matching for hackathon team formation"""
+    """Team matching for hackathon team formation
 
-    def __init__(self, participants, weight_skills=0.3, weight_experience=0.3, weight_interests=0.4):
-        self.participants = participants
+    Participants are encoded once into a ParticipantFeatures matrix; team
+    quality is the weighted sum of the skill, experience, role and interest
+    objectives, scored for many candidate teams at a time.
+    """
 
-    def generate_teams(self, num_teams, team_size, balance_priority="Skill Diversity", include_leadership=True):
-        """Generate teams using simple balanced distribution"""
+    def __init__(self, participants, weight_skills=0.3, weight_experience=0.3, weight_interests=0.4, seed=None):
+        self.participants = participants
+        self.weight_skills = weight_skills
+        self.weight_experience = weight_experience
+        self.weight_interests = weight_interests
+        self.features = ParticipantFeatures(participants)
+        self.rng = np.random.default_rng(seed)
+
+    def weights(self, balance_priority=None):
+        """Objective weights from the sliders and the balancing priority"""
+        return objective_weights(self.weight_skills, self.weight_experience, self.weight_interests,
+                                 balance_priority)
+
+    def pad_teams(self, teams):
+        """Padded member-index array (-1 for empty slots) for lists of participant indices"""
+        members = np.full((len(teams), max((len(t) for t in teams), default=0)), -1, dtype=np.intp)
+        for row, team in enumerate(teams):
+            members[row, :len(team)] = team
+        return members
+
+    def optimize_partition(self, partition, weights, constraints=None, time_budget=DEFAULT_TIME_BUDGET,
+                           max_iterations=None):
+        """Improve a partition by simulated annealing; returns the best one found"""
+        optimizer = TeamOptimizer(self.features, weights, partition, constraints=constraints,
+                                  seed=int(self.rng.integers(2 ** 63)))
+        best = optimizer.optimize(time_budget=time_budget, max_iterations=max_iterations)
+        self.search_stats = optimizer.stats
+        return best
+
+    def optimize_parallel(self, partition, weights, constraints=None, time_budget=DEFAULT_TIME_BUDGET,
+                          workers=None, restarts=None):
+        """Improve a partition with independent restarts across worker processes; returns the best one"""
+        best, stats = optimize_restarts(self.features, weights, partition, restarts=restarts, workers=workers,
+                                        seed=int(self.rng.integers(2 ** 63)), time_budget=time_budget,
+                                        constraints=constraints)
+        self.search_stats = {
+            'iterations': sum(s['iterations'] for s in stats),
+            'accepted': sum(s['accepted'] for s in stats),
+            'initial_score': stats[0]['initial_score'],
+            'best_score': max(s['best_score'] for s in stats),
+            'seconds': max(s['seconds'] for s in stats),
+            'restarts': len(stats),
+        }
+        return best
+
+    def tracks(self, method, num_tracks=None):
+        """Interest track of every participant ('interest' or 'kmeans'), and the track names"""
+        if method == 'interest':
+            return primary_interest_tracks(self.participants)
+        if method == 'kmeans':
+            return cluster_tracks(self.features, num_tracks, seed=int(self.rng.integers(2 ** 31)))
+        raise ValueError(f"Unknown track method: {method}")
+
+    def generate_teams(self, num_teams, team_size, balance_priority="Skill Diversity", include_leadership=True,
+                       optimize=True, time_budget=DEFAULT_TIME_BUDGET, workers=1, restarts=None,
+                       required_roles=(), max_timezone_spread=None, sharding=None, num_tracks=None):
+        """Generate teams of exactly team_size that meet the constraints, improved by local search
+
+        Participants who don't fit into num_teams teams are left in
+        self.unassigned, and requirements that can only be partly met are
+        listed in self.constraint_warnings. With several workers or restarts
+        the search runs as parallel restarts, whose result is reproducible
+        for a given matcher seed. With sharding (a track method), teams are
+        formed within interest tracks instead, one track per worker task.
+        """
         try:
             if len(self.participants) < num_teams * 2:
                 raise ValueError("Not enough participants to form meaningful teams")
 
-            # Simple team formation by shuffling and distributing
-            participants_copy = self.participants.copy()
-            random.shuffle(participants_copy)
-
-            teams = []
-            participants_per_team = len(participants_copy) // num_teams
-
-            for i in range(num_teams):
-                start_idx = i * participants_per_team
-                if i == num_teams - 1:  # Last team gets remaining participants
-                    team_members = participants_copy[start_idx:]
+            constraints = TeamConstraints(team_size=team_size, require_leader=include_leadership,
+                                          required_roles=required_roles, max_timezone_spread=max_timezone_spread)
+            errors, self.constraint_warnings = constraints.check_feasibility(self.features, num_teams)
+            if errors:
+                raise ValueError("; ".join(errors))
+
+            weights = self.weights(balance_priority)
+            if sharding:
+                labels, track_names = self.tracks(sharding, num_tracks)
+                partition, team_tracks, unassigned, self.search_stats = solve_tracks(
+                    self.features, labels, track_names, num_teams, weights, constraints, optimize=optimize,
+                    time_budget=time_budget, workers=workers, seed=int(self.rng.integers(2 ** 63)))
+                problems = constraints.violations(self.features, partition)
+                if problems:
+                    self.constraint_warnings.append(f"{len(problems)} constraint issues in the track teams, "
+                                                    f"such as: {problems[0]}")
+            else:
+                team_tracks = None
+                partition, unassigned = constraints.build(self.features, num_teams)
+            if optimize and not sharding:
+                if workers > 1 or (restarts or 1) > 1:
+                    partition = self.optimize_parallel(partition, weights, constraints, time_budget,
+                                                       workers, restarts)
                 else:
-                    end_idx = start_idx + participants_per_team
-                    team_members = participants_copy[start_idx:end_idx]
+                    partition = self.optimize_partition(partition, weights, constraints, time_budget)
 
-                if team_members:
-                    teams.append(team_members)
-
-            # Balance teams if requested
-            if include_leadership:
-                teams = self.distribute_leaders(teams)
+            self.unassigned = [self.participants[i] for i in unassigned]
+            teams = [[self.participants[i] for i in team] for team in partition]
 
             # Format teams for output
-            formatted_teams = self.format_teams(teams)
+            formatted_teams = self.format_teams(teams, weights)
+            if team_tracks:
+                for team, track in zip(formatted_teams, team_tracks):
+                    team['track'] = track
 
             logger.info(f"Generated {len(formatted_teams)} teams successfully")
             return formatted_teams
@@ -48,91 +129,76 @@ class TeamMatcher:
             logger.error(f"Error generating teams: {e}")
             raise e
 
-    def distribute_leaders(self, teams):
-        """Ensure each team has at least one potential leader"""
-        # Collect all potential leaders
-        leaders = []
-        non_leaders = []
-
-        for team in teams:
-            for member in team:
-                if member.get('leadership_interest', False):
-                    leaders.append(member)
-                else:
-                    non_leaders.append(member)
-
-        # Redistribute to ensure each team has a leader if possible
-        if len(leaders) >= len(teams):
-            new_teams = []
-            leaders_distributed = 0
-
-            for i, team in enumerate(teams):
-                new_team = []
-                # Add one leader to each team
-                if leaders_distributed < len(leaders):
-                    new_team.append(leaders[leaders_distributed])
-                    leaders_distributed += 1
-
-                # Fill remaining spots with non-leaders and extra leaders
-                remaining_members = (len(team) - 1) if len(team) > 0 else 0
-                available_members = non_leaders + leaders[leaders_distributed:]
-
-                for j in range(min(remaining_members, len(available_members))):
-                    if available_members:
-                        new_team.append(available_members.pop(0))
-
-                new_teams.append(new_team)
-
-            return new_teams
-
-        return teams
-
-    def format_teams(self, teams):
+    def place_participants(self, teams, newcomers, balance_priority=None, constraints=None):
+        """Add late registrants to existing teams without regenerating them
+
+        teams are formatted teams whose members, like the newcomers, are
+        among this matcher's participants (matched by email). Each newcomer
+        takes the best free seat, or the seat a single moved member makes
+        for them (see TeamOptimizer.place); nobody else changes team.
+        Only the teams that change are updated, their statistics
+        incrementally. Returns the updated formatted teams and one placement
+        per newcomer.
+        """
+        index = {participant_key(p): i for i, p in enumerate(self.participants)}
+        partition = [[index[participant_key(m)] for m in team['members']] for team in teams]
+        if constraints is None:
+            constraints = TeamConstraints(max_size=max((len(team) for team in partition), default=0))
+
+        weights = self.weights(balance_priority)
+        optimizer = TeamOptimizer(self.features, weights, partition, constraints=constraints)
+        updated = [dict(team, members=list(team['members'])) for team in teams]
+        stats = [TeamStats.for_team(team) for team in teams]
+        changed = set()
+        placements = []
+        for newcomer in newcomers:
+            placed = optimizer.place(index[participant_key(newcomer)])
+            team, moved, overflow = placed if placed else (None, None, False)
+            if moved is not None:
+                moved = self.participants[moved]
+                target = optimizer.team_of[index[participant_key(moved)]]
+                key = participant_key(moved)
+                updated[team]['members'] = [m for m in updated[team]['members'] if participant_key(m) != key]
+                stats[team].remove(moved)
+                updated[target]['members'].append(moved)
+                stats[target].add(moved)
+                changed.add(target)
+            if team is not None:
+                updated[team]['members'].append(newcomer)
+                stats[team].add(newcomer)
+                changed.add(team)
+            placements.append({
+                'participant': newcomer,
+                'team': None if team is None else team + 1,
+                'moved': moved,
+                'overflow': overflow,
+            })
+
+        changed = sorted(changed)
+        objectives = self.features.team_objectives(
+            self.pad_teams([[index[participant_key(m)] for m in updated[t]['members']] for t in changed]))
+        for t, row in zip(changed, objectives):
+            updated[t].update(self.team_record(updated[t]['id'], updated[t]['members'], stats[t], row, weights))
+        logger.info(f"Placed {sum(p['team'] is not None for p in placements)} of {len(newcomers)} late registrants")
+        return updated, placements
+
+    def team_record(self, team_id, members, stats, objectives, weights):
+        """Formatted team from its members, statistics and objective values"""
+        return dict({
+            'id': team_id,
+            'members': members,
+            'match_score': round(float(objectives @ weights), 3),
+            'objectives': {name: round(float(value), 3) for name, value in zip(OBJECTIVES, objectives)},
+            'stats': stats.to_dict(),
+        }, **stats.summary())
+
+    def format_teams(self, teams, weights=None):
         """Format teams for output"""
-        formatted_teams = []
-
-        for i, team_members in enumerate(teams):
-            if team_members:  # Only include teams with actual members
-                team_data = {
-                    'id': i + 1,
-                    'members': team_members,
-                    'size': len(team_members),
-                    'avg_experience': self.calculate_team_experience(team_members),
-                    'role_diversity': len(set(m.get('role_preference', '') for m in team_members)),
-                    'has_leader': any(m.get('leadership_interest', False) for m in team_members),
-                    'common_skills': self.get_common_skills(team_members),
-                    'common_interests': self.get_common_interests(team_members)
-                }
-                formatted_teams.append(team_data)
-
-        return formatted_teams
-
-    def calculate_team_experience(self, members):
-        """Calculate average team experience level"""
-        exp_mapping = {'Beginner': 1, 'Intermediate': 2, 'Advanced': 3, 'Expert': 4}
-        experiences = [exp_mapping.get(m.get('experience_level', 'Beginner'), 1) for m in members]
-        return sum(experiences) / len(experiences) if experiences else 1.0
-
-    def get_common_skills(self, members):
-        """Get most common skills in team"""
-        skill_count = {}
-        for member in members:
-            for skill in member.get('programming_langs', []):
-                skill_count[skill] = skill_count.get(skill, 0) + 1
-            for skill in member.get('frameworks', []):
-                skill_count[skill] = skill_count.get(skill, 0) + 1
-
-        # Return top 5 skills sorted by frequency
-        sorted_skills = sorted(skill_count.items(), key=lambda x: x[1], reverse=True)
-        return [skill for skill, count in sorted_skills[:5]]
-
-    def get_common_interests(self, members):
-        """Get most common interests in team"""
-        interest_count = {}
-        for member in members:
-            for interest in member.get('interests', []):
-                interest_count[interest] = interest_count.get(interest, 0) + 1
-
-        # Return top 3 interests sorted by frequency
-        sorted_interests = sorted(interest_count.items(), key=lambda x: x[1], reverse=True)
-        return [interest for interest, count in sorted_interests[:3]]
\ No newline at end of file
+        weights = self.weights() if weights is None else weights
+        positions = {id(p): i for i, p in enumerate(self.participants)}
+        members = self.pad_teams([[positions[id(m)] for m in team] for team in teams])
+        objectives = self.features.team_objectives(members)
+
+        # Only include teams with actual members
+        return [self.team_record(i + 1, team_members, TeamStats(team_members), objectives[i], weights)
+                for i, team_members in enumerate(teams) if team_members]
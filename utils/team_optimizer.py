@@ -0,0 +1,402 @@
+import logging
+import math
+import os
+import random
+import tempfile
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from utils.team_features import ParticipantFeatures, FEATURE_ARRAYS
+from utils.team_constraints import TeamConstraints
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIME_BUDGET = 2.0
+MOVE_PROBABILITY = 0.2
+FINAL_TEMPERATURE_RATIO = 1e-3
+CHECK_INTERVAL = 256
+NOMINAL_ITERATIONS_PER_SECOND = 50000
+DEADLINE_SLACK = 3.0
+
+
+class TeamOptimizer:
+    """Simulated-annealing search over team assignments
+
+    Each team keeps running aggregates: skill, role, interest and
+    availability counts, the experience total, distinct skills and roles,
+    and shared-pair counts. Because of this, the score change of a proposed
+    swap or move is computed from the two participants' features alone,
+    without rescoring either team. Moves that would break a TeamConstraints
+    requirement the team currently meets are never proposed: sizes stay in
+    bounds, and no team loses its last leader or last member of a required
+    role, or stretches past the timezone spread. Each check is constant time.
+    """
+
+    def __init__(self, features, weights, teams, constraints=None, seed=None):
+        self.features = features
+        self.weights = [float(w) for w in weights]
+        self.random = random.Random(seed)
+        constraints = constraints or TeamConstraints()
+        self.keep_leaders = constraints.require_leader
+        self.required_roles = set(constraints.role_columns(features))
+        self.spread = constraints.max_timezone_spread
+        self.known_zones = [(zone, offset) for zone, offset in enumerate(constraints.zone_offsets(features))
+                            if offset is not None]
+
+        n = features.n
+        self.skills_of = [np.flatnonzero(row).tolist() for row in features.skills[:n]]
+        self.interests_of = [np.flatnonzero(row).tolist() for row in features.interests[:n]]
+        self.role_of = features.roles[:n].argmax(axis=1).tolist()
+        self.availability_of = features.availability[:n].argmax(axis=1).tolist()
+        self.experience = features.experience[:n].tolist()
+        self.leaders = features.leaders[:n].tolist()
+        self.zone_of = features.timezones[:n].argmax(axis=1).tolist() if features.timezones.shape[1] else [0] * n
+
+        sizes = [len(team) for team in teams]
+        self.min_size = constraints.min_size if constraints.min_size is not None else min(sizes, default=0)
+        self.max_size = constraints.max_size if constraints.max_size is not None else max(sizes, default=0)
+
+        self.members = []
+        self.team_of = [-1] * n
+        self.position = [0] * n
+        self.skill_counts, self.role_counts, self.interest_counts, self.availability_counts = [], [], [], []
+        self.zone_counts, self.leader_counts, self.aggregates, self.scores = [], [], [], []
+        for team in teams:
+            self._add_team(team)
+        self.assigned = [i for team in teams for i in team]
+
+    def _add_team(self, team):
+        t = len(self.members)
+        self.members.append([])
+        self.skill_counts.append([0] * self.features.skills.shape[1])
+        self.role_counts.append([0] * self.features.roles.shape[1])
+        self.interest_counts.append([0] * self.features.interests.shape[1])
+        self.availability_counts.append([0] * self.features.availability.shape[1])
+        self.zone_counts.append([0] * max(self.features.timezones.shape[1], 1))
+        self.leader_counts.append(0)
+        self.aggregates.append((0, 0, 0, 0.0, 0, 0, 0))
+        self.scores.append(0.0)
+        for i in team:
+            aggregates = self._changed(t, None, i)
+            self._insert(t, i)
+            self._set(t, aggregates)
+
+    def _score(self, aggregates):
+        return self.features.aggregate_score(self.weights, *aggregates)
+
+    def _changed(self, t, leaving, joining):
+        """Team t's aggregates after `leaving` goes and `joining` arrives (either may be None)"""
+        size, distinct, total, experience, roles, shared_interests, shared_availability = self.aggregates[t]
+        skill_counts, interest_counts = self.skill_counts[t], self.interest_counts[t]
+        role_counts, availability_counts = self.role_counts[t], self.availability_counts[t]
+        left_skills, left_interests, left_role, left_availability = (), (), -1, -1
+
+        if leaving is not None:
+            left_skills, left_interests = self.skills_of[leaving], self.interests_of[leaving]
+            left_role, left_availability = self.role_of[leaving], self.availability_of[leaving]
+            size -= 1
+            experience -= self.experience[leaving]
+            total -= len(left_skills)
+            distinct -= sum(1 for s in left_skills if skill_counts[s] == 1)
+            roles -= role_counts[left_role] == 1
+            shared_interests -= sum(interest_counts[k] - 1 for k in left_interests)
+            shared_availability -= availability_counts[left_availability] - 1
+
+        if joining is not None:
+            skills = self.skills_of[joining]
+            size += 1
+            experience += self.experience[joining]
+            total += len(skills)
+            distinct += sum(1 for s in skills if skill_counts[s] - (s in left_skills) == 0)
+            role = self.role_of[joining]
+            roles += role_counts[role] - (role == left_role) == 0
+            shared_interests += sum(interest_counts[k] - (k in left_interests) for k in self.interests_of[joining])
+            availability = self.availability_of[joining]
+            shared_availability += availability_counts[availability] - (availability == left_availability)
+
+        return size, distinct, total, experience, roles, shared_interests, shared_availability
+
+    def _remove(self, t, i):
+        members = self.members[t]
+        last = members.pop()
+        if last != i:
+            members[self.position[i]] = last
+            self.position[last] = self.position[i]
+        self._count(t, i, -1)
+
+    def _insert(self, t, i):
+        self.team_of[i] = t
+        self.position[i] = len(self.members[t])
+        self.members[t].append(i)
+        self._count(t, i, 1)
+
+    def _set(self, t, aggregates):
+        self.aggregates[t] = aggregates
+        self.scores[t] = self._score(aggregates)
+
+    def _commit(self, i, a, j, b, after_a, after_b):
+        # Both removals go first, so positions are read before either insert moves them
+        self._remove(a, i)
+        if j is not None:
+            self._remove(b, j)
+            self._insert(a, j)
+        self._insert(b, i)
+        self._set(a, after_a)
+        self._set(b, after_b)
+
+    def _count(self, t, i, step):
+        skill_counts, interest_counts = self.skill_counts[t], self.interest_counts[t]
+        for s in self.skills_of[i]:
+            skill_counts[s] += step
+        for k in self.interests_of[i]:
+            interest_counts[k] += step
+        self.role_counts[t][self.role_of[i]] += step
+        self.availability_counts[t][self.availability_of[i]] += step
+        self.zone_counts[t][self.zone_of[i]] += step
+        self.leader_counts[t] += step * self.leaders[i]
+
+    def _allowed(self, t, leaving, joining):
+        """Whether team t still meets the constraints it meets now after the exchange"""
+        if leaving is not None:
+            if self.keep_leaders and self.leaders[leaving] and self.leader_counts[t] == 1 and \
+                    not (joining is not None and self.leaders[joining]):
+                return False
+
+            role = self.role_of[leaving]
+            if role in self.required_roles and self.role_counts[t][role] == 1 and \
+                    not (joining is not None and self.role_of[joining] == role):
+                return False
+
+        if self.spread is not None and joining is not None:
+            zones = self.zone_counts[t]
+            joining_zone = self.zone_of[joining]
+            leaving_zone = self.zone_of[leaving] if leaving is not None else -1
+            present = [offset for zone, offset in self.known_zones
+                       if zones[zone] - (zone == leaving_zone) + (zone == joining_zone) > 0]
+            if present and max(present) - min(present) > self.spread:
+                return False
+        return True
+
+    def _propose(self):
+        """A random swap or move as (i, a, j, b) with j None for a move, or None if not allowed"""
+        rnd = self.random
+        i = self.assigned[rnd.randrange(len(self.assigned))]
+        a = self.team_of[i]
+        b = rnd.randrange(len(self.members) - 1)
+        b += b >= a
+
+        if (rnd.random() < MOVE_PROBABILITY and len(self.members[a]) > self.min_size and
+                len(self.members[b]) < self.max_size):
+            j = None
+        else:
+            if not self.members[b]:
+                return None
+            j = self.members[b][rnd.randrange(len(self.members[b]))]
+        if not (self._allowed(a, i, j) and self._allowed(b, j, i)):
+            return None
+        return i, a, j, b
+
+    def _delta(self, i, a, j, b):
+        after_a = self._changed(a, i, j)
+        after_b = self._changed(b, j, i)
+        delta = self._score(after_a) + self._score(after_b) - self.scores[a] - self.scores[b]
+        return delta, after_a, after_b
+
+    def _initial_temperature(self, samples=200):
+        deltas = []
+        for _ in range(samples):
+            proposal = self._propose()
+            if proposal:
+                delta = abs(self._delta(*proposal)[0])
+                if delta > 0:
+                    deltas.append(delta)
+        return float(np.mean(deltas)) if deltas else 1e-3
+
+    def _gain(self, t, leaving, joining):
+        after = self._changed(t, leaving, joining)
+        return self._score(after) - self.scores[t], after
+
+    def place(self, i):
+        """Seat an unassigned participant, moving at most one existing member
+
+        The participant joins the team with a free seat that gains the most,
+        in O(teams) gain evaluations. If every team they fit is full, one
+        member of such a team moves to a team with room so they can take the
+        seat; this repair scores each full-team member once against every
+        open team, O(members x open teams). Failing that they join the best
+        team they fit one over the size limit. Returns (team, moved,
+        overflow), where moved is the relocated member, or None if no team
+        fits within the constraints.
+        """
+        open_teams = [t for t in range(len(self.members)) if len(self.members[t]) < self.max_size]
+        best = None
+        for t in open_teams:
+            if self._allowed(t, None, i):
+                gain, after = self._gain(t, None, i)
+                if best is None or gain > best[0]:
+                    best = (gain, t, after)
+        if best:
+            _, t, after = best
+            self._seat(i, t, after)
+            return t, None, False
+
+        # Minimal repair: one member of a full team makes room by moving to a team with a free seat
+        full_teams = [t for t in range(len(self.members))
+                      if len(self.members[t]) >= self.max_size and self._allowed(t, None, i)]
+        # Best open team for each member who could make room, computed once
+        destinations = {}
+        for t in full_teams:
+            for m in self.members[t]:
+                gains = [(self._gain(b, None, m)[0], b) for b in open_teams if self._allowed(b, None, m)]
+                if gains:
+                    destinations[m] = max(gains, key=lambda g: g[0])
+        repair = None
+        for t in full_teams:
+            for m in self.members[t]:
+                if m not in destinations or not self._allowed(t, m, i):
+                    continue
+                move_gain, b = destinations[m]
+                gain = self._gain(t, m, i)[0] + move_gain
+                if repair is None or gain > repair[0]:
+                    repair = (gain, t, m, b)
+        if repair:
+            _, t, m, b = repair
+            self._commit(m, t, None, b, self._changed(t, m, None), self._changed(b, None, m))
+            self._seat(i, t, self._changed(t, None, i))
+            return t, m, False
+
+        overflow = None
+        for t in range(len(self.members)):
+            if len(self.members[t]) <= self.max_size and self._allowed(t, None, i):
+                gain, after = self._gain(t, None, i)
+                if overflow is None or gain > overflow[0]:
+                    overflow = (gain, t, after)
+        if overflow:
+            _, t, after = overflow
+            self._seat(i, t, after)
+            return t, None, True
+        return None
+
+    def _seat(self, i, t, after):
+        self._insert(t, i)
+        self._set(t, after)
+        self.assigned.append(i)
+
+    def assignment(self):
+        """Current teams as lists of participant indices"""
+        return [list(team) for team in self.members]
+
+    def total_score(self):
+        return sum(self.scores)
+
+    def optimize(self, time_budget=DEFAULT_TIME_BUDGET, max_iterations=None):
+        """Anneal until the time budget or iteration limit runs out; returns the best teams found
+
+        With an iteration limit the cooling schedule follows iterations and
+        the time budget is only a hard deadline, so unless the deadline cuts
+        the run short the result is fully determined by the seed. Without
+        one, the schedule follows elapsed time.
+        """
+        if len(self.members) < 2 or not self.assigned:
+            self.stats = {'iterations': 0, 'accepted': 0, 'initial_score': self.total_score(),
+                          'best_score': self.total_score(), 'seconds': 0.0, 'timed_out': False}
+            return self.assignment()
+
+        started = time.perf_counter()
+        start_temperature = self._initial_temperature()
+        temperature = start_temperature
+        initial = current = best = self.total_score()
+        best_assignment = self.assignment()
+        iterations = accepted = 0
+        timed_out = False
+
+        while True:
+            if iterations % CHECK_INTERVAL == 0:
+                elapsed = time.perf_counter() - started
+                timed_out = bool(time_budget) and elapsed >= time_budget
+                progress = iterations / max_iterations if max_iterations else elapsed / time_budget
+                if progress >= 1.0 or timed_out:
+                    break
+                temperature = start_temperature * FINAL_TEMPERATURE_RATIO ** progress
+                if current > best + 1e-12:
+                    best, best_assignment = current, self.assignment()
+            iterations += 1
+
+            proposal = self._propose()
+            if proposal is None:
+                continue
+            i, a, j, b = proposal
+            delta, after_a, after_b = self._delta(i, a, j, b)
+            if delta >= 0 or self.random.random() < math.exp(delta / temperature):
+                self._commit(i, a, j, b, after_a, after_b)
+                current += delta
+                accepted += 1
+
+        current = self.total_score()
+        if current > best:
+            best, best_assignment = current, self.assignment()
+
+        self.stats = {'iterations': iterations, 'accepted': accepted, 'initial_score': initial,
+                      'best_score': best, 'seconds': time.perf_counter() - started, 'timed_out': timed_out}
+        logger.info(f"Team search: {iterations} iterations, score {initial:.3f} -> {best:.3f}")
+        return best_assignment
+
+
+# Participant features of a worker process, mapped once by its initializer
+_worker_features = None
+
+
+def _init_worker(directory, metadata):
+    global _worker_features
+    arrays = {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode='r') for name in FEATURE_ARRAYS}
+    _worker_features = ParticipantFeatures.from_arrays(arrays, metadata)
+
+
+def _run_restart(task, features=None):
+    seed, partition, weights, constraints, max_iterations, deadline = task
+    optimizer = TeamOptimizer(features if features is not None else _worker_features, weights, partition,
+                              constraints=constraints, seed=seed)
+    best = optimizer.optimize(time_budget=deadline, max_iterations=max_iterations)
+    return best, optimizer.stats
+
+
+def optimize_restarts(features, weights, partition, restarts=None, workers=None, seed=None,
+                      time_budget=DEFAULT_TIME_BUDGET, constraints=None):
+    """Run independent annealing restarts in worker processes and keep the best result
+
+    Each restart runs a fixed number of iterations derived from the time
+    budget, from its own seed spawned from `seed`, so the outcome depends
+    only on the seed and the number of restarts (one per worker unless
+    given), not on scheduling. A hard deadline of DEADLINE_SLACK times the
+    budget still applies. Workers memory-map the feature matrix from .npy
+    files instead of receiving a pickled copy per task, and are spawned
+    rather than forked because the Streamlit server is multi-threaded.
+    Returns the best partition and the stats of every restart.
+    """
+    workers = max(1, workers or os.cpu_count() or 1)
+    restarts = restarts or workers
+    max_iterations = max(CHECK_INTERVAL, int(time_budget * NOMINAL_ITERATIONS_PER_SECOND))
+    seeds = [int(child.generate_state(1, np.uint64)[0]) for child in np.random.SeedSequence(seed).spawn(restarts)]
+    tasks = [(restart_seed, partition, weights, constraints, max_iterations, time_budget * DEADLINE_SLACK)
+             for restart_seed in seeds]
+
+    if workers == 1 or restarts == 1:
+        results = [_run_restart(task, features) for task in tasks]
+    else:
+        with tempfile.TemporaryDirectory(prefix="team_features_") as directory:
+            arrays, metadata = features.to_arrays()
+            for name, array in arrays.items():
+                np.save(os.path.join(directory, f"{name}.npy"), np.ascontiguousarray(array))
+            with ProcessPoolExecutor(max_workers=min(workers, restarts), mp_context=get_context('spawn'),
+                                     initializer=_init_worker, initargs=(directory, metadata)) as pool:
+                results = list(pool.map(_run_restart, tasks))
+
+    if any(stats['timed_out'] for _, stats in results):
+        logger.warning("Team search restarts hit their deadline; the result may vary between runs")
+
+    # Ties go to the lowest restart so the choice doesn't depend on completion order
+    best = max(range(restarts), key=lambda r: (results[r][1]['best_score'], -r))
+    logger.info(f"Best of {restarts} restarts on {workers} workers: restart {best}, "
+                f"score {results[best][1]['best_score']:.3f}")
+    return results[best][0], [stats for _, stats in results]
@@ -0,0 +1,99 @@
+import logging
+from collections import Counter
+from utils.team_features import EXPERIENCE_LEVELS
+
+logger = logging.getLogger(__name__)
+
+SKILL_FIELDS = ['programming_langs', 'frameworks']
+TOP_SKILLS = 5
+TOP_INTERESTS = 3
+
+
+class TeamStats:
+    """Running statistics of one team's members
+
+    Role, skill (languages and frameworks) and interest counts are Counters
+    and experience and leaders are running sums, so adding or removing a
+    member costs O(that member's skills and interests) instead of a pass
+    over the whole team. Serializes to a plain dict, which is stored with
+    the team so views read the statistics instead of recomputing them.
+    """
+
+    def __init__(self, members=()):
+        self.size = 0
+        self.experience_sum = 0
+        self.leaders = 0
+        self.roles = Counter()
+        self.skills = Counter()
+        self.interests = Counter()
+        for member in members:
+            self.add(member)
+
+    def _apply(self, counter, values, step):
+        for value in values:
+            counter[value] += step
+            if counter[value] <= 0:
+                del counter[value]
+
+    def _update(self, member, step):
+        self.size += step
+        self.experience_sum += step * EXPERIENCE_LEVELS.get(member.get('experience_level'), 1)
+        self.leaders += step * bool(member.get('leadership_interest', False))
+        self._apply(self.roles, [member.get('role_preference') or 'Unknown'], step)
+        self._apply(self.skills, [skill for field in SKILL_FIELDS for skill in member.get(field) or []], step)
+        self._apply(self.interests, member.get('interests') or [], step)
+
+    def add(self, member):
+        self._update(member, 1)
+
+    def remove(self, member):
+        self._update(member, -1)
+
+    @property
+    def avg_experience(self):
+        return self.experience_sum / self.size if self.size else 1.0
+
+    @property
+    def experience_level(self):
+        """Experience level closest to the team average"""
+        for level, value in EXPERIENCE_LEVELS.items():
+            if self.avg_experience < value + 0.5:
+                return level
+        return level
+
+    def top_skills(self, n=TOP_SKILLS):
+        return [skill for skill, _ in self.skills.most_common(n)]
+
+    def top_interests(self, n=TOP_INTERESTS):
+        return [interest for interest, _ in self.interests.most_common(n)]
+
+    def summary(self):
+        """Team fields derived from the statistics"""
+        return {
+            'size': self.size,
+            'avg_experience': self.avg_experience,
+            'role_diversity': len(self.roles),
+            'has_leader': self.leaders > 0,
+            'common_skills': self.top_skills(),
+            'common_interests': self.top_interests(),
+        }
+
+    def to_dict(self):
+        return {'size': self.size, 'experience_sum': self.experience_sum, 'leaders': self.leaders,
+                'roles': dict(self.roles), 'skills': dict(self.skills), 'interests': dict(self.interests)}
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls()
+        stats.size = data['size']
+        stats.experience_sum = data['experience_sum']
+        stats.leaders = data['leaders']
+        stats.roles = Counter(data['roles'])
+        stats.skills = Counter(data['skills'])
+        stats.interests = Counter(data['interests'])
+        return stats
+
+    @classmethod
+    def for_team(cls, team):
+        """Statistics of a formatted team, built from its members if it has none stored"""
+        return cls.from_dict(team['stats']) if 'stats' in team else cls(team['members'])
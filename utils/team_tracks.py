@@ -0,0 +1,208 @@
+import logging
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from sklearn.cluster import KMeans
+from utils.team_features import ParticipantFeatures
+from utils.team_optimizer import TeamOptimizer, CHECK_INTERVAL, NOMINAL_ITERATIONS_PER_SECOND, DEADLINE_SLACK
+
+logger = logging.getLogger(__name__)
+
+# How participants are sharded into tracks: by the first interest they list, or by clustering interest vectors
+TRACK_METHODS = {
+    'interest': "Primary interest",
+    'kmeans': "Interest clusters (k-means)",
+}
+SHARDING_THRESHOLD = 20000
+NO_INTEREST_TRACK = "No interests listed"
+MIXED_TRACK = "Mixed"
+CENTROID_SHARE = 0.5
+MIN_TRACK_DEADLINE = 0.1
+
+
+def primary_interest_tracks(participants):
+    """Track label of every participant by the first interest they list, and the track names"""
+    names = {}
+    labels = np.fromiter((names.setdefault((p.get('interests') or [NO_INTEREST_TRACK])[0], len(names))
+                          for p in participants), dtype=np.intp, count=len(participants))
+    return labels, list(names)
+
+
+def cluster_tracks(features, num_tracks=None, seed=None):
+    """Track label of every participant by k-means over interest vectors, and the track names
+
+    Interest vectors only take a few hundred distinct values even at large
+    events, so k-means runs on the distinct vectors weighted by how many
+    participants share them. A track is named after the interests held by
+    at least CENTROID_SHARE of its members, or its most common interest.
+    """
+    interests = features.interests[:features.n]
+    vectors, labels, counts = np.unique(interests, axis=0, return_inverse=True, return_counts=True)
+    num_tracks = min(num_tracks or max(len(features.interest_names), 1), len(vectors))
+    kmeans = KMeans(n_clusters=num_tracks, n_init=4, random_state=seed)
+    clusters = kmeans.fit_predict(vectors.astype(np.float32), sample_weight=counts)
+    interest_names = list(features.interest_names)
+    names = []
+    for track, centroid in enumerate(kmeans.cluster_centers_, 1):
+        shared = [interest_names[c] for c in np.flatnonzero(centroid >= CENTROID_SHARE)]
+        name = (" / ".join(shared) if shared else
+                interest_names[int(centroid.argmax())] if centroid.any() else NO_INTEREST_TRACK)
+        names.append(f"{name} ({track})" if name in names else name)
+    return clusters[labels.reshape(-1)].astype(np.intp), names
+
+
+def allocate_teams(track_sizes, num_teams, team_size, track_leaders=None):
+    """Teams per track: a share of num_teams proportional to track size, as many as each track can fill
+
+    With track_leaders a track forms at most one team per potential leader.
+    """
+    track_sizes = np.asarray(track_sizes, dtype=np.float64)
+    total = track_sizes.sum()
+    if total == 0:
+        return [0] * len(track_sizes)
+    capacity = (track_sizes // team_size).astype(int)
+    if track_leaders is not None:
+        capacity = np.minimum(capacity, np.asarray(track_leaders, dtype=int))
+    share = num_teams * track_sizes / total
+    teams = np.minimum(share.astype(int), capacity)
+    # Largest remainders first, for the teams rounding left over
+    for track in np.argsort(-(share - share.astype(int)), kind='stable'):
+        if teams.sum() >= num_teams:
+            break
+        if teams[track] < capacity[track]:
+            teams[track] += 1
+    return teams.tolist()
+
+
+def reserve_leaders(members, allocation, leaders, num_teams, team_size):
+    """Take surplus leaders out of the tracks so every mixed team can get one
+
+    Mixed teams are formed from whoever the tracks leave over, which rarely
+    includes a leader, so leaders a track doesn't need for its own teams are
+    reserved for them, from the tracks with the largest surplus first. A
+    track that can no longer fill its teams gives one up to the mixed pool.
+    Returns the remaining members and allocation of each track, and the
+    reserved participants.
+    """
+    allocation = np.array(allocation, dtype=int)
+    sizes = np.array([len(m) for m in members])
+    track_leaders = [list(m[leaders[m]]) for m in members]
+    surplus = np.array([len(l) for l in track_leaders]) - allocation
+    needed = num_teams - int(allocation.sum())
+    reserved = []
+    while needed > 0 and len(surplus) and surplus.max() > 0:
+        track = int(surplus.argmax())
+        reserved.append(track_leaders[track].pop())
+        surplus[track] -= 1
+        sizes[track] -= 1
+        needed -= 1
+        if sizes[track] // team_size < allocation[track]:
+            allocation[track] -= 1
+            surplus[track] += 1
+            needed += 1
+
+    taken = np.asarray(reserved, dtype=np.intp)
+    members = [m[~np.isin(m, taken)] for m in members]
+    return members, allocation.tolist(), reserved
+
+
+def _solve_track(task):
+    """Seat and optimize the teams of one track; runs in a worker process"""
+    arrays, metadata, num_teams, weights, constraints, optimize, seed, max_iterations, deadline = task
+    features = ParticipantFeatures.from_arrays(arrays, metadata)
+    if num_teams == 0:
+        return [], list(range(features.n)), None
+    try:
+        teams, unseated = constraints.build(features, num_teams)
+    except ValueError as e:
+        # Everyone goes back to the rebalancing pool, together with this track's teams
+        logger.warning(f"Track could not be formed on its own: {e}")
+        return [], list(range(features.n)), None
+
+    optimizer = TeamOptimizer(features, weights, teams, constraints=constraints, seed=seed)
+    if optimize:
+        teams = optimizer.optimize(time_budget=deadline, max_iterations=max_iterations)
+        return teams, unseated, optimizer.stats
+    score = optimizer.total_score()
+    return teams, unseated, {'iterations': 0, 'accepted': 0, 'initial_score': score, 'best_score': score,
+                             'seconds': 0.0, 'timed_out': False}
+
+
+def solve_tracks(features, labels, track_names, num_teams, weights, constraints, optimize=True,
+                 time_budget=2.0, workers=1, seed=None):
+    """Form teams within each track in parallel, then rebalance the leftovers into mixed teams
+
+    Each track gets a share of the teams proportional to its size (with
+    require_leader, no more than its potential leaders; leaders it doesn't
+    need are reserved for the mixed teams) and is seated and optimized on
+    its own, with an iteration budget proportional
+    to its size, so the total work is linear in the number of participants.
+    Whoever a track can't seat, plus the members of tracks that can't be
+    formed on their own, make up a shared pool for the remaining teams.
+    Returns the teams as participant indices, the track name of each team,
+    the unseated participants and the combined search stats.
+    """
+    started = time.perf_counter()
+    n = features.n
+    team_size = constraints.max_size
+    workers = max(1, workers or 1)
+    order = np.argsort(labels, kind='stable')
+    bounds = np.searchsorted(labels[order], np.arange(len(track_names) + 1))
+    members = [order[bounds[k]:bounds[k + 1]] for k in range(len(track_names))]
+    reserved = []
+    if constraints.require_leader:
+        leaders = features.leaders[:n].astype(bool)
+        allocation = allocate_teams([len(m) for m in members], num_teams, team_size,
+                                    track_leaders=[int(leaders[m].sum()) for m in members])
+        members, allocation, reserved = reserve_leaders(members, allocation, leaders, num_teams, team_size)
+    else:
+        allocation = allocate_teams([len(m) for m in members], num_teams, team_size)
+    seeds = [int(child.generate_state(1, np.uint64)[0])
+             for child in np.random.SeedSequence(seed).spawn(len(track_names) + 1)]
+
+    def task(indices, track_teams, track_seed):
+        arrays, metadata = features.subset(indices).to_arrays()
+        share = workers * len(indices) / max(n, 1)
+        iterations = max(CHECK_INTERVAL, int(time_budget * share * NOMINAL_ITERATIONS_PER_SECOND))
+        deadline = max(MIN_TRACK_DEADLINE, time_budget * share * DEADLINE_SLACK)
+        return arrays, metadata, track_teams, weights, constraints, optimize, track_seed, iterations, deadline
+
+    tasks = [task(m, t, s) for m, t, s in zip(members, allocation, seeds)]
+    if workers == 1 or len(tasks) == 1:
+        results = [_solve_track(t) for t in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks)), mp_context=get_context('spawn')) as pool:
+            results = list(pool.map(_solve_track, tasks))
+
+    teams, names, leftovers, stats = [], [], list(reserved), []
+    for track, (track_teams, unseated, track_stats) in enumerate(results):
+        teams.extend(members[track][team].tolist() for team in track_teams)
+        names.extend([track_names[track]] * len(track_teams))
+        leftovers.extend(members[track][unseated].tolist())
+        if track_stats:
+            stats.append(track_stats)
+
+    unassigned = leftovers
+    if len(teams) < num_teams and leftovers:
+        leftovers = np.sort(np.asarray(leftovers, dtype=np.intp))
+        mixed_teams, unseated, mixed_stats = _solve_track(task(leftovers, num_teams - len(teams), seeds[-1]))
+        if len(mixed_teams) < num_teams - len(teams):
+            raise ValueError(f"Could not form {num_teams - len(teams)} mixed teams from "
+                             f"{len(leftovers)} participants left over by the tracks")
+        teams.extend(leftovers[team].tolist() for team in mixed_teams)
+        names.extend([MIXED_TRACK] * len(mixed_teams))
+        unassigned = leftovers[unseated].tolist()
+        stats.append(mixed_stats)
+
+    summary = {
+        'iterations': sum(s['iterations'] for s in stats),
+        'accepted': sum(s['accepted'] for s in stats),
+        'initial_score': sum(s['initial_score'] for s in stats),
+        'best_score': sum(s['best_score'] for s in stats),
+        'seconds': time.perf_counter() - started,
+        'tracks': len(track_names),
+    }
+    logger.info(f"Formed {len(teams)} teams in {len(track_names)} tracks ({names.count(MIXED_TRACK)} mixed) "
+                f"in {summary['seconds']:.2f}s")
+    return teams, names, unassigned, summary
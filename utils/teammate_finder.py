@@ -0,0 +1,202 @@
+import hashlib
+import json
+import logging
+import threading
+import numpy as np
+from scipy import sparse
+from utils.recommender import participant_key
+from utils.tag_vocabulary import canonical_terms
+from utils.team_features import TIMEZONE_OFFSETS
+
+logger = logging.getLogger(__name__)
+
+COMPLEMENT_FIELDS = ['programming_langs', 'frameworks']
+PROFILE_FIELDS = COMPLEMENT_FIELDS + ['interests', 'timezone', 'availability']
+
+# Weights of the teammate score components, which each range from 0 to 1
+COMPLEMENT_WEIGHT = 0.4
+INTEREST_WEIGHT = 0.3
+TIMEZONE_WEIGHT = 0.2
+AVAILABILITY_WEIGHT = 0.1
+MAX_TIMEZONE_GAP = 12.0
+UNKNOWN_TIMEZONE_CLOSENESS = 0.5
+
+
+def profile_digest(participant):
+    """Hash of the profile fields teammate matches depend on"""
+    profile = {field: participant.get(field) for field in PROFILE_FIELDS}
+    return hashlib.sha1(json.dumps(profile, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+class TeammateFinder:
+    """Top-k complementary teammates for any registered participant
+
+    Languages and frameworks form a binary sparse skill matrix and
+    interests an L2-normalized sparse interest matrix; timezone offsets and
+    availability are per-participant arrays. A query scores the participant
+    against everyone at once: one sparse product gives the skill overlap,
+    from which complement is the share of a pair's combined skills the
+    candidate adds, and another gives interest similarity. argpartition
+    then picks the top k. Results are cached per participant; a cached list
+    is dropped when its owner or anyone on it edits their profile, and new
+    or edited profiles are merged into the other cached lists.
+    """
+
+    def __init__(self, k=5):
+        self.k = k
+        self.revision = None
+        self._lock = threading.Lock()
+        self._clear()
+
+    def _clear(self):
+        self.skill_terms = {}
+        self.interest_terms = {}
+        self.availability_codes = {}
+
+        self.keys = []
+        self.rows = {}
+        self.digests = {}
+        self.records = []
+        self.skill_matrix = sparse.csr_matrix((0, 0), dtype=np.float32)
+        self.interest_matrix = sparse.csr_matrix((0, 0), dtype=np.float32)
+        self.skill_counts = np.zeros(0, dtype=np.float32)
+        self.timezone_offset = np.zeros(0, dtype=np.float32)
+        self.availability = np.zeros(0, dtype=np.int32)
+        self.cache = {}
+
+    def _encode(self, term_lists, vocabulary, normalize):
+        """CSR matrix with a 1 per term, rows optionally L2-normalized"""
+        indptr = [0]
+        indices = []
+        for terms in term_lists:
+            for term in terms:
+                indices.append(vocabulary.setdefault(term, len(vocabulary)))
+            indptr.append(len(indices))
+
+        values = np.ones(len(indices), dtype=np.float32)
+        if normalize:
+            lengths = np.diff(indptr)
+            values /= np.sqrt(np.repeat(np.maximum(lengths, 1), lengths)).astype(np.float32)
+        return sparse.csr_matrix((values, indices, indptr), shape=(len(term_lists), len(vocabulary)))
+
+    def _skills(self, participant):
+        terms = []
+        for field in COMPLEMENT_FIELDS:
+            terms.extend(canonical_terms(participant.get(field) or []))
+        return sorted(set(terms))
+
+    def _update_rows(self, matrix, rows, encoded, vocabulary):
+        """Replace or append rows of a sparse matrix, widened to the vocabulary"""
+        matrix = matrix.tocsr()
+        matrix.resize((matrix.shape[0], len(vocabulary)))
+        encoded = encoded.tocsr()
+        encoded.resize((encoded.shape[0], len(vocabulary)))
+        keep = np.ones(matrix.shape[0], dtype=bool)
+        keep[rows[rows < matrix.shape[0]]] = False
+        # Edited rows are zeroed and their new encoding added; new rows are appended
+        matrix = sparse.diags(keep.astype(np.float32)) @ matrix
+        matrix.resize((len(self.keys), len(vocabulary)))
+        placement = sparse.csr_matrix((np.ones(len(rows), dtype=np.float32), (rows, np.arange(len(rows)))),
+                                      shape=(len(self.keys), len(rows)))
+        return (matrix + placement @ encoded).tocsr()
+
+    def sync(self, participants, revision=None):
+        """Update the participant matrices, re-encoding only new or edited profiles"""
+        with self._lock:
+            if revision is not None and revision == self.revision:
+                return
+            self.revision = revision
+
+            keys = [participant_key(p) for p in participants]
+            if set(self.rows) - set(keys):
+                # Someone was removed: rebuild from scratch
+                self._clear()
+
+            changed = []
+            for key, participant in zip(keys, participants):
+                digest = profile_digest(participant)
+                if self.digests.get(key) != digest:
+                    changed.append((key, participant))
+                    self.digests[key] = digest
+            for key in keys:
+                if key not in self.rows:
+                    self.rows[key] = len(self.keys)
+                    self.keys.append(key)
+            self.records = [None] * len(self.keys)
+            for key, participant in zip(keys, participants):
+                self.records[self.rows[key]] = participant
+            if not changed:
+                return
+
+            rows = np.array([self.rows[key] for key, _ in changed], dtype=np.intp)
+            skills = self._encode([self._skills(p) for _, p in changed], self.skill_terms, normalize=False)
+            interests = self._encode([canonical_terms(p.get('interests') or []) for _, p in changed],
+                                     self.interest_terms, normalize=True)
+            self.skill_matrix = self._update_rows(self.skill_matrix, rows, skills, self.skill_terms)
+            self.interest_matrix = self._update_rows(self.interest_matrix, rows, interests, self.interest_terms)
+
+            padding = len(self.keys) - len(self.skill_counts)
+            self.skill_counts = np.concatenate([self.skill_counts, np.zeros(padding, dtype=np.float32)])
+            self.timezone_offset = np.concatenate([self.timezone_offset, np.full(padding, np.nan, dtype=np.float32)])
+            self.availability = np.concatenate([self.availability, np.zeros(padding, dtype=np.int32)])
+            self.skill_counts[rows] = np.diff(skills.indptr)
+            self.timezone_offset[rows] = [TIMEZONE_OFFSETS.get(p.get('timezone'), np.nan) for _, p in changed]
+            self.availability[rows] = [self.availability_codes.setdefault(p.get('availability'),
+                                                                          len(self.availability_codes))
+                                       for _, p in changed]
+            self._invalidate(rows)
+            logger.info(f"Teammate finder updated for {len(changed)} participants")
+
+    def _invalidate(self, rows):
+        """Drop cached lists that the changed rows affect and merge the rows into the others"""
+        changed = set(rows.tolist())
+        for owner in list(self.cache):
+            top_rows, top_scores = self.cache[owner]
+            if owner in changed or changed.intersection(top_rows.tolist()):
+                del self.cache[owner]
+                continue
+            candidates = rows[rows != owner]
+            scores = self._scores(owner, candidates)
+            self.cache[owner] = self._top(np.concatenate([top_rows, candidates]),
+                                          np.concatenate([top_scores, scores]), max(len(top_rows), self.k))
+
+    def _scores(self, row, candidates=None):
+        """Teammate scores of one participant against candidate rows (everyone by default)"""
+        skills = self.skill_matrix if candidates is None else self.skill_matrix[candidates]
+        interests = self.interest_matrix if candidates is None else self.interest_matrix[candidates]
+        counts = self.skill_counts if candidates is None else self.skill_counts[candidates]
+        offsets = self.timezone_offset if candidates is None else self.timezone_offset[candidates]
+        availability = self.availability if candidates is None else self.availability[candidates]
+
+        overlap = np.asarray(skills @ self.skill_matrix[row].T.toarray()).ravel()
+        union = counts + self.skill_counts[row] - overlap
+        complement = np.divide(counts - overlap, union, out=np.zeros_like(union), where=union > 0)
+        interest = np.asarray(interests @ self.interest_matrix[row].T.toarray()).ravel()
+        gap = np.abs(offsets - self.timezone_offset[row])
+        closeness = np.where(np.isnan(gap), UNKNOWN_TIMEZONE_CLOSENESS,
+                             np.clip(1.0 - gap / MAX_TIMEZONE_GAP, 0.0, 1.0))
+
+        return (COMPLEMENT_WEIGHT * complement + INTEREST_WEIGHT * interest + TIMEZONE_WEIGHT * closeness +
+                AVAILABILITY_WEIGHT * (availability == self.availability[row])).astype(np.float32)
+
+    def _top(self, rows, scores, k):
+        k = min(k, len(rows))
+        if k == 0:
+            return rows[:0], scores[:0]
+        best = np.argpartition(-scores, k - 1)[:k]
+        order = best[np.argsort(-scores[best], kind='stable')]
+        return rows[order], scores[order]
+
+    def find(self, participant, k=None):
+        """Best teammates for a participant as (record, score) pairs, best first"""
+        k = k or self.k
+        with self._lock:
+            row = self.rows.get(participant_key(participant))
+            if row is None:
+                return []
+            cached = self.cache.get(row)
+            if cached is None or len(cached[0]) < min(k, len(self.keys) - 1):
+                others = np.delete(np.arange(len(self.keys)), row)
+                cached = self._top(others, np.delete(self._scores(row), row), max(k, self.k))
+                self.cache[row] = cached
+            return [(self.records[r], float(score)) for r, score in zip(*(part[:k] for part in cached))]